@@ -0,0 +1,60 @@
+"""
+매물 지도 생성 성능 측정 스크립트
+서울 전체 매물 규모의 임의 좌표로 map_render 지도를 만들어 소요 시간과 HTML 크기를 출력하고,
+Folium.ipynb처럼 매물마다 folium.Marker를 추가했을 때의 크기를 일부 매물로 측정하여 추정합니다.
+
+사용법:
+    python benchmarks/bench_map_render.py [--listings 100000] [--marker-sample 2000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from map_render import render_map  # noqa: E402
+from bench_spatial_index import make_listings  # noqa: E402
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='매물 지도 생성 벤치마크')
+    arg_parser.add_argument('--listings', type=int, default=100_000, help='매물 수')
+    arg_parser.add_argument('--marker-sample', type=int, default=2_000, help='마커 방식 크기 추정에 쓸 매물 수')
+    args = arg_parser.parse_args()
+
+    import folium
+
+    rng = np.random.default_rng(0)
+    lats, lons = make_listings(args.listings, rng)
+    df = pd.DataFrame({'위도': lats, '경도': lons, '가격(원)': rng.integers(1, 300, args.listings) * 10_000_000})
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'map.html')
+        start = time.perf_counter()
+        render_map(df, path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+        print(f"육각형 집계 + 클러스터: 매물 {args.listings:,}개 / {elapsed:.1f}초 / {size / 1024 / 1024:.1f}MB")
+
+        # 매물마다 Marker를 추가하는 방식 (일부만 만들어 매물당 크기로 추정)
+        sample = min(args.marker_sample, args.listings)
+        m = folium.Map(location=[lats.mean(), lons.mean()], zoom_start=11)
+        for lat, lon in zip(lats[:sample], lons[:sample]):
+            folium.Marker(location=(lat, lon)).add_to(m)
+        marker_path = os.path.join(directory, 'markers.html')
+        start = time.perf_counter()
+        m.save(marker_path)
+        marker_elapsed = (time.perf_counter() - start) * args.listings / sample
+        marker_size = os.path.getsize(marker_path) * args.listings / sample
+        print(f"매물마다 Marker (추정): {marker_elapsed:.1f}초 이상 / {marker_size / 1024 / 1024:.0f}MB "
+              f"({marker_size / size:.0f}배)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+가격 문자열 변환 성능 측정 스크립트
+fixtures/price_corpus.json의 기대값으로 변환 결과를 먼저 확인한 뒤,
+매물 목록처럼 같은 가격이 반복되는 가격 문자열 열을 행 단위 변환과 열 단위 변환으로 처리하여 초당 처리 값 수를 출력합니다.
+
+사용법:
+    python benchmarks/bench_price_parser.py [--rows 2000000] [--distinct 50000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from price_parser import parse_price, parse_prices  # noqa: E402
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'price_corpus.json')
+
+
+def check_corpus():
+    """말뭉치의 모든 문자열이 기대값으로 변환되는지 확인"""
+    with open(CORPUS_PATH, encoding='utf-8') as f:
+        corpus = json.load(f)
+    prices, rents = parse_prices([case['text'] for case in corpus])
+    for case, price, rent in zip(corpus, prices, rents):
+        actual = (None if pd.isna(price) else int(price), None if pd.isna(rent) else int(rent))
+        if actual != (case['price'], case['rent']) or parse_price(case['text']) != actual:
+            raise SystemExit(f"변환 결과가 다릅니다: {case['text']!r} -> {actual}, 기대값 {case['price'], case['rent']}")
+    return len(corpus)
+
+
+def make_price_texts(distinct):
+    """매매/전세/월세 표시 형식의 서로 다른 가격 문자열 distinct개"""
+    texts = set()
+    while len(texts) < distinct:
+        eok = random.randrange(0, 60)
+        man = random.randrange(0, 10000, 100 if eok else 50)
+        text = f"{eok}억 {man:,}" if eok and man else f"{eok}억" if eok else f"{max(man, 100):,}"
+        if random.random() < 0.3:
+            text += f"/{random.randrange(30, 500, 5)}"
+        texts.add(text)
+    texts = list(texts)
+    # 가끔 섞여 있는 변환할 수 없는 값
+    texts[:3] = ['', '-', '협의']
+    return texts
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='가격 문자열 변환 벤치마크')
+    arg_parser.add_argument('--rows', type=int, default=2_000_000, help='변환할 값 수')
+    arg_parser.add_argument('--distinct', type=int, default=50_000, help='서로 다른 가격 문자열 수')
+    args = arg_parser.parse_args()
+
+    print(f"말뭉치 {check_corpus()}개 값 확인 완료")
+
+    random.seed(0)
+    texts = make_price_texts(args.distinct)
+    values = random.choices(texts, k=args.rows)
+
+    elapsed = timed(lambda: [parse_price(text) for text in values])
+    print(f"행 단위 변환 (parse_price): {args.rows:,}개 / {elapsed:.2f}초 = {args.rows / elapsed:,.0f} values/s")
+
+    elapsed = timed(lambda: parse_prices(values))
+    print(f"열 단위 변환 (parse_prices): {args.rows:,}개 / {elapsed:.2f}초 = {args.rows / elapsed:,.0f} values/s "
+          f"(고유값 {args.distinct:,}개)")
+
+    # 최악의 경우: 모든 값이 서로 다름
+    unique_values = make_price_texts(min(args.rows, 500_000))
+    elapsed = timed(lambda: parse_prices(unique_values))
+    print(f"열 단위 변환, 모두 다른 값: {len(unique_values):,}개 / {elapsed:.2f}초 = "
+          f"{len(unique_values) / elapsed:,.0f} values/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+매물 공간 색인 성능 측정 스크립트
+서울 전체 매물 규모의 임의 좌표(단지 주변에 모인 분포)로 색인을 만들고,
+사각형/반경/다각형 조회 시간을 전체 배열을 훑는 방식과 비교하여 출력합니다.
+
+사용법:
+    python benchmarks/bench_spatial_index.py [--listings 500000] [--repeat 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spatial_index import ListingIndex, haversine, points_in_polygon  # noqa: E402
+
+# 서울 영역 (위도, 경도)
+SEOUL_BOUNDS = (37.43, 126.76, 37.70, 127.18)
+
+# Folium.ipynb의 강남 사각형 (남, 서, 북, 동)
+GANGNAM_BOX = (37.4719498, 127.0380378, 37.4735804, 127.042544)
+
+
+def make_listings(count, rng):
+    """단지마다 매물이 모여 있는 서울 영역의 임의 좌표"""
+    south, west, north, east = SEOUL_BOUNDS
+    complexes = max(1, count // 100)
+    centers_lat = rng.uniform(south, north, complexes)
+    centers_lon = rng.uniform(west, east, complexes)
+    owner = rng.integers(0, complexes, count)
+    return (centers_lat[owner] + rng.normal(0, 0.0005, count),
+            centers_lon[owner] + rng.normal(0, 0.0005, count))
+
+
+def timed(func, repeat):
+    """func를 repeat번 실행한 평균 시간(ms)과 마지막 결과 반환"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='매물 공간 색인 벤치마크')
+    arg_parser.add_argument('--listings', type=int, default=500_000, help='매물 수')
+    arg_parser.add_argument('--repeat', type=int, default=200, help='조회 반복 횟수')
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    lats, lons = make_listings(args.listings, rng)
+
+    start = time.perf_counter()
+    index = ListingIndex(lats, lons)
+    print(f"색인 생성: 매물 {len(index):,}개 / {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    south, west, north, east = GANGNAM_BOX
+    # 강남역 주변 약 1km 사각형과 오각형
+    box = (37.493, 127.022, 37.503, 127.034)
+    pentagon = [(37.505, 127.028), (37.500, 127.040), (37.490, 127.036), (37.490, 127.020), (37.500, 127.016)]
+    queries = {
+        'Folium 사각형': (
+            lambda: index.bbox(south, west, north, east),
+            lambda: np.flatnonzero((lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)),
+        ),
+        '1km 사각형': (
+            lambda: index.bbox(*box),
+            lambda: np.flatnonzero((lats >= box[0]) & (lats <= box[2]) & (lons >= box[1]) & (lons <= box[3])),
+        ),
+        '반경 500m': (
+            lambda: index.radius(37.498, 127.028, 500),
+            lambda: np.flatnonzero(haversine(37.498, 127.028, lats, lons) <= 500),
+        ),
+        '오각형': (
+            lambda: index.polygon(pentagon),
+            lambda: np.flatnonzero(points_in_polygon(lats, lons, np.array(pentagon))),
+        ),
+    }
+    for name, (indexed, scan) in queries.items():
+        indexed_ms, result = timed(indexed, args.repeat)
+        scan_ms, expected = timed(scan, max(1, args.repeat // 20))
+        if not np.array_equal(result, expected):
+            raise SystemExit(f"{name}: 색인 조회 결과가 전체 검색 결과와 다릅니다.")
+        print(f"{name}: {len(result):,}개 | 색인 {indexed_ms:.3f}ms | 전체 검색 {scan_ms:.1f}ms "
+              f"({scan_ms / indexed_ms:,.0f}배)")
+
+
+if __name__ == '__main__':
+    main()
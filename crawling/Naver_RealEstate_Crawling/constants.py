@@ -0,0 +1,84 @@
+"""
+상수 정의 모듈
+네이버 부동산 매물 수집기에서 사용하는 기본 설정값을 정의합니다.
+"""
+
+import os
+
+# 네이버 부동산 API
+API_HOST = 'new.land.naver.com'
+ARTICLE_URL = 'https://new.land.naver.com/api/articles/complex/{complex_no}'   # 단지별 매물 목록
+REGION_LIST_URL = 'https://new.land.naver.com/api/regions/list'                # 하위 지역 목록
+REGION_COMPLEX_URL = 'https://new.land.naver.com/api/regions/complexes'        # 지역(동)의 단지 목록
+
+# 개발자 도구에서 복사한 authorization 토큰 (Bearer 다음 부분)을 환경 변수로 전달
+TOKEN_ENV = 'NAVER_LAND_TOKEN'
+
+# 요청 헤더 (authorization은 NaverLandClient에서 추가)
+HEADERS = {
+    'accept': '*/*',
+    'accept-language': 'ko-KR,ko;q=0.9',
+    'referer': 'https://new.land.naver.com/complexes',
+    'sec-fetch-dest': 'empty',
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-site': 'same-origin',
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36',
+}
+
+# 매물 종류 (realEstateType)
+REAL_ESTATE_TYPES = {
+    'APT': '아파트',
+    'ABYG': '아파트분양권',
+    'JGC': '재건축',
+    'PRE': '분양권',
+    'OPST': '오피스텔',
+    'OBYG': '오피스텔분양권',
+}
+DEFAULT_REAL_ESTATE_TYPES = ('APT', 'ABYG', 'JGC', 'PRE')
+
+# 거래 방식 (tradeType, 비워 두면 전체)
+TRADE_TYPES = {
+    'A1': '매매',
+    'B1': '전세',
+    'B2': '월세',
+    'B3': '단기임대',
+}
+
+# 가격/면적 조건의 기본 범위 (네이버 부동산 화면의 '전체'와 같은 값)
+PRICE_UNLIMITED = 900000000
+AREA_UNLIMITED = 900000000
+
+# 요청 설정
+DEFAULT_MAX_WORKERS = 8       # 동시에 수집할 단지 수
+DEFAULT_RATE = 5.0            # 호스트별 초당 허용 요청 수
+DEFAULT_BURST = 5             # 한 번에 몰아서 보낼 수 있는 요청 수
+REQUEST_TIMEOUT = 10
+MAX_PAGES = 100               # 단지 하나에서 확인할 최대 페이지 수 (isMoreData가 계속 true일 때의 안전장치)
+
+# 서울특별시 지역 코드 (cortarNo)
+SEOUL_CORTAR_NO = '1100000000'
+
+# 매물 좌표 공간 색인의 격자 칸 크기 (도, 약 200m)
+DEFAULT_CELL_SIZE = 0.002
+
+# 매물 지도 설정
+MAP_CENTER = (37.5665, 126.9780)    # 서울시청 (육각형 격자의 기준점)
+HEX_LAYERS = ((2000, 0, 12), (500, 13, 14))   # (육각형 크기(m), 최소 확대, 최대 확대), 큰 칸부터
+CLUSTER_MIN_ZOOM = 15               # 이 확대 수준부터 개별 매물을 클러스터 마커로 표시
+MAX_ZOOM = 19
+COORD_DECIMALS = 5                  # 지도 파일에 기록하는 좌표 소수점 자리 (약 1m)
+MAP_COLORS = ('#ffffb2', '#fed976', '#feb24c', '#fd8d3c', '#fc4e2a', '#e31a1c', '#b10026')   # 단계구분도 색 (낮음 → 높음)
+
+# 저장소 파일을 두는 디렉토리
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'naver_real_estate')
+
+# 매물 동기화 저장소 경로 (소스 디렉토리가 아닌 사용자 캐시 디렉토리)
+DEFAULT_LISTING_DB_PATH = os.path.join(CACHE_DIR, 'naver_listings.db')
+
+# 매물 데이터 저장 경로
+DEFAULT_OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'naver_property_data.xlsx')
+
+# 표/파일에 사용하는 열 이름 (단지번호 + 매물 항목, 가격/월세는 화면 표시용 문자열)
+COLUMNS = ['단지번호', '매물번호', '건물명', '거래유형', '층수정보', '가격', '월세', '가격변동', '면적(㎡)',
+           '전용면적(㎡)', '방향', '등록일', '특징', '태그', '건물동',
+           '중개사무소', '위도', '경도', '협회']
@@ -0,0 +1,383 @@
+"""
+네이버 부동산 매물 수집 모듈
+step.ipynb에서 단지 번호를 주소에 직접 써 넣고 페이지마다 requests.get을 호출하던 코드를 모듈로 옮겼습니다.
+- 커넥션 풀을 가진 세션 하나를 모든 요청이 함께 사용
+- 검색 조건은 ArticleQuery로 전달 (매물 종류, 거래 방식, 가격/면적 범위)
+- 여러 단지를 동시에 수집하고, 모든 요청은 호스트별 속도 제한기를 거쳐 초당 요청 수가 제한됨
+- 단지마다 응답의 isMoreData가 false이면 다음 페이지를 요청하지 않음
+
+사용법:
+    python land_client.py 16378 100754 --trade-type A1 -o naver_property_data.xlsx
+    python land_client.py --region 1100000000 --trade-type A1   (서울 전체 단지)
+    python land_client.py --region 1100000000 --sync            (바뀐 매물만 동기화 저장소에 반영)
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import (ARTICLE_URL, REGION_LIST_URL, REGION_COMPLEX_URL, TOKEN_ENV, HEADERS,
+                       REAL_ESTATE_TYPES, DEFAULT_REAL_ESTATE_TYPES, TRADE_TYPES, PRICE_UNLIMITED,
+                       AREA_UNLIMITED, DEFAULT_MAX_WORKERS, DEFAULT_RATE, DEFAULT_BURST, REQUEST_TIMEOUT,
+                       MAX_PAGES, DEFAULT_OUTPUT_PATH, DEFAULT_LISTING_DB_PATH, COLUMNS)
+
+
+class ArticleQuery(NamedTuple):
+    """
+    매물 검색 조건
+    가격은 만원 단위, 면적은 ㎡ 단위이며 기본값은 네이버 부동산 화면의 '전체'와 같다.
+    """
+    real_estate_types: Tuple[str, ...] = DEFAULT_REAL_ESTATE_TYPES
+    trade_types: Tuple[str, ...] = ()           # 비워 두면 모든 거래 방식
+    price_min: int = 0                          # 매매가/보증금 최소
+    price_max: int = PRICE_UNLIMITED
+    rent_price_min: int = 0                     # 월세 최소
+    rent_price_max: int = PRICE_UNLIMITED
+    area_min: int = 0
+    area_max: int = AREA_UNLIMITED
+    same_address_group: bool = True             # 동일매물 묶기
+    order: str = 'rank'
+
+    def validate(self):
+        """알 수 없는 매물 종류/거래 방식이나 잘못된 범위이면 ValueError"""
+        unknown = [code for code in self.real_estate_types if code not in REAL_ESTATE_TYPES]
+        unknown += [code for code in self.trade_types if code not in TRADE_TYPES]
+        if unknown:
+            raise ValueError(f"지원하지 않는 매물 종류/거래 방식입니다: {', '.join(unknown)}")
+        for name in ('price', 'rent_price', 'area'):
+            if getattr(self, f'{name}_min') > getattr(self, f'{name}_max'):
+                raise ValueError(f"{name}_min이 {name}_max보다 큽니다.")
+        return self
+
+    def to_params(self, complex_no, page=1):
+        """단지 매물 목록 API의 쿼리 파라미터"""
+        return {
+            'realEstateType': ':'.join(self.real_estate_types),
+            'tradeType': ':'.join(self.trade_types),
+            'tag': '::::::::',
+            'rentPriceMin': self.rent_price_min,
+            'rentPriceMax': self.rent_price_max,
+            'priceMin': self.price_min,
+            'priceMax': self.price_max,
+            'areaMin': self.area_min,
+            'areaMax': self.area_max,
+            'showArticle': 'false',
+            'sameAddressGroup': str(self.same_address_group).lower(),
+            'priceType': 'RETAIL',
+            'page': page,
+            'complexNo': complex_no,
+            'type': 'list',
+            'order': self.order,
+        }
+
+
+class ComplexResult(NamedTuple):
+    """단지 하나의 수집 결과"""
+    complex_no: str
+    articles: List[dict]         # parse_article로 변환한 매물 목록
+    pages: int                   # 요청한 페이지 수
+    elapsed: float               # 소요 시간 (초)
+    error: Optional[str] = None  # 실패한 경우 오류 메시지 (그 전까지 수집한 매물은 articles에 남음)
+    truncated: bool = False      # 다음 페이지가 남았는데 최대 페이지 수에서 멈췄는지 여부
+
+    @property
+    def complete(self):
+        """단지의 매물을 오류 없이 마지막 페이지까지 수집했는지 여부"""
+        return not self.error and not self.truncated
+
+
+def parse_article(article, complex_no=None):
+    """API 응답의 매물 하나를 표/파일에 쓰는 열 이름의 딕셔너리로 변환"""
+    return {
+        '단지번호': complex_no,
+        '매물번호': article.get('articleNo'),
+        '건물명': article.get('articleName'),
+        '거래유형': article.get('tradeTypeName'),
+        '층수정보': article.get('floorInfo'),
+        '가격': article.get('dealOrWarrantPrc'),
+        '월세': article.get('rentPrc'),
+        '가격변동': article.get('priceChangeState'),
+        '면적(㎡)': article.get('area1'),
+        '전용면적(㎡)': article.get('area2'),
+        '방향': article.get('direction'),
+        '등록일': article.get('articleConfirmYmd'),
+        '특징': article.get('articleFeatureDesc'),
+        '태그': ', '.join(article.get('tagList') or []),
+        '건물동': article.get('buildingName'),
+        '중개사무소': article.get('realtorName'),
+        '위도': article.get('latitude'),
+        '경도': article.get('longitude'),
+        '협회': article.get('cpName'),
+    }
+
+
+class HostRateLimiter:
+    """
+    호스트별 요청 속도 제한기
+    호스트마다 초당 rate개씩 채워지고 최대 burst개까지 쌓이는 요청 가능 횟수를 두므로,
+    같은 호스트의 요청은 모든 스레드를 합쳐 제한되고 다른 호스트의 요청은 서로 기다리지 않는다.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self._allowance = {}     # 호스트: (남은 요청 가능 횟수, 마지막 계산 시각)
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        """url의 호스트에 요청할 수 있을 때까지 대기"""
+        host = urlsplit(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                allowance, updated = self._allowance.get(host, (self.burst, now))
+                allowance = min(self.burst, allowance + (now - updated) * self.rate)
+                if allowance >= 1:
+                    self._allowance[host] = (allowance - 1, now)
+                    return
+                self._allowance[host] = (allowance, now)
+                wait = (1 - allowance) / self.rate
+            time.sleep(wait)
+
+
+def create_session(max_workers=DEFAULT_MAX_WORKERS, token=None, cookies=None):
+    """
+    재시도 설정과 동시 요청 수에 맞는 커넥션 풀을 가진 세션 생성
+
+    Args:
+        token: authorization 헤더의 Bearer 토큰 (생략하면 환경 변수 NAVER_LAND_TOKEN)
+        cookies: 브라우저에서 복사한 쿠키 딕셔너리
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    token = token or os.environ.get(TOKEN_ENV)
+    if token:
+        session.headers['authorization'] = token if token.startswith('Bearer ') else f'Bearer {token}'
+    if cookies:
+        session.cookies.update(cookies)
+    retries = Retry(total=5, backoff_factor=1, status_forcelist=[429, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retries)
+    session.mount('https://', adapter)
+    return session
+
+
+class NaverLandClient:
+    """
+    네이버 부동산 단지 매물 수집기
+    단지 하나의 페이지는 isMoreData를 보고 순서대로 요청하고, 여러 단지는 스레드 풀에서 동시에 수집한다.
+    """
+
+    def __init__(self, token=None, cookies=None, session=None, max_workers=DEFAULT_MAX_WORKERS,
+                 rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.max_workers = max(1, int(max_workers))
+        self.session = session or create_session(self.max_workers, token, cookies)
+        self.limiter = HostRateLimiter(rate, burst)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """아직 보내지 않은 요청 취소 (이미 진행 중인 요청은 끝까지 진행)"""
+        self._cancelled.set()
+
+    def get_json(self, url, params=None):
+        """속도 제한을 거쳐 GET 요청 후 JSON 응답 반환"""
+        self.limiter.acquire(url)
+        if self._cancelled.is_set():
+            raise RuntimeError("수집이 취소되었습니다.")
+        response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_page(self, complex_no, query=ArticleQuery(), page=1):
+        """
+        단지 매물 목록 한 페이지
+
+        Returns:
+            tuple: (API 응답의 매물 목록, 다음 페이지가 있는지 여부)
+        """
+        data = self.get_json(ARTICLE_URL.format(complex_no=complex_no), query.to_params(complex_no, page))
+        return data.get('articleList') or [], bool(data.get('isMoreData'))
+
+    def fetch_complex(self, complex_no, query=ArticleQuery(), max_pages=MAX_PAGES):
+        """
+        단지 하나의 매물을 isMoreData가 false가 될 때까지 수집
+
+        max_pages에서 멈췄는데 다음 페이지가 남아 있으면 truncated=True로 표시한다.
+        """
+        complex_no = str(complex_no)
+        start_time = time.time()
+        articles = []
+        page = 0
+        is_more = False
+        try:
+            for page in range(1, max_pages + 1):
+                page_articles, is_more = self.fetch_page(complex_no, query, page)
+                articles.extend(parse_article(article, complex_no) for article in page_articles)
+                if not is_more or not page_articles:
+                    is_more = False
+                    break
+        except Exception as e:
+            return ComplexResult(complex_no, articles, page, time.time() - start_time, str(e))
+        return ComplexResult(complex_no, articles, page, time.time() - start_time, truncated=is_more)
+
+    def fetch_complexes(self, complex_nos, query=ArticleQuery(), max_pages=MAX_PAGES, on_result=None):
+        """
+        여러 단지를 동시에 수집
+
+        Args:
+            complex_nos: 단지 번호 목록
+            query: 검색 조건 (모든 단지에 같은 조건 사용)
+            max_pages: 단지당 최대 페이지 수
+            on_result: 단지 하나가 끝날 때마다 ComplexResult를 받을 콜백 (fetch_complexes를 호출한 스레드에서 호출)
+
+        Returns:
+            list: 입력 순서대로 정렬된 ComplexResult 목록
+        """
+        query.validate()
+        complex_nos = list(dict.fromkeys(str(complex_no) for complex_no in complex_nos))
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.fetch_complex, complex_no, query, max_pages)
+                       for complex_no in complex_nos]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.complex_no] = result
+                if on_result:
+                    on_result(result)
+        return [results[complex_no] for complex_no in complex_nos]
+
+    def region_children(self, cortar_no):
+        """하위 지역 목록 (예: 시 → 구, 구 → 동) [{'cortarNo', 'cortarName', ...}]"""
+        return self.get_json(REGION_LIST_URL, {'cortarNo': cortar_no}).get('regionList') or []
+
+    def region_complexes(self, cortar_no, query=ArticleQuery()):
+        """동 하나의 단지 목록 [{'complexNo', 'complexName', ...}]"""
+        params = {'cortarNo': cortar_no, 'realEstateType': ':'.join(query.real_estate_types), 'order': ''}
+        return self.get_json(REGION_COMPLEX_URL, params).get('complexList') or []
+
+    def find_complexes(self, cortar_no, query=ArticleQuery()):
+        """지역 아래의 모든 단지 번호 (시/구 코드를 주면 동 단위까지 내려가 동별 단지 목록을 동시에 조회)"""
+        dongs = self._leaf_regions(cortar_no)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            complex_lists = executor.map(lambda code: self.region_complexes(code, query), dongs)
+            return list(dict.fromkeys(
+                str(complex_info['complexNo']) for complexes in complex_lists for complex_info in complexes
+            ))
+
+    def _leaf_regions(self, cortar_no):
+        """하위 지역이 없는 지역(동) 코드 목록 (시 → 구 → 동의 두 단계까지 확인)"""
+        children = self.region_children(cortar_no)
+        if not children:
+            return [cortar_no]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            grandchildren = list(executor.map(lambda child: self.region_children(child['cortarNo']), children))
+        leaves = []
+        for child, child_regions in zip(children, grandchildren):
+            if child_regions:
+                leaves.extend(region['cortarNo'] for region in child_regions)
+            else:
+                leaves.append(child['cortarNo'])
+        return leaves
+
+    def close(self):
+        self.session.close()
+
+
+def articles_to_frame(results):
+    """
+    ComplexResult 목록을 열 이름이 COLUMNS인 데이터프레임으로 변환
+
+    화면 표시용 가격 문자열은 그대로 두고 원 단위 정수 열('가격(원)', '월세(원)')을 추가한다.
+    """
+    import pandas as pd
+    from price_parser import add_price_columns
+
+    df = pd.DataFrame([article for result in results for article in result.articles], columns=COLUMNS)
+    return add_price_columns(df)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='네이버 부동산 단지 매물 수집')
+    arg_parser.add_argument('complex_nos', nargs='*', help='단지 번호')
+    arg_parser.add_argument('--region', help='이 지역(cortarNo) 아래의 모든 단지 수집 (예: 서울 1100000000)')
+    arg_parser.add_argument('--real-estate-type', action='append', choices=list(REAL_ESTATE_TYPES),
+                            help='매물 종류 (여러 번 지정 가능, 기본값: APT ABYG JGC PRE)')
+    arg_parser.add_argument('--trade-type', action='append', choices=list(TRADE_TYPES),
+                            help='거래 방식 (여러 번 지정 가능, 기본값: 전체)')
+    arg_parser.add_argument('--price-min', type=int, default=0, help='최소 가격 (만원)')
+    arg_parser.add_argument('--price-max', type=int, default=PRICE_UNLIMITED, help='최대 가격 (만원)')
+    arg_parser.add_argument('--area-min', type=int, default=0, help='최소 면적 (㎡)')
+    arg_parser.add_argument('--area-max', type=int, default=AREA_UNLIMITED, help='최대 면적 (㎡)')
+    arg_parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS, help='동시에 수집할 단지 수')
+    arg_parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='초당 허용 요청 수')
+    arg_parser.add_argument('--token', help=f'authorization 토큰 (생략하면 환경 변수 {TOKEN_ENV})')
+    arg_parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_PATH, help='저장할 엑셀 파일 경로')
+    arg_parser.add_argument('--sync', nargs='?', const=DEFAULT_LISTING_DB_PATH, metavar='DB',
+                            help='수집 결과를 매물 동기화 저장소에 반영 (검색 조건이 바뀐 단지는 내려간 매물을 판단하지 않음)')
+    args = arg_parser.parse_args(argv)
+
+    if not args.complex_nos and not args.region:
+        arg_parser.error('단지 번호나 --region을 지정하세요.')
+    query = ArticleQuery(
+        real_estate_types=tuple(args.real_estate_type or DEFAULT_REAL_ESTATE_TYPES),
+        trade_types=tuple(args.trade_type or ()),
+        price_min=args.price_min, price_max=args.price_max,
+        area_min=args.area_min, area_max=args.area_max,
+    ).validate()
+
+    client = NaverLandClient(token=args.token, max_workers=args.workers, rate=args.rate)
+    store = None
+    if args.sync:
+        from listing_store import ListingStore, SyncSummary
+        store = ListingStore(args.sync)
+        summary = SyncSummary()
+    start_time = time.time()
+    try:
+        complex_nos = list(args.complex_nos)
+        if args.region:
+            complex_nos += client.find_complexes(args.region, query)
+            print(f"단지 {len(complex_nos)}개를 찾았습니다.")
+
+        finished = 0
+
+        def report(result):
+            nonlocal finished, summary
+            finished += 1
+            # 단지가 끝날 때마다 바뀐 매물만 동기화 저장소에 반영
+            if store:
+                summary += store.sync_result(result, query)
+            status = f"오류: {result.error}" if result.error else f"매물 {len(result.articles)}개"
+            if result.truncated:
+                status += " (최대 페이지 수에서 멈춤)"
+            print(f"[{finished}/{len(complex_nos)}] 단지 {result.complex_no}: {status} ({result.pages}페이지)")
+
+        results = client.fetch_complexes(complex_nos, query, on_result=report)
+    finally:
+        client.close()
+        if store:
+            store.close()
+
+    df = articles_to_frame(results)
+    df.to_excel(args.output, index=False)
+    failed = [result.complex_no for result in results if result.error]
+    print(f"\n매물 {len(df)}개를 저장했습니다: {args.output} | 소요 시간: {time.time() - start_time:.1f}초")
+    if store:
+        print(f"동기화: 신규 {summary.inserted}개, 변경 {summary.updated}개, 내려감 {summary.delisted}개, "
+              f"다시 올라옴 {summary.relisted}개, 조건 밖 {summary.untracked}개, 그대로 {summary.unchanged}개")
+    if failed:
+        print(f"수집에 실패한 단지: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+매물 동기화 저장 모듈
+매물번호(articleNo)별 최신 상태를 SQLite에 보관하고, 새로 수집한 단지 매물과 비교하여
+바뀐 매물만 반영합니다. 변경 내역(신규/변경/내려감/다시 올라옴/추적 중단)은 순번이 붙은 변경 기록에 남으므로
+다른 프로그램은 마지막으로 읽은 순번 이후의 변경만 읽어 갈 수 있습니다.
+- 비교 기준: 등록일(articleConfirmYmd), 가격 변동 상태(priceChangeState), 가격, 월세
+- 바뀌지 않은 매물은 읽기만 하고 쓰지 않음
+- 내려간 매물은 단지 전체를 지난번과 같은 검색 조건으로 끝까지 수집했을 때만 판단
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import NamedTuple
+
+from constants import DEFAULT_LISTING_DB_PATH
+from price_parser import parse_price
+
+# 변경 종류
+CHANGE_INSERT = 'insert'     # 처음 본 매물
+CHANGE_UPDATE = 'update'     # 등록일/가격/가격 변동 상태가 바뀐 매물
+CHANGE_DELIST = 'delist'     # 이전 수집에는 있었지만 이번 수집에 없는 매물
+CHANGE_RELIST = 'relist'     # 내려갔다가 다시 올라온 매물
+CHANGE_UNTRACK = 'untrack'   # 검색 조건이 바뀌어 새 조건 밖이 된 매물 (listings에서 삭제)
+
+# 변경 여부를 판단하는 매물 항목
+TRACKED_FIELDS = ('등록일', '가격변동', '가격', '월세')
+
+CHANGE_COLUMNS = ['seq', 'changed_at', 'change', 'article_no', 'complex_no', 'confirm_ymd', 'price_change_state',
+                  'price', 'rent', 'previous_price', 'previous_rent', 'data']
+LISTING_COLUMNS = ['article_no', 'complex_no', 'confirm_ymd', 'price_change_state', 'price', 'rent',
+                   'first_seen', 'updated_at', 'delisted_at', 'data']
+
+
+class SyncSummary(NamedTuple):
+    """동기화 결과 (변경 종류별 매물 수)"""
+    inserted: int = 0
+    updated: int = 0
+    delisted: int = 0
+    relisted: int = 0
+    untracked: int = 0
+    unchanged: int = 0
+
+    def __add__(self, other):
+        return SyncSummary(*(a + b for a, b in zip(self, other)))
+
+    @property
+    def changed(self):
+        return self.inserted + self.updated + self.delisted + self.relisted + self.untracked
+
+
+def _query_key(query):
+    """검색 조건(ArticleQuery)을 저장/비교용 문자열로 변환 (None이면 None)"""
+    if query is None:
+        return None
+    return json.dumps(query._asdict(), ensure_ascii=False, sort_keys=True)
+
+
+def _tracked(article):
+    """매물 딕셔너리에서 변경 여부를 판단하는 값 (등록일, 가격 변동 상태, 가격(원), 월세(원))"""
+    price, rent = parse_price(article.get('가격'))
+    if article.get('월세'):
+        rent, _ = parse_price(article.get('월세'))
+    return article.get('등록일'), article.get('가격변동'), price, rent
+
+
+class ListingStore:
+    """
+    매물 동기화 저장소
+    - listings: 매물번호 기준 최신 상태 (내려간 매물은 delisted_at 기록)
+    - changes: 순번(seq) 순서의 변경 기록
+    - sync_state: 단지별 마지막 검색 조건과 그 조건으로 처음 동기화한 시각
+    """
+
+    def __init__(self, path=DEFAULT_LISTING_DB_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS listings (
+                article_no TEXT PRIMARY KEY,
+                complex_no TEXT NOT NULL,
+                confirm_ymd TEXT,
+                price_change_state TEXT,
+                price INTEGER,
+                rent INTEGER,
+                first_seen TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                delisted_at TEXT,
+                data TEXT NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                changed_at TEXT NOT NULL,
+                change TEXT NOT NULL,
+                article_no TEXT NOT NULL,
+                complex_no TEXT NOT NULL,
+                confirm_ymd TEXT,
+                price_change_state TEXT,
+                price INTEGER,
+                rent INTEGER,
+                previous_price INTEGER,
+                previous_rent INTEGER,
+                data TEXT
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS sync_state (
+                complex_no TEXT PRIMARY KEY,
+                query TEXT,
+                query_since TEXT NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_listings_complex_no ON listings (complex_no)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_changes_article_no ON changes (article_no)')
+        self.conn.commit()
+
+    def sync_complex(self, complex_no, articles, synced_at=None, complete=True, query=None):
+        """
+        단지 하나의 수집 결과를 저장된 상태와 비교하여 바뀐 매물만 반영 (하나의 트랜잭션)
+
+        검색 조건이 지난 동기화와 다르면 목록에 없는 매물은 내려간 것이 아니라 새 조건 밖의 매물이므로
+        추적 중단(untrack)으로 기록하고 추적 대상(listings)에서 뺀 뒤 새 검색 조건을 기록한다.
+        (끝까지 수집하지 못했으면 조건 밖인지 알 수 없으므로 이전 검색 조건과 매물을 그대로 둠)
+
+        Args:
+            complex_no: 단지 번호
+            articles: parse_article로 변환한 매물 목록 (단지 전체)
+            synced_at: 수집 시각 (기본값: 현재 시각)
+            complete: 단지 전체를 끝까지 수집했는지 여부 (False이면 목록에 없는 매물을 내려간 것으로 보지 않음)
+            query: 수집에 사용한 검색 조건 (ArticleQuery)
+
+        Returns:
+            SyncSummary: 변경 종류별 매물 수
+        """
+        complex_no = str(complex_no)
+        synced_at = (synced_at or datetime.now()).isoformat(timespec='seconds')
+        stored = {
+            article_no: (tracked, delisted_at)
+            for article_no, delisted_at, *tracked in self.conn.execute(
+                'SELECT article_no, delisted_at, confirm_ymd, price_change_state, price, rent '
+                'FROM listings WHERE complex_no = ?', (complex_no,))
+        }
+        query_key = _query_key(query)
+        state = self.conn.execute('SELECT query FROM sync_state WHERE complex_no = ?', (complex_no,)).fetchone()
+        query_changed = state is None or state[0] != query_key
+
+        # 같은 매물이 여러 페이지에 나오면 마지막 값 사용
+        current = {str(article['매물번호']): article for article in articles if article.get('매물번호')}
+        upserts, changes = [], []
+        counts = dict.fromkeys(SyncSummary._fields, 0)
+        for article_no, article in current.items():
+            tracked = _tracked(article)
+            previous, delisted_at = stored.get(article_no, (None, None))
+            if previous is None:
+                change = CHANGE_INSERT
+            elif delisted_at:
+                change = CHANGE_RELIST
+            elif tuple(previous) != tracked:
+                change = CHANGE_UPDATE
+            else:
+                counts['unchanged'] += 1
+                continue
+            counts[{CHANGE_INSERT: 'inserted', CHANGE_UPDATE: 'updated', CHANGE_RELIST: 'relisted'}[change]] += 1
+            data = json.dumps(article, ensure_ascii=False)
+            upserts.append((article_no, complex_no, *tracked, synced_at, synced_at, data))
+            previous_price, previous_rent = (previous[2], previous[3]) if previous else (None, None)
+            changes.append((synced_at, change, article_no, complex_no, *tracked, previous_price, previous_rent, data))
+
+        delisted, dropped = [], []
+        if complete and query_changed:
+            # 이미 내려간 매물도 listings에서 빠지므로 함께 기록
+            dropped = [article_no for article_no in stored if article_no not in current]
+            counts['untracked'] = len(dropped)
+        elif complete:
+            delisted = [article_no for article_no, (_, delisted_at) in stored.items()
+                        if article_no not in current and not delisted_at]
+            counts['delisted'] = len(delisted)
+        changes.extend(
+            (synced_at, change, article_no, complex_no, *stored[article_no][0],
+             stored[article_no][0][2], stored[article_no][0][3], None)
+            for change, article_nos in ((CHANGE_DELIST, delisted), (CHANGE_UNTRACK, dropped))
+            for article_no in article_nos
+        )
+
+        if changes or (complete and query_changed):
+            with self.conn:
+                if complete and query_changed:
+                    self.conn.execute('INSERT OR REPLACE INTO sync_state (complex_no, query, query_since) '
+                                      'VALUES (?, ?, ?)', (complex_no, query_key, synced_at))
+                    self.conn.executemany('DELETE FROM listings WHERE article_no = ?',
+                                          [(article_no,) for article_no in dropped])
+                self.conn.executemany('''
+                    INSERT INTO listings (article_no, complex_no, confirm_ymd, price_change_state, price, rent,
+                                          first_seen, updated_at, delisted_at, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)
+                    ON CONFLICT (article_no) DO UPDATE SET
+                        complex_no = excluded.complex_no,
+                        confirm_ymd = excluded.confirm_ymd,
+                        price_change_state = excluded.price_change_state,
+                        price = excluded.price,
+                        rent = excluded.rent,
+                        updated_at = excluded.updated_at,
+                        delisted_at = NULL,
+                        data = excluded.data
+                ''', upserts)
+                self.conn.executemany('UPDATE listings SET delisted_at = ?, updated_at = ? WHERE article_no = ?',
+                                      [(synced_at, synced_at, article_no) for article_no in delisted])
+                self.conn.executemany(
+                    'INSERT INTO changes (changed_at, change, article_no, complex_no, confirm_ymd, '
+                    'price_change_state, price, rent, previous_price, previous_rent, data) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    changes,
+                )
+        return SyncSummary(**counts)
+
+    def sync_result(self, result, query=None, synced_at=None):
+        """
+        NaverLandClient의 ComplexResult 반영
+
+        수집 중 오류가 났거나 최대 페이지 수에서 멈춘 단지는 내려간 매물을 판단하지 않는다.
+        """
+        return self.sync_complex(result.complex_no, result.articles, synced_at, complete=result.complete,
+                                 query=query)
+
+    def _query(self, sql, params, columns):
+        import pandas as pd
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return pd.DataFrame.from_records(rows, columns=columns)
+
+    def changes_since(self, seq=0, limit=None):
+        """
+        순번 seq 이후의 변경 기록 (순번 순)
+
+        마지막으로 읽은 행의 seq를 기억해 두었다가 다음에 넘기면 그 사이의 변경만 읽는다.
+        """
+        return self._query(
+            f'SELECT {", ".join(CHANGE_COLUMNS)} FROM changes WHERE seq > ? ORDER BY seq LIMIT ?',
+            (seq, -1 if limit is None else limit),
+            CHANGE_COLUMNS,
+        )
+
+    def last_seq(self):
+        """가장 최근 변경 기록의 순번 (기록이 없으면 0)"""
+        return self.conn.execute('SELECT COALESCE(MAX(seq), 0) FROM changes').fetchone()[0]
+
+    def listings(self, complex_no=None, include_delisted=False):
+        """저장된 매물 상태 (기본값: 올라와 있는 매물만)"""
+        conditions, params = [], []
+        if complex_no is not None:
+            conditions.append('complex_no = ?')
+            params.append(str(complex_no))
+        if not include_delisted:
+            conditions.append('delisted_at IS NULL')
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        return self._query(f'SELECT {", ".join(LISTING_COLUMNS)} FROM listings{where} ORDER BY article_no',
+                           params, LISTING_COLUMNS)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,262 @@
+"""
+매물 지도 생성 모듈
+Folium.ipynb처럼 매물마다 folium.Marker를 추가하면 매물 수만큼 HTML이 커지므로,
+매물을 육각형 칸으로 미리 집계한 뒤 확대 수준별로 다른 층을 보여줍니다.
+- 축소 화면: 큰 육각형 단계구분도 (칸별 매물 수, 가격 중앙값)
+- 중간 화면: 작은 육각형 단계구분도
+- 확대 화면: 매물 좌표 배열 하나로 그리는 클러스터 마커 (FastMarkerCluster)
+- 열지도: 작은 육각형 중심점을 매물 수로 가중 (층 선택에서 켜고 끔)
+좌표는 소수점 5자리(약 1m)로 줄여 기록하고, 색은 칸마다 속성에 넣어 스타일 함수를 칸 수만큼 만들지 않습니다.
+
+사용법:
+    python map_render.py naver_property_data.xlsx -o naver_property_map.html
+"""
+
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from constants import (MAP_CENTER, HEX_LAYERS, CLUSTER_MIN_ZOOM, MAX_ZOOM, COORD_DECIMALS, MAP_COLORS)
+
+METERS_PER_DEGREE = 111_320   # 위도 1도의 길이 (m)
+SQRT3 = math.sqrt(3)
+
+
+def _project(lats, lons, origin):
+    """origin 기준 평면 좌표 (m, 도시 규모에서는 등장방형 근사로 충분)"""
+    x = (np.asarray(lons, dtype=np.float64) - origin[1]) * METERS_PER_DEGREE * math.cos(math.radians(origin[0]))
+    y = (np.asarray(lats, dtype=np.float64) - origin[0]) * METERS_PER_DEGREE
+    return x, y
+
+
+def _unproject(x, y, origin):
+    lats = origin[0] + y / METERS_PER_DEGREE
+    lons = origin[1] + x / (METERS_PER_DEGREE * math.cos(math.radians(origin[0])))
+    return lats, lons
+
+
+def hex_bin(lats, lons, size, origin=MAP_CENTER):
+    """
+    좌표가 속한 육각형 칸 (뾰족한 꼭짓점이 위를 향하는 육각형의 축 좌표 q, r)
+
+    Args:
+        size: 육각형 중심에서 꼭짓점까지의 거리 (m)
+    """
+    x, y = _project(lats, lons, origin)
+    q = (SQRT3 / 3 * x - y / 3) / size
+    r = (2 / 3 * y) / size
+    # 세 축 좌표를 반올림한 뒤 오차가 가장 큰 축을 나머지 두 축으로 다시 계산
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+def hex_center(q, r, size, origin=MAP_CENTER):
+    """육각형 칸 중심의 (위도, 경도)"""
+    x = size * SQRT3 * (np.asarray(q) + np.asarray(r) / 2)
+    y = size * 1.5 * np.asarray(r)
+    return _unproject(x, y, origin)
+
+
+def aggregate_hex(lats, lons, size, values=None, origin=MAP_CENTER):
+    """
+    좌표를 육각형 칸으로 집계
+
+    Returns:
+        DataFrame: q, r, lat, lon(칸 중심), count(매물 수), value(values의 칸별 중앙값, values가 없으면 NaN)
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    valid = np.isfinite(lats) & np.isfinite(lons)
+    q, r = hex_bin(lats[valid], lons[valid], size, origin)
+    frame = pd.DataFrame({
+        'q': q, 'r': r,
+        'value': np.nan if values is None else pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(
+            dtype=np.float64, na_value=np.nan)[valid],
+    })
+    cells = frame.groupby(['q', 'r'], sort=False).agg(count=('value', 'size'), value=('value', 'median')).reset_index()
+    cells['lat'], cells['lon'] = hex_center(cells['q'].to_numpy(), cells['r'].to_numpy(), size, origin)
+    return cells[['q', 'r', 'lat', 'lon', 'count', 'value']]
+
+
+def _color_classes(values, colors=MAP_COLORS):
+    """값을 분위수 기준 len(colors)단계로 나눈 색 (NaN은 회색)"""
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(len(values), '#999999', dtype=object)
+    finite = np.isfinite(values)
+    if finite.any():
+        edges = np.quantile(values[finite], np.linspace(0, 1, len(colors) + 1)[1:-1])
+        result[finite] = np.asarray(colors, dtype=object)[np.searchsorted(edges, values[finite], side='right')]
+    return result
+
+
+def _format_won(value):
+    """원 단위 가격을 '6.7억', '7,000만' 형태로 표시"""
+    if not np.isfinite(value):
+        return '-'
+    if value >= 100_000_000:
+        return f"{value / 100_000_000:.1f}억"
+    return f"{value / 10_000:,.0f}만"
+
+
+def hex_geojson(cells, size, origin=MAP_CENTER, color_by='count'):
+    """
+    aggregate_hex 결과를 육각형 다각형 GeoJSON(FeatureCollection)으로 변환
+
+    속성: count, price(가격 중앙값 표시 문자열), c(채우기 색)
+    """
+    angles = np.radians(30 + 60 * np.arange(7))   # 닫힌 다각형 (첫 꼭짓점 반복)
+    x0 = size * SQRT3 * (cells['q'].to_numpy()[:, None] + cells['r'].to_numpy()[:, None] / 2)
+    y0 = size * 1.5 * cells['r'].to_numpy()[:, None]
+    lats, lons = _unproject(x0 + size * np.cos(angles), y0 + size * np.sin(angles), origin)
+    lats = np.round(lats, COORD_DECIMALS)
+    lons = np.round(lons, COORD_DECIMALS)
+    colors = _color_classes(cells[color_by].to_numpy())
+
+    features = []
+    for index, (count, value) in enumerate(zip(cells['count'].tolist(), cells['value'].tolist())):
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Polygon', 'coordinates': [list(zip(lons[index].tolist(), lats[index].tolist()))]},
+            'properties': {'count': count, 'price': _format_won(value), 'c': colors[index]},
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def write_geojson(geojson, path):
+    """공백 없는 GeoJSON 파일로 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(geojson, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def _zoom_switch(layers):
+    """확대 수준에 따라 층을 보이거나 숨기는 지도 요소 [(층, 최소 확대, 최대 확대), ...]"""
+    from branca.element import MacroElement
+    from jinja2 import Template
+
+    element = MacroElement()
+    element._name = 'ZoomSwitch'
+    element.layers = layers
+    element._template = Template('''
+        {% macro script(this, kwargs) %}
+        (function() {
+            var map = {{ this._parent.get_name() }};
+            var layers = [{% for layer, min_zoom, max_zoom in this.layers %}
+                [{{ layer.get_name() }}, {{ min_zoom }}, {{ max_zoom }}],{% endfor %}
+            ];
+            function update() {
+                var zoom = map.getZoom();
+                layers.forEach(function(item) {
+                    var visible = zoom >= item[1] && zoom <= item[2];
+                    if (visible && !map.hasLayer(item[0])) { map.addLayer(item[0]); }
+                    if (!visible && map.hasLayer(item[0])) { map.removeLayer(item[0]); }
+                });
+            }
+            map.on('zoomend', update);
+            update();
+        })();
+        {% endmacro %}
+    ''')
+    return element
+
+
+def build_map(df, lat_column='위도', lon_column='경도', value_column='가격(원)', color_by='count',
+              hex_layers=HEX_LAYERS, cluster_min_zoom=CLUSTER_MIN_ZOOM, zoom_start=11):
+    """
+    매물 데이터프레임으로 folium 지도 생성
+
+    Args:
+        df: 위도/경도 열이 있는 매물 데이터프레임 (value_column이 있으면 칸별 가격 중앙값 표시)
+        color_by: 단계구분도 색 기준 ('count' 또는 'value')
+        hex_layers: (육각형 크기(m), 최소 확대, 최대 확대) 목록 (큰 칸부터)
+        cluster_min_zoom: 이 확대 수준부터 개별 매물 클러스터 마커 표시
+    """
+    import folium
+    from folium.plugins import FastMarkerCluster, HeatMap
+    from folium.utilities import JsCode
+
+    lats = pd.to_numeric(df[lat_column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    lons = pd.to_numeric(df[lon_column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    values = df[value_column] if value_column in df else None
+    valid = np.isfinite(lats) & np.isfinite(lons)
+
+    m = folium.Map(location=MAP_CENTER, zoom_start=zoom_start, max_zoom=MAX_ZOOM, prefer_canvas=True)
+    style = JsCode('''
+        function(feature, layer) {
+            var color = feature.properties.c;
+            layer.setStyle({color: color, weight: 1, fillColor: color, fillOpacity: 0.5});
+        }
+    ''')
+    switched = []
+    cells = None
+    for size, min_zoom, max_zoom in hex_layers:
+        cells = aggregate_hex(lats, lons, size, values)
+        layer = folium.GeoJson(
+            hex_geojson(cells, size, color_by=color_by),
+            name=f'{size}m 육각형', control=False, on_each_feature=style,
+            tooltip=folium.GeoJsonTooltip(fields=['count', 'price'], aliases=['매물 수', '가격 중앙값']),
+        ).add_to(m)
+        switched.append((layer, min_zoom, max_zoom))
+
+    # 가장 작은 육각형 중심을 매물 수로 가중한 열지도 (개별 좌표 대신 칸 수만큼만 기록)
+    if cells is not None and len(cells):
+        HeatMap(
+            np.column_stack([cells['lat'].round(COORD_DECIMALS), cells['lon'].round(COORD_DECIMALS),
+                             cells['count']]).tolist(),
+            name='열지도', show=False,
+        ).add_to(m)
+
+    # 확대 화면의 개별 매물 (마커는 브라우저에서 보이는 영역만 클러스터로 생성)
+    points = np.column_stack([lats[valid], lons[valid]]).round(COORD_DECIMALS).tolist()
+    cluster = FastMarkerCluster(points, name='매물', control=False).add_to(m)
+    switched.append((cluster, cluster_min_zoom, MAX_ZOOM))
+
+    folium.LayerControl().add_to(m)
+    _zoom_switch(switched).add_to(m)
+    return m
+
+
+def render_map(df, path, **kwargs):
+    """build_map으로 만든 지도를 HTML 파일로 저장하고 경로 반환"""
+    build_map(df, **kwargs).save(path)
+    return path
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='매물 지도 생성 (육각형 집계 + 클러스터 마커)')
+    arg_parser.add_argument('input', help='매물 엑셀/CSV/Parquet 파일 (위도, 경도 열 필요)')
+    arg_parser.add_argument('-o', '--output', default='naver_property_map.html', help='저장할 HTML 파일 경로')
+    arg_parser.add_argument('--geojson', help='가장 작은 육각형 집계를 GeoJSON 파일로도 저장')
+    arg_parser.add_argument('--color-by', choices=['count', 'value'], default='count',
+                            help='단계구분도 색 기준 (매물 수 또는 가격 중앙값)')
+    args = arg_parser.parse_args(argv)
+
+    readers = {'.csv': pd.read_csv, '.parquet': pd.read_parquet}
+    df = readers.get(args.input[args.input.rfind('.'):].lower(), pd.read_excel)(args.input)
+    if '가격(원)' not in df and '가격' in df:
+        from price_parser import add_price_columns
+        add_price_columns(df)
+
+    start_time = time.time()
+    render_map(df, args.output, color_by=args.color_by)
+    print(f"지도를 저장했습니다: {args.output} | 매물 {len(df):,}개 | 소요 시간: {time.time() - start_time:.1f}초")
+    if args.geojson:
+        size = HEX_LAYERS[-1][0]
+        lats = pd.to_numeric(df['위도'], errors='coerce')
+        lons = pd.to_numeric(df['경도'], errors='coerce')
+        cells = aggregate_hex(lats, lons, size, df.get('가격(원)'))
+        write_geojson(hex_geojson(cells, size, color_by=args.color_by), args.geojson)
+        print(f"GeoJSON을 저장했습니다: {args.geojson} | 육각형 {len(cells):,}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+매물 가격 문자열 변환 모듈
+'6억 7,000', '5,000/60'처럼 화면 표시용으로 내려오는 가격 문자열을 원 단위 정수로 변환합니다.
+- 억 단위와 만원 단위(억 뒤의 숫자 또는 단위 없는 숫자)를 합산
+- '보증금/월세' 형식은 두 값으로 나눔 (월세도 만원 단위)
+- 변환할 수 없는 값('협의', '-', 빈 문자열 등)은 결측값
+
+열 단위 변환(parse_prices)은 서로 다른 문자열만 한 번씩 해석한 뒤 배열 인덱싱으로 펼치므로,
+같은 가격이 반복되는 매물 목록에서는 행 수와 관계없이 해석 비용이 고유값 수에 비례합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+EOK = 100_000_000   # 1억 원
+MAN = 10_000        # 1만 원
+
+
+def _parse_man(text):
+    """'7,000', '950', '7,000만' 같은 만원 단위 숫자를 정수로 변환 (실패하면 None)"""
+    if text.endswith('만'):
+        text = text[:-1]
+    if ',' in text:
+        groups = text.split(',')
+        # 쉼표는 세 자리마다 있어야 함 ('6억 7,00' 같은 잘린 값 거르기)
+        if not 1 <= len(groups[0]) <= 3 or any(len(group) != 3 for group in groups[1:]):
+            return None
+        text = ''.join(groups)
+    return int(text) if text.isdigit() and text.isascii() else None
+
+
+def _parse_amount(text):
+    """'6억7,000', '7,000', '1.5억' 등 한 부분을 원 단위 정수로 변환 (실패하면 None)"""
+    eok, has_eok, man = text.partition('억')
+    if not has_eok:
+        man = _parse_man(eok)
+        return None if man is None else man * MAN
+    if not eok.replace('.', '', 1).isdigit() or not eok.isascii():
+        return None
+    won = round(float(eok) * EOK)
+    if man:
+        man = _parse_man(man)
+        if man is None:
+            return None
+        won += man * MAN
+    return won
+
+
+def parse_price(text):
+    """
+    가격 문자열 하나를 (가격, 월세) 원 단위 정수로 변환
+
+    Returns:
+        tuple: (매매가 또는 보증금, 월세) - '/'가 없으면 월세는 None, 변환할 수 없으면 (None, None)
+
+    Examples:
+        '6억 7,000' -> (670000000, None)
+        '1억/150' -> (100000000, 1500000)
+    """
+    if not isinstance(text, str):
+        return None, None
+    # 공백과 '원' 제거
+    text = ''.join(text.split()).replace('원', '')
+    deposit, slash, rent = text.partition('/')
+    deposit = _parse_amount(deposit)
+    if not slash:
+        return deposit, None
+    rent = _parse_amount(rent)
+    if deposit is None or rent is None:
+        return None, None
+    return deposit, rent
+
+
+def parse_prices(values):
+    """
+    가격 문자열 열 전체를 원 단위 정수 열 두 개로 변환
+
+    Args:
+        values: 가격 문자열의 리스트/배열/Series (None/NaN 허용)
+
+    Returns:
+        tuple: (가격, 월세) - 결측값을 허용하는 Int64 Series 두 개 (입력이 Series이면 같은 인덱스)
+    """
+    index = values.index if isinstance(values, pd.Series) else None
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+
+    # 고유값만 해석 (마지막 칸은 결측값 코드 -1이 가리키는 자리)
+    prices = np.zeros(len(uniques) + 1, dtype=np.int64)
+    rents = np.zeros(len(uniques) + 1, dtype=np.int64)
+    price_missing = np.ones(len(uniques) + 1, dtype=bool)
+    rent_missing = np.ones(len(uniques) + 1, dtype=bool)
+    for position, text in enumerate(uniques):
+        price, rent = parse_price(text)
+        if price is not None:
+            prices[position] = price
+            price_missing[position] = False
+        if rent is not None:
+            rents[position] = rent
+            rent_missing[position] = False
+
+    return (
+        pd.Series(pd.arrays.IntegerArray(prices[codes], price_missing[codes]), index=index),
+        pd.Series(pd.arrays.IntegerArray(rents[codes], rent_missing[codes]), index=index),
+    )
+
+
+def add_price_columns(df, price_column='가격', rent_column='월세'):
+    """
+    매물 데이터프레임에 '가격(원)', '월세(원)' 숫자 열 추가
+
+    월세가 별도 열(API의 rentPrc)에 있으면 그 값을 쓰고, 가격 문자열이 '보증금/월세' 형식이면 나눈 값을 쓴다.
+    """
+    prices, rents = parse_prices(df[price_column])
+    if rent_column in df:
+        # 월세 열은 만원 단위 숫자 문자열이므로 같은 규칙으로 변환
+        separate_rents, _ = parse_prices(df[rent_column])
+        rents = separate_rents.fillna(rents)
+    df['가격(원)'] = prices.set_axis(df.index)
+    df['월세(원)'] = rents.set_axis(df.index)
+    return df
@@ -0,0 +1,145 @@
+"""
+매물 좌표 공간 색인 모듈
+수집한 매물의 위도/경도를 일정한 크기의 격자 칸으로 나누고, 칸 번호 순으로 정렬해 둡니다.
+같은 격자 행(위도 띠)에서 이어진 칸들은 정렬된 배열의 연속 구간이므로,
+사각형 조회는 격자 행마다 searchsorted 한 번으로 후보 구간을 찾은 뒤 후보만 정확히 비교합니다.
+반경/다각형 조회는 감싸는 사각형으로 후보를 줄인 다음 거리 계산/점-다각형 판정을 합니다.
+"""
+
+import numpy as np
+
+from constants import DEFAULT_CELL_SIZE
+
+EARTH_RADIUS = 6_371_000          # 지구 반지름 (m)
+METERS_PER_DEGREE = 111_320       # 위도 1도의 길이 (m)
+
+
+class ListingIndex:
+    """
+    매물 좌표 격자 색인
+
+    조회 결과는 색인을 만들 때 넘긴 좌표 배열의 위치(정수 배열, 오름차순)이므로
+    데이터프레임에서 만들었다면 df.iloc[결과]로 매물을 가져온다.
+    """
+
+    def __init__(self, lats, lons, cell_size=DEFAULT_CELL_SIZE):
+        """
+        Args:
+            lats, lons: 위도/경도 배열 (숫자로 바꿀 수 없거나 NaN인 좌표는 색인에서 제외)
+            cell_size: 격자 칸 크기 (도)
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if lats.shape != lons.shape:
+            raise ValueError("위도와 경도 배열의 길이가 다릅니다.")
+        if cell_size <= 0:
+            raise ValueError("cell_size는 0보다 커야 합니다.")
+        self.cell_size = float(cell_size)
+
+        positions = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons))
+        lats, lons = lats[positions], lons[positions]
+        self.origin = (lats.min(), lons.min()) if len(positions) else (0.0, 0.0)
+        rows, cols = self._cells(lats, lons)
+        self.n_rows = int(rows.max()) + 1 if len(positions) else 0
+        self.n_cols = int(cols.max()) + 1 if len(positions) else 0
+
+        # 칸 번호(행 * 열 수 + 열) 순으로 정렬
+        keys = rows * self.n_cols + cols
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        self._lats = lats[order]
+        self._lons = lons[order]
+        self._positions = positions[order]
+
+    @classmethod
+    def from_frame(cls, df, lat_column='위도', lon_column='경도', cell_size=DEFAULT_CELL_SIZE):
+        """매물 데이터프레임으로 색인 생성 (좌표가 문자열이어도 숫자로 변환)"""
+        import pandas as pd
+
+        return cls(pd.to_numeric(df[lat_column], errors='coerce').to_numpy(dtype=np.float64),
+                   pd.to_numeric(df[lon_column], errors='coerce').to_numpy(dtype=np.float64),
+                   cell_size)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def _cells(self, lats, lons):
+        rows = np.floor((lats - self.origin[0]) / self.cell_size).astype(np.int64)
+        cols = np.floor((lons - self.origin[1]) / self.cell_size).astype(np.int64)
+        return rows, cols
+
+    def _candidates(self, south, west, north, east):
+        """사각형과 겹치는 칸에 든 점의 정렬 배열상 위치"""
+        if not len(self) or south > north or west > east:
+            return np.empty(0, dtype=np.int64)
+        (row0, row1), (col0, col1) = self._cells(np.array([south, north]), np.array([west, east]))
+        row0, row1 = max(int(row0), 0), min(int(row1), self.n_rows - 1)
+        col0, col1 = max(int(col0), 0), min(int(col1), self.n_cols - 1)
+        if row0 > row1 or col0 > col1:
+            return np.empty(0, dtype=np.int64)
+
+        # 격자 행마다 [첫 칸, 마지막 칸] 구간을 한 번에 찾음
+        row_keys = np.arange(row0, row1 + 1, dtype=np.int64) * self.n_cols
+        starts = np.searchsorted(self._keys, row_keys + col0, side='left')
+        ends = np.searchsorted(self._keys, row_keys + col1, side='right')
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        # 구간들을 이어 붙인 위치 배열 (각 구간의 시작 위치 + 구간 안의 순번)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return offsets + np.arange(total, dtype=np.int64)
+
+    def _result(self, candidates, mask):
+        return np.sort(self._positions[candidates[mask]])
+
+    def bbox(self, south, west, north, east):
+        """위도 south~north, 경도 west~east 사각형 안(경계 포함)의 매물 위치"""
+        candidates = self._candidates(south, west, north, east)
+        lats, lons = self._lats[candidates], self._lons[candidates]
+        mask = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+        return self._result(candidates, mask)
+
+    def radius(self, lat, lon, meters):
+        """(lat, lon)에서 meters 이내의 매물 위치 (대원 거리 기준)"""
+        lat_delta = meters / METERS_PER_DEGREE
+        lon_delta = meters / (METERS_PER_DEGREE * max(np.cos(np.radians(lat)), 1e-12))
+        candidates = self._candidates(lat - lat_delta, lon - lon_delta, lat + lat_delta, lon + lon_delta)
+        return self._result(candidates, haversine(lat, lon, self._lats[candidates], self._lons[candidates]) <= meters)
+
+    def polygon(self, coords):
+        """
+        다각형 안의 매물 위치
+
+        Args:
+            coords: [(위도, 경도), ...] 꼭짓점 목록 (처음과 끝이 같지 않아도 됨)
+        """
+        vertices = np.asarray(coords, dtype=np.float64)
+        if vertices.ndim != 2 or vertices.shape[1] != 2 or len(vertices) < 3:
+            raise ValueError("다각형은 (위도, 경도) 꼭짓점이 3개 이상 필요합니다.")
+        south, west = vertices.min(axis=0)
+        north, east = vertices.max(axis=0)
+        candidates = self._candidates(south, west, north, east)
+        return self._result(candidates, points_in_polygon(self._lats[candidates], self._lons[candidates], vertices))
+
+
+def haversine(lat, lon, lats, lons):
+    """(lat, lon)에서 각 점까지의 대원 거리 (m)"""
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+
+def points_in_polygon(lats, lons, vertices):
+    """점마다 다각형 안에 있는지 여부 (변마다 오른쪽으로 뻗은 반직선과의 교차 횟수로 판정)"""
+    inside = np.zeros(len(lats), dtype=bool)
+    previous = vertices[-1]
+    for current in vertices:
+        (lat1, lon1), (lat2, lon2) = previous, current
+        crosses = (lat1 > lats) != (lat2 > lats)
+        if lat1 != lat2:
+            crossing_lon = lon1 + (lats - lat1) * (lon2 - lon1) / (lat2 - lat1)
+            inside ^= crosses & (lons < crossing_lon)
+        previous = current
+    return inside
@@ -0,0 +1,72 @@
+"""
+검색 결과 추출 성능 측정 스크립트
+쿠팡 검색 결과와 같은 구조의 HTML을 만들어 lxml 추출 시간을 출력합니다.
+(브라우저가 필요한 script/element 방식은 측정하지 않습니다.)
+
+사용법:
+    python benchmarks/bench_extract.py [--items 72] [--repeat 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from product_parser import parse_product_list  # noqa: E402
+
+ITEM_TEMPLATE = """
+<li class="search-product" id="{index}">
+  <a class="search-product-link" href="/vp/products/{index}?itemId={index}">
+    <dl class="search-product-wrap">
+      <dt class="image"><img src="//thumbnail.example/{index}.jpg"></dt>
+      <dd class="descriptions">
+        <div class="name">테스트 제품 {index} 대용량 1+1</div>
+        <div class="price-area"><strong class="price-value">{price:,}</strong>원</div>
+        {rating}
+      </dd>
+    </dl>
+  </a>
+</li>
+"""
+
+RATING_TEMPLATE = """
+<div class="other-info"><div class="rating-star">
+  <em class="rating">{rating}</em><span class="rating-total-count">({reviews:,})</span>
+</div></div>
+"""
+
+
+def make_page(items):
+    """제품 items개가 있는 검색 결과 HTML (세 번째 제품마다 평점 없음)"""
+    body = ''.join(
+        ITEM_TEMPLATE.format(
+            index=index,
+            price=10000 + index * 130,
+            rating='' if index % 3 == 0 else RATING_TEMPLATE.format(rating=4.5, reviews=index * 17),
+        )
+        for index in range(items)
+    )
+    return f'<html><body><ul id="productList">{body}</ul></body></html>'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검색 결과 추출 성능 측정')
+    parser.add_argument('--items', type=int, default=72, help='페이지당 제품 수')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    html = make_page(args.items)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        products = parse_product_list(html)
+    elapsed = (time.perf_counter() - start) * 1000 / args.repeat
+
+    missing = sum(product['평점'] == '평점 없음' for product in products)
+    print(f"lxml 추출: 페이지당 {elapsed:.2f}ms ({len(products)}개, 평점 없음 {missing}개)")
+    print(products[1])
+
+
+if __name__ == '__main__':
+    main()
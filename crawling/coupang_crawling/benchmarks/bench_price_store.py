@@ -0,0 +1,86 @@
+"""
+가격 기록 저장소 성능 측정 스크립트
+임시 DB에 여러 달 동안 같은 검색어를 반복 검색한 것처럼 관측 기록을 쌓은 뒤
+제품별 가격 기록 조회와 가격 하락 조회 시간을 출력합니다.
+
+사용법:
+    python benchmarks/bench_price_store.py [--days 180] [--runs-per-day 3] [--products 3000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from price_store import PriceStore  # noqa: E402
+
+
+def timed(func, repeat):
+    """func를 repeat번 실행한 평균 시간(ms)과 마지막 결과 반환"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def make_products(count):
+    """검색 결과 형태의 제품 목록 (가격은 문자열)"""
+    return [
+        {
+            "제품명": f"제품 {index}",
+            "가격": f"{random.randrange(5000, 500000, 10):,}",
+            "평점": "평점 없음" if index % 7 == 0 else f"{random.uniform(3, 5):.1f}",
+            "리뷰수": f"{random.randrange(0, 20000):,}",
+            "링크": f"https://www.coupang.com/vp/products/{index}?itemId={index}&vendorItemId={index}&rank={index % 36}",
+        }
+        for index in range(count)
+    ]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='가격 기록 저장소 조회 벤치마크')
+    arg_parser.add_argument('--days', type=int, default=180, help='기록 일수')
+    arg_parser.add_argument('--runs-per-day', type=int, default=3, help='하루 검색 횟수')
+    arg_parser.add_argument('--products', type=int, default=3000, help='검색마다 관측되는 제품 수')
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    products = make_products(args.products)
+    first_day = datetime(2026, 1, 1, 9)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = PriceStore(os.path.join(directory, 'prices.db'))
+
+        start = time.perf_counter()
+        for day in range(args.days):
+            for run in range(args.runs_per_day):
+                # 검색할 때마다 일부 제품의 가격이 바뀜
+                for product in random.sample(products, len(products) // 20):
+                    price = int(product["가격"].replace(",", ""))
+                    product["가격"] = f"{max(1000, int(price * random.uniform(0.8, 1.15))):,}"
+                store.record(products, keyword='테스트', observed_at=first_day + timedelta(days=day, hours=run * 4))
+        total = args.days * args.runs_per_day * args.products
+        print(f"적재: {args.days}일 x {args.runs_per_day}회 x {args.products}제품 = {total:,}행 / "
+              f"{time.perf_counter() - start:.1f}초")
+
+        link = products[len(products) // 2]["링크"]
+        elapsed, frame = timed(lambda: store.price_history(link), 50)
+        print(f"제품 하나 전체 기간 가격 기록: {len(frame)}행 / {elapsed:.2f}ms")
+
+        last_month = (first_day + timedelta(days=args.days - 30)).date()
+        elapsed, frame = timed(lambda: store.price_history(link, start=last_month), 50)
+        print(f"제품 하나 최근 30일 가격 기록: {len(frame)}행 / {elapsed:.2f}ms")
+
+        elapsed, frame = timed(lambda: store.price_drops(min_drop_rate=0.1), 50)
+        print(f"10% 이상 가격 하락 제품: {len(frame)}개 / {elapsed:.2f}ms")
+
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+브라우저 프로필 비교 스크립트
+기록해 둔 검색 결과 페이지를 로컬 HTTP 서버로 제공하고, 'full'과 'lean' 프로필로 각각 불러와
+결과 목록이 준비될 때까지의 시간과 전송된 바이트 수를 출력합니다. (크롬이 설치되어 있어야 합니다.)
+
+기록한 페이지 디렉토리를 지정하지 않으면 이미지/폰트/스타일시트가 포함된 검색 결과 형태의 페이지를 만들어 사용합니다.
+기록한 페이지의 리소스 주소가 외부 주소이면 해당 리소스는 실제로 내려받으므로 네트워크 상태의 영향을 받습니다.
+
+사용법:
+    python benchmarks/bench_profile.py [--pages-dir recorded/] [--repeat 5]
+"""
+
+import argparse
+import functools
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import PROFILES  # noqa: E402
+from driver_pool import create_driver  # noqa: E402
+from page_wait import wait_for_results  # noqa: E402
+
+# 문서와 모든 리소스의 전송 바이트 합계 (차단된 요청은 항목이 생기지 않음)
+TRANSFER_SCRIPT = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return [entries.reduce((total, entry) => total + (entry.transferSize || entry.encodedBodySize || 0), 0),
+        entries.length];
+"""
+
+
+def make_sample_site(directory, items=72):
+    """이미지/폰트/스타일시트를 참조하는 검색 결과 형태의 페이지 생성"""
+    os.makedirs(os.path.join(directory, 'img'), exist_ok=True)
+    with open(os.path.join(directory, 'font.woff2'), 'wb') as f:
+        f.write(os.urandom(120 * 1024))
+    with open(os.path.join(directory, 'style.css'), 'w', encoding='utf-8') as f:
+        f.write("@font-face { font-family: 'Sample'; src: url('font.woff2') format('woff2'); }\n"
+                "body { font-family: 'Sample'; }\n" + '.search-product { margin: 4px; }\n' * 2000)
+    for index in range(items):
+        with open(os.path.join(directory, 'img', f'{index}.jpg'), 'wb') as f:
+            f.write(os.urandom(30 * 1024))
+
+    rows = ''.join(
+        f'<li class="search-product"><a class="search-product-link" href="/vp/products/{index}">'
+        f'<img src="img/{index}.jpg"><div class="name">제품 {index}</div>'
+        f'<strong class="price-value">{10000 + index:,}</strong></a></li>'
+        for index in range(items)
+    )
+    with open(os.path.join(directory, 'search.html'), 'w', encoding='utf-8') as f:
+        f.write('<html><head><meta charset="utf-8"><link rel="stylesheet" href="style.css">'
+                f'<title>검색 결과</title></head><body><ul>{rows}</ul></body></html>')
+
+
+def serve(directory):
+    """directory를 제공하는 로컬 HTTP 서버 시작 (주소 반환)"""
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(profile, urls, repeat):
+    """프로필 하나로 각 페이지를 repeat번 불러온 로드 시간(ms)과 전송 바이트 목록"""
+    driver = create_driver(profile)
+    times, transferred = [], []
+    try:
+        for _ in range(repeat):
+            for url in urls:
+                # 이전 측정의 캐시가 결과에 섞이지 않도록 비움
+                driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                start = time.perf_counter()
+                driver.get(url)
+                wait_for_results(driver)
+                times.append((time.perf_counter() - start) * 1000)
+                transferred.append(driver.execute_script(TRANSFER_SCRIPT)[0])
+    finally:
+        driver.quit()
+    return times, transferred
+
+
+def main():
+    parser = argparse.ArgumentParser(description='브라우저 프로필별 페이지 로드 시간/전송량 비교')
+    parser.add_argument('--pages-dir', help='기록한 검색 결과 페이지(*.html)가 있는 디렉토리')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = args.pages_dir
+        if not directory:
+            directory = temp_dir
+            make_sample_site(directory)
+        pages = sorted(os.path.basename(path) for path in glob.glob(os.path.join(directory, '*.html')))
+        if not pages:
+            print(f"{directory}에 .html 파일이 없습니다.")
+            return 1
+
+        server, base_url = serve(directory)
+        urls = [f'{base_url}/{page}' for page in pages]
+        print(f"페이지 {len(pages)}개, 프로필별 {args.repeat}회 반복")
+        try:
+            for profile in PROFILES[::-1]:
+                times, transferred = measure(profile, urls, args.repeat)
+                print(f"{profile:<5} 로드 중앙값 {statistics.median(times):8.1f}ms | "
+                      f"최대 {max(times):8.1f}ms | 페이지당 전송 {statistics.mean(transferred) / 1024:8.1f}KB")
+        finally:
+            server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
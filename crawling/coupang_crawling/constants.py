@@ -0,0 +1,67 @@
+"""
+상수 정의 모듈
+쿠팡 제품 크롤러에서 사용하는 기본 설정값을 정의합니다.
+"""
+
+import os
+
+# 웹 크롤링 차단 방지를 위한 헤더 설정
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 검색 결과 주소 (페이지 번호를 직접 지정)
+SEARCH_URL = ('https://www.coupang.com/np/search?q={keyword}&channel=user&component=&eventCategory=SRP'
+              '&page={page}&listSize={list_size}&sorter={sort}')
+PAGE_SIZE = 36                # 페이지당 제품 수
+MAX_PAGES = 5                 # 검색어 하나에서 확인할 최대 페이지 수
+
+# 검색 결과 정렬 방식 (주소의 sorter 값: 화면 표시 이름)
+SORT_ORDERS = {
+    'scoreDesc': '쿠팡 랭킹순',
+    'salePriceAsc': '낮은가격순',
+    'salePriceDesc': '높은가격순',
+    'saleCountDesc': '판매량순',
+    'latestAsc': '최신순',
+}
+DEFAULT_SORT = 'scoreDesc'
+
+# 캐시 파일을 두는 디렉토리
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'coupang_crawling')
+
+# 검색 결과 캐시 설정
+RESULT_CACHE_PATH = os.path.join(CACHE_DIR, 'search_results.db')
+DEFAULT_CACHE_TTL = 6 * 60 * 60   # 캐시된 검색 결과를 다시 쓰는 기간 (초)
+MAX_CACHE_ENTRIES = 500           # 캐시에 남겨 둘 최대 검색 결과 수 (넘으면 가장 오래 안 쓴 것부터 삭제)
+
+# 가격 기록 저장소 경로 (소스 디렉토리가 아닌 사용자 캐시 디렉토리)
+DEFAULT_PRICE_DB_PATH = os.path.join(CACHE_DIR, 'coupang_prices.db')
+
+# 드라이버 설정
+PAGE_LOAD_TIMEOUT = 30        # 페이지 로드 타임아웃 (초)
+IMPLICIT_WAIT = 10            # 요소 검색 시 암묵적 대기 시간 (초)
+
+# 페이지 준비 감지 설정
+READY_TIMEOUT = 10            # 검색 결과 목록을 기다리는 최대 시간 (초)
+STABLE_INTERVAL = 0.3         # 제품 수가 이 시간 동안 변하지 않으면 준비된 것으로 판단 (초)
+POLL_INTERVAL = 0.1           # 준비 상태 확인 간격 (초)
+
+# 예의 지연 설정 (차단이 감지될 때만 늘어남)
+MIN_DELAY = 0.0               # 평상시 요청 전 지연 시간 (초)
+THROTTLE_DELAY = 2.0          # 처음 차단되었을 때의 지연 시간 (초)
+MAX_DELAY = 30.0              # 최대 지연 시간 (초)
+
+# 브라우저 프로필 ('lean': 이미지/폰트/스타일시트/추적 스크립트 차단, 'full': 모든 리소스 로드)
+PROFILES = ('lean', 'full')
+DEFAULT_PROFILE = 'lean'
+
+# 드라이버 풀 설정
+DEFAULT_POOL_SIZE = 1         # 동시에 띄워 둘 최대 브라우저 수
+DEFAULT_MAX_PAGES = 50        # 브라우저 하나로 불러올 최대 페이지 수 (넘으면 새 브라우저로 교체)
+DRIVER_PATH_FILE = os.path.join(CACHE_DIR, 'chromedriver_path.txt')  # 설치된 드라이버 경로 기록
+
+# 여러 검색어 동시 검색 설정
+DEFAULT_WORKERS = 2           # 동시에 검색할 브라우저 수
+MAX_WORKERS = 4               # 화면에서 선택할 수 있는 최대 브라우저 수
+DEFAULT_RATE = 1.0            # 모든 브라우저를 합한 초당 페이지 요청 수
+DEFAULT_PAGE_WORKERS = 2      # 검색어 하나에서 동시에 불러올 페이지 수
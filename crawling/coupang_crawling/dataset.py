@@ -0,0 +1,68 @@
+"""
+검색 결과 데이터셋 모듈
+검색 결과를 열 단위로 보관합니다. 가격/평점/리뷰수는 추가할 때 숫자로 변환해 두므로
+화면 표시와 파일 저장 모두 GUI 테이블을 다시 읽지 않고 이 데이터에서 바로 처리합니다.
+"""
+
+import math
+from array import array
+from datetime import datetime
+
+from price_store import normalize_product
+
+# 파일로 저장할 때의 열 이름
+COLUMNS = ["검색어", "제품명", "가격", "평점", "리뷰수", "링크", "수집시각"]
+
+
+class ProductDataset:
+    """
+    검색 결과 열 저장소
+    - 문자열 열: 검색어, 제품명, 링크, 수집시각 (list)
+    - 숫자 열: 가격, 평점, 리뷰수 (array('d'), 값이 없으면 NaN)
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self.links)
+
+    def clear(self):
+        self.keywords = []
+        self.names = []
+        self.prices = array('d')
+        self.ratings = array('d')
+        self.review_counts = array('d')
+        self.links = []
+        self.collected_at = []
+
+    def append(self, keyword, products, collected_at=None):
+        """검색어 하나의 제품 목록 추가 (문자열 값은 숫자로 변환)"""
+        collected_at = (collected_at or datetime.now()).isoformat(timespec='seconds')
+        for product in products:
+            _, name, link, price, rating, review_count = normalize_product(product)
+            self.keywords.append(keyword)
+            self.names.append(name)
+            self.prices.append(math.nan if price is None else price)
+            self.ratings.append(math.nan if rating is None else rating)
+            self.review_counts.append(math.nan if review_count is None else review_count)
+            self.links.append(link)
+            self.collected_at.append(collected_at)
+
+    def to_frame(self):
+        """
+        열 이름이 COLUMNS인 데이터프레임으로 변환 (값 복사본)
+
+        리뷰수는 결측값을 허용하는 정수(Int64), 수집시각은 datetime 형식
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            "검색어": pd.Series(self.keywords, dtype='string'),
+            "제품명": pd.Series(self.names, dtype='string'),
+            "가격": pd.Series(self.prices, dtype='float64'),
+            "평점": pd.Series(self.ratings, dtype='float64'),
+            "리뷰수": pd.Series(self.review_counts, dtype='float64').astype('Int64'),
+            "링크": pd.Series(self.links, dtype='string'),
+            "수집시각": pd.to_datetime(pd.Series(self.collected_at, dtype='string')),
+        }, columns=COLUMNS)
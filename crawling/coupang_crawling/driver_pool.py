@@ -0,0 +1,278 @@
+"""
+WebDriver 풀 모듈
+헤드리스 크롬을 미리 띄워 두고 검색마다 빌려 쓰도록 하여 브라우저 시작 비용을 한 번만 치르게 합니다.
+기본 'lean' 프로필은 제품 정보 추출에 필요 없는 이미지/폰트/스타일시트/추적 스크립트를 받지 않습니다.
+드라이버 바이너리 경로는 파일에 기록해 두고 재사용하며, 빌려줄 때마다 상태를 확인하여
+응답하지 않거나 일정 페이지 수 이상 사용한 브라우저는 새로 띄운 브라우저로 교체합니다.
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+from constants import (HEADERS, PAGE_LOAD_TIMEOUT, IMPLICIT_WAIT, DEFAULT_POOL_SIZE, DEFAULT_MAX_PAGES,
+                       DRIVER_PATH_FILE, PROFILES, DEFAULT_PROFILE)
+
+# lean 프로필에서 CDP(Network.setBlockedURLs)로 차단할 요청 (이미지, 폰트, 스타일시트, 미디어, 광고/추적)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css',
+    '*.mp4', '*.webm',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+    '*criteo.com*', '*criteo.net*', '*adservice.google.com*',
+]
+
+# lean 프로필에서 끄는 브라우저 설정 (이미지, 알림, 위치 등)
+LEAN_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+    'profile.default_content_setting_values.media_stream': 2,
+}
+
+# lean 프로필에서 추가하는 실행 옵션 (백그라운드 통신, 동기화, 번역 등 검색에 필요 없는 기능 끄기)
+LEAN_ARGUMENTS = [
+    '--blink-settings=imagesEnabled=false',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-features=Translate,MediaRouter,OptimizationHints',
+    '--mute-audio',
+    '--no-first-run',
+]
+
+_driver_path_lock = threading.Lock()
+_driver_path = None
+
+
+def chrome_driver_path(refresh=False):
+    """
+    크롬 드라이버 바이너리 경로
+
+    ChromeDriverManager().install()은 매번 최신 버전을 확인하므로 느리다.
+    한 번 설치한 경로는 프로세스 안에서는 변수로, 다음 실행부터는 DRIVER_PATH_FILE로 재사용한다.
+
+    Args:
+        refresh: True이면 기록된 경로를 무시하고 다시 설치 (크롬 업데이트로 버전이 맞지 않을 때)
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if not refresh:
+            if _driver_path and os.path.exists(_driver_path):
+                return _driver_path
+            try:
+                with open(DRIVER_PATH_FILE, encoding='utf-8') as f:
+                    path = f.read().strip()
+                if path and os.path.exists(path):
+                    _driver_path = path
+                    return path
+            except OSError:
+                pass
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(DRIVER_PATH_FILE), exist_ok=True)
+        with open(DRIVER_PATH_FILE, 'w', encoding='utf-8') as f:
+            f.write(path)
+        _driver_path = path
+        return path
+
+
+def build_options(profile=DEFAULT_PROFILE):
+    """
+    헤드리스 크롬 옵션 생성
+
+    Args:
+        profile: 'lean'이면 리소스 차단 설정과 불필요한 기능 끄기 옵션을 추가
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"지원하지 않는 브라우저 프로필입니다: {profile}")
+    options = webdriver.ChromeOptions()
+    # 필수 옵션 추가
+    options.add_argument('--headless')  # 헤드리스 모드
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')  # Windows 환경에서 필요
+    options.add_argument('--window-size=1920,1080')  # 윈도우 크기 설정
+    options.add_argument('--ignore-certificate-errors')  # 인증서 오류 무시
+    options.add_argument('--disable-extensions')  # 확장 프로그램 비활성화
+    options.add_argument('--disable-blink-features=AutomationControlled')  # 자동화 감지 방지
+
+    # User-Agent 설정
+    options.add_argument(f'user-agent={HEADERS["User-Agent"]}')
+
+    if profile == 'lean':
+        for argument in LEAN_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option('prefs', LEAN_PREFS)
+        # DOMContentLoaded까지만 기다림 (목록이 그려졌는지는 page_wait에서 확인)
+        options.page_load_strategy = 'eager'
+    return options
+
+
+def create_driver(profile=DEFAULT_PROFILE):
+    """새 헤드리스 크롬 드라이버 생성"""
+    options = build_options(profile)
+    try:
+        driver = webdriver.Chrome(service=Service(chrome_driver_path()), options=options)
+    except WebDriverException:
+        # 기록된 드라이버가 설치된 크롬 버전과 맞지 않으면 다시 설치하여 한 번 더 시도
+        driver = webdriver.Chrome(service=Service(chrome_driver_path(refresh=True)), options=options)
+
+    # 페이지 로드 타임아웃 설정
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+
+    # 암묵적 대기 시간 설정
+    driver.implicitly_wait(IMPLICIT_WAIT)
+
+    if profile == 'lean':
+        # 확장자/호스트 기준으로 요청 자체를 보내지 않음 (prefs로 막을 수 없는 폰트/스타일시트/추적 스크립트)
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
+
+class PooledDriver:
+    """풀에서 빌려준 드라이버와 사용 기록"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_loaded = 0
+        self.created_at = time.time()
+
+    def get(self, url):
+        """페이지 로드 (불러온 페이지 수 기록)"""
+        self.pages_loaded += 1
+        self.driver.get(url)
+
+    def is_alive(self):
+        """브라우저가 명령에 응답하는지 확인"""
+        try:
+            self.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class DriverPool:
+    """
+    헤드리스 크롬 드라이버 풀
+    - 최대 size개의 브라우저를 필요할 때 띄우고, 반납된 브라우저는 다음 검색에 재사용
+    - 빌려줄 때 응답이 없거나 max_pages를 넘게 사용한 브라우저는 종료 후 새로 생성
+    - 사용 중 오류가 난 브라우저는 반납 시 상태를 확인하여 응답이 없으면 폐기
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, max_pages=DEFAULT_MAX_PAGES, profile=DEFAULT_PROFILE, factory=None):
+        """
+        Args:
+            size: 최대 브라우저 수
+            max_pages: 브라우저 하나로 불러올 최대 페이지 수
+            profile: 브라우저 프로필 ('lean' 또는 'full')
+            factory: 드라이버 생성 함수 (지정하면 profile 대신 사용)
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.profile = profile
+        self.factory = factory or (lambda: create_driver(profile))
+        self._idle = queue.LifoQueue()  # 최근에 쓴 브라우저부터 재사용
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._all = set()
+        self._closed = False
+
+    def _create(self):
+        pooled = PooledDriver(self.factory())
+        with self._lock:
+            self._all.add(pooled)
+        return pooled
+
+    def _discard(self, pooled):
+        with self._lock:
+            self._all.discard(pooled)
+        pooled.quit()
+
+    def _checkout(self):
+        """쓸 수 있는 드라이버 꺼내기 (없거나 교체 대상이면 새로 생성)"""
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return self._create()
+            if pooled.pages_loaded < self.max_pages and pooled.is_alive():
+                return pooled
+            self._discard(pooled)
+
+    def acquire(self, timeout=None):
+        """
+        드라이버 대여 (모든 브라우저가 사용 중이면 반납될 때까지 대기)
+
+        Returns:
+            PooledDriver: 사용 후 release()로 반납해야 함
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 드라이버 풀입니다.")
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("사용 가능한 브라우저가 없습니다.")
+        try:
+            return self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, pooled, broken=False):
+        """드라이버 반납 (broken이면 상태를 확인하여 응답이 없을 때 폐기)"""
+        try:
+            if self._closed or (broken and not pooled.is_alive()):
+                self._discard(pooled)
+            else:
+                self._idle.put(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """with 문으로 드라이버를 빌리고 자동 반납"""
+        pooled = self.acquire(timeout)
+        broken = False
+        try:
+            yield pooled
+        except BaseException:
+            broken = True
+            raise
+        finally:
+            self.release(pooled, broken)
+
+    def warm_up(self, count=1):
+        """브라우저를 미리 띄워 두어 첫 검색의 시작 비용 제거"""
+        drivers = [self.acquire() for _ in range(min(count, self.size))]
+        for pooled in drivers:
+            self.release(pooled)
+
+    def close(self):
+        """모든 브라우저 종료"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            drivers = list(self._all)
+            self._all.clear()
+        for pooled in drivers:
+            pooled.quit()
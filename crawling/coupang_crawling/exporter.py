@@ -0,0 +1,94 @@
+"""
+파일 저장 모듈
+검색 결과 데이터프레임을 엑셀(xlsx), CSV, Parquet 파일로 저장합니다.
+append=True이면 새 파일을 만들지 않고 기존 누적 파일 끝에 행을 추가합니다.
+"""
+
+import os
+from datetime import datetime
+
+# 지원하는 저장 형식과 기본 확장자
+FORMATS = {
+    'xlsx': '.xlsx',
+    'csv': '.csv',
+    'parquet': '.parquet',
+}
+
+ROLLING_BASENAME = 'coupang_products'  # 누적 파일 이름 (확장자 제외)
+
+
+def infer_format(path, default='xlsx'):
+    """파일 확장자로 저장 형식 추정"""
+    extension = os.path.splitext(path)[1].lower()
+    for fmt, fmt_extension in FORMATS.items():
+        if extension == fmt_extension:
+            return fmt
+    return default
+
+
+def default_path(fmt, append=False):
+    """기본 저장 경로 (누적 파일이면 고정된 이름, 아니면 현재 날짜시간을 붙인 이름)"""
+    if append:
+        return ROLLING_BASENAME + FORMATS[fmt]
+    current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{ROLLING_BASENAME}_{current_time}{FORMATS[fmt]}"
+
+
+def _write_xlsx(df, path, append):
+    if not (append and os.path.exists(path)):
+        df.to_excel(path, index=False)
+        return
+
+    # 기존 통합 문서의 첫 시트 끝에 행 추가
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path)
+    worksheet = workbook.worksheets[0]
+    for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+        worksheet.append(list(row))
+    workbook.save(path)
+
+
+def _write_csv(df, path, append):
+    if append and os.path.exists(path):
+        # 이어 쓸 때는 머리글과 BOM 없이 추가
+        df.to_csv(path, mode='a', index=False, header=False, encoding='utf-8')
+    else:
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8 사용
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def _write_parquet(df, path, append):
+    """Parquet는 파일 끝에 이어 쓸 수 없으므로 기존 내용과 합쳐 임시 파일에 쓴 뒤 교체 (pyarrow 필요)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if append and os.path.exists(path):
+        table = pa.concat_tables([pq.read_table(path), table.cast(pq.read_schema(path))])
+    temp_path = path + '.tmp'
+    pq.write_table(table, temp_path)
+    os.replace(temp_path, path)
+
+
+_WRITERS = {
+    'xlsx': _write_xlsx,
+    'csv': _write_csv,
+    'parquet': _write_parquet,
+}
+
+
+def save_dataframe(df, path, fmt=None, append=False):
+    """
+    데이터프레임을 파일로 저장
+
+    Args:
+        df: 저장할 데이터프레임
+        path: 저장 경로
+        fmt: 'xlsx', 'csv', 'parquet' (None이면 확장자로 추정)
+        append: True이면 기존 파일 끝에 추가 (파일이 없으면 새로 생성)
+    """
+    fmt = fmt or infer_format(path)
+    if fmt not in _WRITERS:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {fmt}")
+    _WRITERS[fmt](df, path, append)
@@ -1,134 +1,130 @@
 import sys
-import os
-import pandas as pd
-from datetime import datetime
+import threading
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QLineEdit, QSpinBox, QPushButton, 
                               QTableWidget, QTableWidgetItem, QLabel, QMessageBox,
-                              QProgressBar)
+                              QProgressBar, QSplitter, QFileDialog, QTableView, QHeaderView,
+                              QComboBox, QCheckBox)
 from PySide6.QtCore import Qt, QThread, Signal
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from constants import (DEFAULT_WORKERS, MAX_WORKERS, MAX_PAGES, DEFAULT_PRICE_DB_PATH,
+                       SORT_ORDERS, DEFAULT_SORT, RESULT_CACHE_PATH, DEFAULT_CACHE_TTL)
+from driver_pool import DriverPool
+from product_parser import EXTRACT_MODES, DEFAULT_EXTRACT_MODE, extract_with_script, extract_with_lxml
+from search_queue import (SearchQueue, KeywordResult, parse_keywords, load_keywords,
+                          STATUS_WAITING, STATUS_CANCELLED, STATUS_CACHED)
+from selenium.common.exceptions import TimeoutException
+from page_wait import AdaptiveDelay, PageBlockedError, wait_for_results
+from paged_search import build_search_url, merge_unique
+from price_store import PriceStore
+from product_table_model import ProductTableModel
+from exporter import FORMATS, default_path, save_dataframe
+from result_cache import ResultCache
 import time
-import random
+from functools import partial
 
 class CoupangCrawler:
     """쿠팡 웹사이트 크롤링을 담당하는 클래스"""
     
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        self.setup_driver()
-
-    def setup_driver(self):
-        """Selenium WebDriver 초기화"""
+    def __init__(self, pooled, rate_limiter=None, politeness=None, extract_mode=DEFAULT_EXTRACT_MODE,
+                 sort=DEFAULT_SORT):
+        """
+        Args:
+            pooled: DriverPool에서 빌린 PooledDriver (브라우저 생성/종료는 풀에서 관리)
+            rate_limiter: 페이지 요청 전에 acquire()를 호출할 속도 제한기 (여러 브라우저가 공유)
+            politeness: 차단 감지 시 늘어나는 AdaptiveDelay (없으면 검색기마다 새로 생성)
+            extract_mode: 'script'(기본), 'lxml', 'element' 중 제품 목록 추출 방식
+            sort: 검색 결과 정렬 방식 (SORT_ORDERS의 키)
+        """
+        if extract_mode not in EXTRACT_MODES:
+            raise ValueError(f"지원하지 않는 추출 방식입니다: {extract_mode}")
+        self.pooled = pooled
+        self.driver = pooled.driver
+        self.extract_mode = extract_mode
+        self.sort = sort
+        self.rate_limiter = rate_limiter
+        self.politeness = politeness or AdaptiveDelay()
+
+    def _wait_turn(self):
+        """페이지 요청 전 속도 제한 및 예의 지연 대기"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        self.politeness.wait()
+
+    def _wait_for_results(self):
+        """
+        검색 결과가 준비될 때까지 대기 (준비된 제품 수 반환)
+        차단 페이지나 시간 초과는 예의 지연을 늘린 뒤 예외를 그대로 전달한다.
+        """
         try:
-            options = webdriver.ChromeOptions()
-            # 필수 옵션 추가
-            options.add_argument('--headless')  # 헤드리스 모드
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')  # Windows 환경에서 필요
-            options.add_argument('--window-size=1920,1080')  # 윈도우 크기 설정
-            options.add_argument('--ignore-certificate-errors')  # 인증서 오류 무시
-            options.add_argument('--disable-extensions')  # 확장 프로그램 비활성화
-            options.add_argument('--disable-blink-features=AutomationControlled')  # 자동화 감지 방지
-            
-            # User-Agent 설정
-            options.add_argument(f'user-agent={self.headers["User-Agent"]}')
-            
-            # 크롬 드라이버 자동 설치 및 초기화
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            
-            # 페이지 로드 타임아웃 설정
-            self.driver.set_page_load_timeout(30)
-            
-            # 암묵적 대기 시간 설정
-            self.driver.implicitly_wait(10)
-            
-            return True
-            
-        except Exception as e:
-            print(f"드라이버 초기화 중 오류 발생: {str(e)}")
-            if hasattr(self, 'driver') and self.driver:
-                self.driver.quit()
+            count = wait_for_results(self.driver)
+        except (TimeoutException, PageBlockedError):
+            self.politeness.throttled()
             raise
+        self.politeness.succeeded()
+        return count
 
-    def search_products(self, keyword, max_items=10):
-        """제품 검색 및 정보 수집"""
-        try:
-            # URL 인코딩
-            encoded_keyword = requests.utils.quote(keyword)
-            url = f'https://www.coupang.com/np/search?q={encoded_keyword}&channel=user&component=&eventCategory=SRP'
-            
-            # 페이지 로드 전 쿠키 및 캐시 삭제
-            self.driver.delete_all_cookies()
-            
-            # 페이지 로드
-            self.driver.get(url)
-            
-            # 페이지 로드 대기
-            time.sleep(random.uniform(2, 3))  # 랜덤 딜레이 증가
-
-            products = []
-            page_count = 1
-            
-            while len(products) < max_items and page_count <= 5:  # 최대 5페이지까지만 검색
-                try:
-                    # 제품 목록 대기
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "search-product"))
-                    )
-
-                    # 제품 정보 추출
-                    items = self.driver.find_elements(By.CLASS_NAME, "search-product")
-                    
-                    for item in items:
-                        if len(products) >= max_items:
-                            break
-
-                        try:
-                            product = self._extract_product_info(item)
-                            if product:
-                                products.append(product)
-                        except Exception as e:
-                            print(f"제품 정보 추출 중 오류: {str(e)}")
-                            continue
-
-                    # 다음 페이지 확인
-                    if len(products) < max_items:
-                        try:
-                            next_button = WebDriverWait(self.driver, 5).until(
-                                EC.presence_of_element_located((By.CLASS_NAME, "btn-next"))
-                            )
-                            if "disabled" not in next_button.get_attribute("class"):
-                                next_button.click()
-                                time.sleep(random.uniform(2, 3))
-                                page_count += 1
-                            else:
-                                break
-                        except Exception as e:
-                            print(f"다음 페이지 이동 중 오류: {str(e)}")
-                            break
-
-                except Exception as e:
-                    print(f"페이지 {page_count} 처리 중 오류: {str(e)}")
-                    break
-
-            return products[:max_items]
+    def search_page(self, keyword, page=1):
+        """
+        검색 결과 페이지 하나의 제품 목록 (페이지 주소를 직접 불러옴)
 
-        except Exception as e:
-            print(f"검색 중 오류 발생: {str(e)}")
+        결과가 없는 페이지(마지막 페이지 이후)는 빈 목록, 로드 실패는 예외
+        """
+        # 페이지 로드 전 쿠키 삭제
+        self.driver.delete_all_cookies()
+
+        # 페이지 로드
+        self._wait_turn()
+        self.pooled.get(build_search_url(keyword, page, self.sort))
+
+        # 제품 목록이 다 그려질 때까지 대기 (고정 대기 없이 실제 로드 시간만큼)
+        if not self._wait_for_results():
             return []
 
+        # 제품 정보 추출 (현재 페이지 전체를 한 번에)
+        return self._extract_page()
+
+    def search_products(self, keyword, max_items=10):
+        """
+        제품 검색 및 정보 수집 (브라우저 하나로 페이지를 차례대로 불러옴)
+
+        여러 브라우저로 페이지를 동시에 불러오려면 paged_search.search_keyword를 사용한다.
+        """
+        products = []
+        seen = set()
+        for page in range(1, MAX_PAGES + 1):  # 최대 MAX_PAGES 페이지까지만 검색
+            try:
+                page_products = self.search_page(keyword, page)
+            except Exception as e:
+                print(f"페이지 {page} 처리 중 오류: {str(e)}")
+                break
+            if not page_products:
+                break
+
+            # 여러 페이지에 나온 같은 제품은 한 번만
+            products.extend(merge_unique(page_products, seen)[:max_items - len(products)])
+            if len(products) >= max_items:
+                break
+        return products
+
+    def _extract_page(self):
+        """현재 페이지의 제품 목록 추출"""
+        if self.extract_mode == 'script':
+            return extract_with_script(self.driver)
+        if self.extract_mode == 'lxml':
+            return extract_with_lxml(self.driver)
+
+        # 제품마다 find_element를 호출하는 기존 방식 (요소가 없으면 암묵적 대기 시간만큼 기다림)
+        products = []
+        for item in self.driver.find_elements(By.CLASS_NAME, "search-product"):
+            try:
+                product = self._extract_product_info(item)
+                if product:
+                    products.append(product)
+            except Exception as e:
+                print(f"제품 정보 추출 중 오류: {str(e)}")
+        return products
+
     def _extract_product_info(self, item):
         """개별 제품 정보 추출"""
         try:
@@ -166,35 +162,113 @@ class CoupangCrawler:
             print(f"제품 정보 추출 중 오류: {str(e)}")
             return None
 
-    def close(self):
-        """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
-
 class CrawlerThread(QThread):
-    """크롤링 작업을 위한 스레드 클래스"""
+    """크롤링 작업을 위한 스레드 클래스 (여러 검색어를 작업 큐로 병렬 검색)"""
     
-    finished = Signal(list)  # 크롤링 완료 시그널
-    progress = Signal(int)   # 진행률 시그널
-    error = Signal(str)      # 에러 시그널
-
-    def __init__(self, keyword, max_items):
+    finished = Signal(list)         # 크롤링 완료 시그널 (전체 제품 목록)
+    progress = Signal(int)          # 진행률 시그널 (찾은 제품 수 / 목표 제품 수)
+    error = Signal(str)             # 에러 시그널
+    keyword_status = Signal(str, str)   # 검색어 상태 시그널 (검색어, 상태)
+    keyword_result = Signal(object)     # 검색어 하나의 검색 결과 시그널 (KeywordResult)
+    page_products = Signal(str, list)   # 페이지 하나에서 새로 찾은 제품 시그널 (검색어, 제품 목록)
+
+    def __init__(self, keywords, max_items, driver_pool, workers=DEFAULT_WORKERS, sort=DEFAULT_SORT,
+                 price_db_path=DEFAULT_PRICE_DB_PATH, cache_path=RESULT_CACHE_PATH):
         super().__init__()
-        self.keyword = keyword
+        self.keywords = keywords
         self.max_items = max_items
-        self.crawler = None
+        self.sort = sort
+        self.price_db_path = price_db_path  # 가격 기록 저장 경로, None이면 기록하지 않음
+        self.cache_path = cache_path        # 검색 결과 캐시 경로, None이면 캐시에 저장하지 않음
+        self.search_queue = SearchQueue(driver_pool, partial(CoupangCrawler, sort=sort), workers=workers)
+
+    def cancel(self):
+        """남은 검색어 취소"""
+        self.search_queue.cancel()
 
     def run(self):
-        """크롤링 실행"""
+        """크롤링 실행 (검색어마다 풀에서 브라우저를 빌려 쓰고 반납)"""
+        price_store = None
+        result_cache = None
         try:
-            self.crawler = CoupangCrawler()
-            products = self.crawler.search_products(self.keyword, self.max_items)
-            self.finished.emit(products)
+            # 진행률: 검색어별로 찾은 제품 수 (끝난 검색어는 목표를 다 채운 것으로 계산)
+            found = dict.fromkeys(self.keywords, 0)
+            target = self.max_items * len(self.keywords)
+            lock = threading.Lock()
+
+            def report_progress():
+                with lock:
+                    self.progress.emit(int(sum(found.values()) * 100 / target))
+
+            def on_page(keyword, page, products):
+                with lock:
+                    found[keyword] += len(products)
+                self.page_products.emit(keyword, products)
+                report_progress()
+            # SQLite 연결은 만든 스레드에서만 사용할 수 있으므로 작업 스레드에서 생성
+            if self.price_db_path:
+                price_store = PriceStore(self.price_db_path)
+            if self.cache_path:
+                result_cache = ResultCache(self.cache_path)
+
+            def on_result(result):
+                # 검색어가 끝날 때마다 가격 기록 저장소에 누적
+                if price_store and result.products:
+                    try:
+                        price_store.record(result.products, keyword=result.keyword)
+                    except Exception as e:
+                        print(f"가격 기록 저장 중 오류 발생: {str(e)}")
+                # 모든 페이지를 실패 없이 끝까지 검색한 결과만 캐시에 저장
+                # (페이지가 하나라도 실패했거나 취소된 검색어, 제품이 없는 검색어는 다음에 다시 검색)
+                if result_cache is not None and not result.error and result.products:
+                    try:
+                        result_cache.put(result.keyword, self.max_items, result.products, self.sort)
+                    except Exception as e:
+                        print(f"검색 결과 캐시 저장 중 오류 발생: {str(e)}")
+                self.keyword_result.emit(result)
+                with lock:
+                    found[result.keyword] = self.max_items
+                report_progress()
+
+            results = self.search_queue.run(
+                self.keywords, self.max_items,
+                on_result=on_result,
+                on_status=self.keyword_status.emit,
+                on_page=on_page,
+            )
+            self.finished.emit([
+                {"검색어": result.keyword, **product}
+                for result in results for product in result.products
+            ])
         except Exception as e:
             self.error.emit(str(e))
         finally:
-            if self.crawler:
-                self.crawler.close()
+            if price_store:
+                price_store.close()
+            if result_cache is not None:
+                result_cache.close()
+
+class ExportThread(QThread):
+    """검색 결과를 파일로 저장하는 스레드 (저장 중에도 GUI가 멈추지 않도록)"""
+
+    finished = Signal(str, float)   # 저장 완료 시그널 (저장 경로, 소요 시간)
+    error = Signal(str)             # 에러 시그널
+
+    def __init__(self, df, file_path, fmt, append=False):
+        super().__init__()
+        self.df = df
+        self.file_path = file_path
+        self.fmt = fmt
+        self.append = append
+
+    def run(self):
+        start_time = time.time()
+        try:
+            save_dataframe(self.df, self.file_path, self.fmt, append=self.append)
+            self.finished.emit(self.file_path, time.time() - start_time)
+        except Exception as e:
+            self.error.emit(str(e))
+
 
 class MainWindow(QMainWindow):
     """메인 윈도우 클래스"""
@@ -202,8 +276,36 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("쿠팡 제품 크롤러")
-        self.setMinimumSize(800, 600)
+        self.setMinimumSize(1000, 600)
         self.setup_ui()
+        
+        # 검색마다 브라우저를 새로 띄우지 않도록 프로그램이 실행되는 동안 유지하는 드라이버 풀
+        self.driver_pool = DriverPool(size=MAX_WORKERS)
+        # 첫 검색 전에 브라우저를 미리 띄워 둠 (실패하면 검색할 때 다시 시도)
+        threading.Thread(target=self._warm_up_pool, daemon=True).start()
+        self.crawler_thread = None
+        self.export_thread = None
+        # 같은 검색어를 다시 검색하면 브라우저 없이 바로 보여주는 검색 결과 캐시
+        self.result_cache = ResultCache(ttl=self.cache_hours.value() * 3600)
+
+    def _warm_up_pool(self):
+        try:
+            self.driver_pool.warm_up()
+        except Exception as e:
+            print(f"브라우저 미리 실행 중 오류 발생: {str(e)}")
+
+    def closeEvent(self, event):
+        """창을 닫을 때 남은 검색을 취소하고 풀의 브라우저 종료"""
+        if self.crawler_thread and self.crawler_thread.isRunning():
+            self.crawler_thread.cancel()
+            # 진행 중인 페이지가 끝나 스레드가 종료될 때까지 대기 (그 전에 풀을 닫으면 사용 중인 브라우저가 종료됨)
+            self.crawler_thread.wait()
+        # 저장 중인 파일이 잘리지 않도록 저장이 끝날 때까지 대기
+        if self.export_thread:
+            self.export_thread.wait()
+        self.driver_pool.close()
+        self.result_cache.close()
+        super().closeEvent(event)
 
     def setup_ui(self):
         """UI 구성"""
@@ -215,11 +317,16 @@ class MainWindow(QMainWindow):
         # 검색 영역
         search_layout = QHBoxLayout()
         
-        # 검색어 입력
+        # 검색어 입력 (여러 개는 쉼표로 구분)
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("검색어를 입력하세요")
+        self.search_input.setPlaceholderText("검색어를 입력하세요 (여러 개는 쉼표로 구분)")
         search_layout.addWidget(self.search_input)
 
+        # 검색어 파일 불러오기
+        self.load_button = QPushButton("검색어 파일")
+        self.load_button.clicked.connect(self.load_keyword_file)
+        search_layout.addWidget(self.load_button)
+
         # 검색 수량 설정
         self.item_count = QSpinBox()
         self.item_count.setRange(1, 100)
@@ -227,14 +334,49 @@ class MainWindow(QMainWindow):
         search_layout.addWidget(QLabel("검색 수량:"))
         search_layout.addWidget(self.item_count)
 
-        # 검색 버튼
+        # 동시 검색 브라우저 수
+        self.worker_count = QSpinBox()
+        self.worker_count.setRange(1, MAX_WORKERS)
+        self.worker_count.setValue(DEFAULT_WORKERS)
+        search_layout.addWidget(QLabel("동시 검색:"))
+        search_layout.addWidget(self.worker_count)
+
+        # 정렬 방식
+        self.sort_combo = QComboBox()
+        for sort, label in SORT_ORDERS.items():
+            self.sort_combo.addItem(label, sort)
+        self.sort_combo.setCurrentIndex(self.sort_combo.findData(DEFAULT_SORT))
+        search_layout.addWidget(self.sort_combo)
+
+        # 캐시 유효 기간 (0이면 캐시를 쓰지 않고 항상 새로 검색)
+        self.cache_hours = QSpinBox()
+        self.cache_hours.setRange(0, 168)
+        self.cache_hours.setValue(DEFAULT_CACHE_TTL // 3600)
+        self.cache_hours.setSuffix("시간")
+        self.cache_hours.valueChanged.connect(self.set_cache_ttl)
+        search_layout.addWidget(QLabel("캐시:"))
+        search_layout.addWidget(self.cache_hours)
+
+        # 검색 버튼 (캐시된 검색어는 바로 표시)
         self.search_button = QPushButton("검색")
-        self.search_button.clicked.connect(self.start_crawling)
+        self.search_button.clicked.connect(lambda: self.start_crawling())
         search_layout.addWidget(self.search_button)
 
+        # 새로 검색 버튼 (캐시를 무시하고 모든 검색어를 다시 검색)
+        self.refresh_button = QPushButton("새로 검색")
+        self.refresh_button.clicked.connect(lambda: self.start_crawling(force_refresh=True))
+        search_layout.addWidget(self.refresh_button)
+
+        # 저장 형식과 누적 파일 사용 여부
+        self.format_combo = QComboBox()
+        self.format_combo.addItems(list(FORMATS))
+        search_layout.addWidget(self.format_combo)
+        self.append_check = QCheckBox("누적 파일에 추가")
+        search_layout.addWidget(self.append_check)
+
         # 저장 버튼
-        self.save_button = QPushButton("엑셀로 저장")
-        self.save_button.clicked.connect(self.save_to_excel)
+        self.save_button = QPushButton("파일로 저장")
+        self.save_button.clicked.connect(self.save_to_file)
         self.save_button.setEnabled(False)
         search_layout.addWidget(self.save_button)
 
@@ -244,80 +386,188 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         layout.addWidget(self.progress_bar)
 
-        # 결과 테이블
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(5)
-        self.result_table.setHorizontalHeaderLabels(["제품명", "가격", "평점", "리뷰수", "링크"])
-        layout.addWidget(self.result_table)
+        splitter = QSplitter(Qt.Horizontal)
+
+        # 검색어별 상태 테이블
+        self.status_table = QTableWidget()
+        self.status_table.setColumnCount(4)
+        self.status_table.setHorizontalHeaderLabels(["검색어", "상태", "제품 수", "소요 시간"])
+        splitter.addWidget(self.status_table)
+
+        # 결과 테이블 (페이지마다 도착한 제품을 끝에 추가하는 모델/뷰 구조)
+        self.result_model = ProductTableModel(self)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
+        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.result_table.horizontalHeader().setStretchLastSection(True)
+        # 행 높이를 고정하여 행이 늘어나도 높이 계산을 생략
+        self.result_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.result_table.verticalHeader().setDefaultSectionSize(24)
+        splitter.addWidget(self.result_table)
+        splitter.setSizes([300, 700])
+        layout.addWidget(splitter)
 
         # 상태 표시줄
         self.statusBar().showMessage("준비됨")
 
-    def start_crawling(self):
-        """크롤링 시작"""
-        keyword = self.search_input.text().strip()
-        if not keyword:
+    def load_keyword_file(self):
+        """한 줄에 검색어 하나씩 적힌 텍스트 파일을 불러와 검색어 입력란에 채움"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "검색어 파일 열기", "", "Text Files (*.txt);;All Files (*)")
+        if not file_path:
+            return
+        try:
+            keywords = load_keywords(file_path)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"검색어 파일을 읽는 중 오류가 발생했습니다.\n{str(e)}")
+            return
+        self.search_input.setText(", ".join(keywords))
+        self.statusBar().showMessage(f"검색어 {len(keywords)}개를 불러왔습니다.")
+
+    def set_cache_ttl(self, hours):
+        """캐시 유효 기간 변경"""
+        self.result_cache.ttl = hours * 3600
+
+    def start_crawling(self, force_refresh=False):
+        """
+        크롤링 시작
+
+        Args:
+            force_refresh: True이면 캐시를 무시하고 모든 검색어를 다시 검색
+        """
+        keywords = parse_keywords(self.search_input.text())
+        if not keywords:
             QMessageBox.warning(self, "경고", "검색어를 입력하세요.")
             return
 
         self.search_button.setEnabled(False)
+        self.refresh_button.setEnabled(False)
         self.save_button.setEnabled(False)
         self.progress_bar.setValue(0)
-        self.result_table.setRowCount(0)
+        self.result_model.clear()
         self.statusBar().showMessage("크롤링 중...")
 
+        # 검색어별 상태 초기화
+        self.status_rows = {keyword: row for row, keyword in enumerate(keywords)}
+        self.status_table.setRowCount(len(keywords))
+        for row, keyword in enumerate(keywords):
+            self.status_table.setItem(row, 0, QTableWidgetItem(keyword))
+            self.status_table.setItem(row, 1, QTableWidgetItem(STATUS_WAITING))
+        self.total_keywords = len(keywords)
+        self.finished_keywords = 0
+        self.product_total = 0
+        self.cached_keywords = 0
+        self.start_time = time.time()
+
+        # 캐시에 있는 검색어는 바로 표시하고 나머지만 검색
+        max_items = self.item_count.value()
+        sort = self.sort_combo.currentData()
+        misses = []
+        for keyword in keywords:
+            cached = None if force_refresh else self.result_cache.get(keyword, max_items, sort)
+            if cached is None:
+                misses.append(keyword)
+                continue
+            self.cached_keywords += 1
+            self.append_products(keyword, cached.products)
+            self.add_keyword_result(KeywordResult(keyword, cached.products, 0.0, cached_at=cached.cached_at))
+        if not misses:
+            self.crawling_finished([])
+            return
+
         # 크롤링 스레드 시작
-        self.crawler_thread = CrawlerThread(keyword, self.item_count.value())
-        self.crawler_thread.finished.connect(self.update_table)
+        self.crawler_thread = CrawlerThread(misses, max_items, self.driver_pool,
+                                            workers=self.worker_count.value(), sort=sort,
+                                            cache_path=self.result_cache.path)
+        self.crawler_thread.keyword_status.connect(self.update_keyword_status)
+        self.crawler_thread.keyword_result.connect(self.add_keyword_result)
+        self.crawler_thread.page_products.connect(self.append_products)
+        self.crawler_thread.progress.connect(self.progress_bar.setValue)
+        self.crawler_thread.finished.connect(self.crawling_finished)
         self.crawler_thread.error.connect(self.show_error)
         self.crawler_thread.start()
 
-    def update_table(self, products):
-        """테이블 업데이트"""
-        self.result_table.setRowCount(len(products))
-        
-        for row, product in enumerate(products):
-            self.result_table.setItem(row, 0, QTableWidgetItem(product["제품명"]))
-            self.result_table.setItem(row, 1, QTableWidgetItem(product["가격"]))
-            self.result_table.setItem(row, 2, QTableWidgetItem(product["평점"]))
-            self.result_table.setItem(row, 3, QTableWidgetItem(product["리뷰수"]))
-            self.result_table.setItem(row, 4, QTableWidgetItem(product["링크"]))
-
-        self.result_table.resizeColumnsToContents()
+    def update_keyword_status(self, keyword, status):
+        """검색어 상태 표시"""
+        self.status_table.setItem(self.status_rows[keyword], 1, QTableWidgetItem(status))
+
+    def append_products(self, keyword, products):
+        """페이지 하나에서 찾은 제품을 결과 테이블 끝에 추가"""
+        first_batch = self.result_model.rowCount() == 0
+        self.result_model.append_products(keyword, products)
+        # 열 너비는 첫 페이지 기준으로 한 번만 맞춤 (이후에는 추가된 행만 그림)
+        if first_batch:
+            self.result_table.resizeColumnsToContents()
+
+    def add_keyword_result(self, result):
+        """검색어 하나의 완료 상태와 처리량 표시"""
+        row = self.status_rows[result.keyword]
+        if result.cached_at:
+            # 캐시에서 가져온 결과는 저장된 시각 표시
+            self.status_table.setItem(row, 1, QTableWidgetItem(f"{STATUS_CACHED} ({result.cached_at:%m-%d %H:%M})"))
+        self.status_table.setItem(row, 2, QTableWidgetItem(str(len(result.products))))
+        self.status_table.setItem(row, 3, QTableWidgetItem(f"{result.elapsed:.1f}초"))
+        if result.error and result.error != STATUS_CANCELLED:
+            self.status_table.item(row, 1).setToolTip(result.error)
+
+        self.finished_keywords += 1
+        self.product_total += len(result.products)
+        elapsed = time.time() - self.start_time
+        per_minute = self.finished_keywords * 60 / elapsed if elapsed > 0 else 0
+        self.statusBar().showMessage(
+            f"크롤링 중... 검색어 {self.finished_keywords}/{self.total_keywords}개 완료 | "
+            f"제품 {self.product_total}개 | 분당 {per_minute:.1f}개 검색어"
+        )
+
+    def crawling_finished(self, products):
+        """전체 검색 완료 (products는 새로 검색한 제품, 표에는 캐시된 제품도 함께 있음)"""
+        self.status_table.resizeColumnsToContents()
         self.search_button.setEnabled(True)
-        self.save_button.setEnabled(True)
+        self.refresh_button.setEnabled(True)
+        product_count = self.result_model.rowCount()
+        self.save_button.setEnabled(product_count > 0)
         self.progress_bar.setValue(100)
-        self.statusBar().showMessage("크롤링 완료")
+        elapsed = time.time() - self.start_time
+        message = f"크롤링 완료 | 검색어 {self.total_keywords}개, 제품 {product_count}개 | 소요 시간: {elapsed:.1f}초"
+        if self.cached_keywords:
+            message += f" | 캐시 사용 {self.cached_keywords}개"
+        self.statusBar().showMessage(message)
+
+    def save_to_file(self):
+        """검색 결과를 선택한 형식의 파일로 저장 (작업 스레드에서 실행)"""
+        if self.export_thread and self.export_thread.isRunning():
+            return
+        fmt = self.format_combo.currentText()
+        append = self.append_check.isChecked()
+        # 누적 파일이면 고정된 파일 끝에 추가, 아니면 현재 날짜시간으로 새 파일 생성
+        file_path = default_path(fmt, append=append)
 
-    def save_to_excel(self):
-        """엑셀 파일로 저장"""
-        try:
-            # 현재 날짜시간으로 파일명 생성
-            current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"coupang_products_{current_time}.xlsx"
-
-            # 테이블 데이터를 데이터프레임으로 변환
-            data = []
-            for row in range(self.result_table.rowCount()):
-                row_data = {}
-                for col in range(self.result_table.columnCount()):
-                    item = self.result_table.item(row, col)
-                    header = self.result_table.horizontalHeaderItem(col).text()
-                    row_data[header] = item.text() if item else ""
-                data.append(row_data)
-
-            df = pd.DataFrame(data)
-            df.to_excel(filename, index=False)
-            
-            QMessageBox.information(self, "알림", f"파일이 저장되었습니다.\n{filename}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"파일 저장 중 오류가 발생했습니다.\n{str(e)}")
+        # 검색 결과 데이터셋의 복사본을 넘기므로 저장 중 새 검색을 시작해도 안전
+        df = self.result_model.dataset().to_frame()
+
+        self.save_button.setEnabled(False)
+        self.statusBar().showMessage("파일 저장 중...")
+        self.export_thread = ExportThread(df, file_path, fmt, append=append)
+        self.export_thread.finished.connect(self.export_finished)
+        self.export_thread.error.connect(self.export_failed)
+        self.export_thread.start()
+
+    def export_finished(self, file_path, elapsed):
+        """파일 저장 완료"""
+        self.save_button.setEnabled(self.result_model.rowCount() > 0)
+        self.statusBar().showMessage(f"저장 완료: {file_path} | 소요 시간: {elapsed:.2f}초")
+        QMessageBox.information(self, "알림", f"파일이 저장되었습니다.\n{file_path}")
+
+    def export_failed(self, error_message):
+        """파일 저장 실패"""
+        self.save_button.setEnabled(self.result_model.rowCount() > 0)
+        self.statusBar().showMessage("저장 실패")
+        QMessageBox.critical(self, "오류", f"파일 저장 중 오류가 발생했습니다.\n{error_message}")
 
     def show_error(self, error_message):
         """에러 메시지 표시"""
         QMessageBox.critical(self, "오류", f"크롤링 중 오류가 발생했습니다.\n{error_message}")
         self.search_button.setEnabled(True)
+        self.refresh_button.setEnabled(True)
         self.statusBar().showMessage("오류 발생")
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""
+페이지 준비 감지 모듈
+고정된 sleep 대신 검색 결과 목록이 실제로 다 그려졌는지 확인하여 기다립니다.
+- 준비 판단: 제품 수가 일정 시간 동안 변하지 않음 (결과가 없으면 문서 로드 완료까지 확인)
+- 예의 지연: 평소에는 기다리지 않고, 차단/시간 초과가 감지될 때만 늘렸다가 정상 응답이 오면 다시 줄임
+- 요청 간격: 모든 브라우저의 페이지 요청을 1/rate초 간격의 차례로 나눠 줌
+"""
+
+import threading
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from constants import READY_TIMEOUT, STABLE_INTERVAL, POLL_INTERVAL, MIN_DELAY, MAX_DELAY, THROTTLE_DELAY
+
+# 한 번의 스크립트 실행으로 문서 상태, 제품 수, 제목을 읽음
+PAGE_STATE_SCRIPT = """
+return [document.readyState, document.querySelectorAll('.search-product').length, document.title];
+"""
+
+# 차단 페이지 제목에 나타나는 문구
+BLOCKED_TITLES = ('Access Denied', '429', 'Too Many Requests')
+
+
+def is_blocked(title):
+    """차단/요청 제한 페이지인지 여부"""
+    return any(text in (title or '') for text in BLOCKED_TITLES)
+
+
+class PageBlockedError(Exception):
+    """사이트가 요청을 차단한 경우"""
+
+
+class _ResultsReady:
+    """WebDriverWait 조건: 제품 수가 STABLE_INTERVAL 동안 변하지 않으면 제품 수 반환"""
+
+    def __init__(self, stable_interval):
+        self.stable_interval = stable_interval
+        self.last_count = None
+        self.stable_since = None
+
+    def __call__(self, driver):
+        ready_state, count, title = driver.execute_script(PAGE_STATE_SCRIPT)
+        if is_blocked(title):
+            raise PageBlockedError(title)
+
+        now = time.monotonic()
+        if count != self.last_count:
+            self.last_count = count
+            self.stable_since = now
+            return False
+        # 목록이 비어 있으면 문서 로드가 끝난 뒤에만 결과 없음으로 판단
+        if not count and ready_state != 'complete':
+            return False
+        if now - self.stable_since >= self.stable_interval:
+            return count if count else True
+        return False
+
+
+def wait_for_results(driver, timeout=READY_TIMEOUT, stable_interval=STABLE_INTERVAL):
+    """
+    검색 결과 목록이 준비될 때까지 대기
+
+    Returns:
+        int: 준비된 제품 수 (결과가 없으면 0)
+
+    Raises:
+        TimeoutException: timeout 안에 준비되지 않은 경우
+        PageBlockedError: 차단 페이지가 표시된 경우
+    """
+    result = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+        _ResultsReady(stable_interval)
+    )
+    return 0 if result is True else result
+
+
+class AdaptiveDelay:
+    """
+    차단 상황에 따라 늘었다 줄었다 하는 요청 전 지연 시간
+    여러 브라우저가 공유하며, 한 곳에서 차단이 감지되면 모두 천천히 요청한다.
+    """
+
+    def __init__(self, min_delay=MIN_DELAY, max_delay=MAX_DELAY, throttle_delay=THROTTLE_DELAY):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.throttle_delay = throttle_delay  # 처음 차단되었을 때의 지연 시간
+        self.delay = min_delay
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            delay = self.delay
+        if delay > 0:
+            time.sleep(delay)
+
+    def throttled(self):
+        """차단/시간 초과 감지: 지연 시간을 두 배로 (처음이면 throttle_delay)"""
+        with self.lock:
+            self.delay = min(self.max_delay, max(self.throttle_delay, self.delay * 2))
+
+    def succeeded(self):
+        """정상 응답: 지연 시간을 절반으로 줄여 점차 원래대로"""
+        with self.lock:
+            self.delay = self.delay / 2 if self.delay / 2 >= self.throttle_delay / 4 else self.min_delay
+
+
+class PageRateLimiter:
+    """
+    여러 브라우저가 공유하는 페이지 요청 간격 제한기
+    acquire()를 호출한 순서대로 1/rate초 간격의 요청 시각을 배정하고 그 시각까지 기다린다.
+    """
+
+    def __init__(self, rate):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.interval = 1 / rate
+        self.next_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """자기 차례의 요청 시각까지 대기"""
+        with self.lock:
+            now = time.monotonic()
+            start_at = max(now, self.next_at)
+            self.next_at = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
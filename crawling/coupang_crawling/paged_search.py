@@ -0,0 +1,143 @@
+"""
+페이지 병렬 검색 모듈
+검색 결과 페이지 N의 주소를 직접 만들어, 한 검색어의 여러 페이지를 풀의 브라우저들로 동시에 불러옵니다.
+결과는 페이지 순서대로 합치면서 제품 링크 기준으로 중복을 제거하고,
+max_items개를 채우면 아직 시작하지 않은 페이지 요청은 취소합니다.
+실패한 페이지와 취소 여부는 결과에 함께 담아, 일부만 검색된 결과를 끝까지 검색한 결과와 구분할 수 있게 합니다.
+"""
+
+import math
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, NamedTuple
+from urllib.parse import quote
+
+from constants import SEARCH_URL, PAGE_SIZE, MAX_PAGES, DEFAULT_PAGE_WORKERS, DEFAULT_SORT
+from product_parser import product_key
+
+
+class KeywordPages(NamedTuple):
+    """검색어 하나의 페이지 검색 결과"""
+    products: List[dict]         # 페이지 순서대로 합친 제품
+    page_errors: Dict[int, str]  # 실패한 페이지 번호: 오류 메시지
+    cancelled: bool = False      # 남은 페이지가 있는데 취소되었는지 여부
+
+    @property
+    def complete(self):
+        """모든 페이지를 실패 없이 끝까지 검색했는지 여부"""
+        return not self.page_errors and not self.cancelled
+
+
+class _Cancelled(Exception):
+    """취소되어 요청하지 않은 페이지"""
+
+
+def build_search_url(keyword, page=1, sort=DEFAULT_SORT):
+    """검색어, 페이지 번호, 정렬 방식으로 검색 결과 주소 생성"""
+    return SEARCH_URL.format(keyword=quote(keyword), page=page, list_size=PAGE_SIZE, sort=sort)
+
+
+def merge_unique(products, seen):
+    """seen에 없는 제품만 골라 반환 (seen에 제품 키 추가)"""
+    unique = []
+    for product in products:
+        key = product_key(product["링크"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(product)
+    return unique
+
+
+def search_keyword(driver_pool, crawler_factory, keyword, max_items, workers=DEFAULT_PAGE_WORKERS,
+                   on_page=None, cancelled=None):
+    """
+    검색어 하나의 여러 페이지를 동시에 검색
+
+    필요한 페이지 수(max_items / PAGE_SIZE)만큼 먼저 요청하고, 중복 제거 후 부족하면 다음 페이지를 이어서 요청한다.
+    빈 페이지가 나오면 마지막 페이지로 보고 그 뒤 페이지는 요청하지 않는다.
+    1페이지가 실패하면 (차단 등) 뒤 페이지도 실패할 것이므로 더 요청하지 않는다.
+
+    Args:
+        driver_pool: 페이지마다 브라우저를 빌려 줄 DriverPool
+        crawler_factory: PooledDriver를 받아 search_page(keyword, page)를 가진 검색기를 만드는 함수
+        workers: 동시에 불러올 최대 페이지 수
+        on_page: 페이지 하나가 합쳐질 때마다 (페이지 번호, 새 제품 목록)으로 호출
+        cancelled: 설정되면 남은 페이지를 요청하지 않는 threading.Event
+
+    Returns:
+        KeywordPages: 페이지 순서대로 합친 최대 max_items개의 제품, 실패한 페이지, 취소 여부
+    """
+    stop = threading.Event()
+
+    def fetch(page):
+        if cancelled and cancelled.is_set():
+            raise _Cancelled
+        if stop.is_set():
+            return None
+        with driver_pool.driver() as pooled:
+            # 브라우저를 기다리는 동안 목표 개수를 채웠으면 요청하지 않음
+            if stop.is_set():
+                return None
+            return crawler_factory(pooled).search_page(keyword, page)
+
+    products = []
+    seen = set()
+    last_page = min(MAX_PAGES, max(1, math.ceil(max_items / PAGE_SIZE)))
+    end_page = MAX_PAGES + 1     # 빈 페이지가 나온 페이지 번호
+    next_page = 1                # 다음에 요청할 페이지
+    merge_page = 1               # 다음에 합칠 페이지 (페이지 순서 유지)
+    completed = {}
+    page_errors = {}
+    interrupted = False          # 취소로 검색하지 못한 페이지가 있는지 여부
+    running = set()
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        while not stop.is_set():
+            while len(running) < workers and next_page <= min(last_page, end_page - 1):
+                future = executor.submit(fetch, next_page)
+                future.page = next_page
+                running.add(future)
+                next_page += 1
+            if not running:
+                break
+
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    completed[future.page] = future.result()
+                except _Cancelled:
+                    interrupted = True
+                    completed[future.page] = None
+                except Exception as e:
+                    print(f"'{keyword}' {future.page}페이지 처리 중 오류: {str(e)}")
+                    page_errors[future.page] = str(e) or type(e).__name__
+                    completed[future.page] = None
+                    if future.page == 1:
+                        stop.set()
+
+            while merge_page in completed:
+                page_products = completed.pop(merge_page)
+                if page_products is not None and not page_products:
+                    end_page = min(end_page, merge_page)
+                new_products = merge_unique(page_products or [], seen)[:max_items - len(products)]
+                products.extend(new_products)
+                if on_page and new_products:
+                    on_page(merge_page, new_products)
+                merge_page += 1
+                if len(products) >= max_items:
+                    stop.set()
+                    break
+
+            # 요청한 페이지를 모두 합쳤는데도 부족하면 다음 페이지 추가
+            if merge_page > last_page and last_page < min(MAX_PAGES, end_page - 1):
+                last_page += 1
+            if cancelled and cancelled.is_set() and not stop.is_set():
+                # 남은 페이지가 있을 때만 취소된 것으로 봄
+                interrupted = interrupted or bool(running) or next_page <= min(last_page, end_page - 1)
+                break
+    finally:
+        # 목표 개수를 채웠거나 취소된 경우 대기 중인 페이지 요청은 취소 (진행 중인 요청은 결과를 버림)
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+    return KeywordPages(products, page_errors, interrupted)
@@ -0,0 +1,175 @@
+"""
+쿠팡 제품 가격 기록 저장 모듈
+검색할 때마다 제품별 가격/평점/리뷰수를 숫자로 변환하여 SQLite에 누적합니다.
+제품 테이블에 최근 가격과 직전 가격을 함께 갱신해 두므로 가격 하락 조회는 관측 기록 전체를 훑지 않습니다.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+from constants import DEFAULT_PRICE_DB_PATH
+from product_parser import product_key
+
+OBSERVATION_COLUMNS = ['product_key', 'observed_at', 'keyword', 'price', 'rating', 'review_count']
+DROP_COLUMNS = ['product_key', 'name', 'link', 'previous_price', 'last_price', 'drop_rate', 'last_seen']
+
+
+def _to_number(text, number_type=float):
+    """'12,300', '(1,234)' 같은 문자열을 숫자로 변환 (변환할 수 없으면 None, 예: '평점 없음')"""
+    if text is None:
+        return None
+    try:
+        return number_type(str(text).replace(',', '').strip('() '))
+    except ValueError:
+        return None
+
+
+def normalize_product(product):
+    """
+    검색 결과 제품 딕셔너리의 문자열 값을 숫자로 변환
+
+    Returns:
+        tuple: (제품 키, 제품명, 링크, 가격, 평점, 리뷰수)
+    """
+    return (
+        product_key(product["링크"]),
+        product["제품명"],
+        product["링크"],
+        _to_number(product["가격"]),
+        _to_number(product["평점"]),
+        _to_number(product["리뷰수"], int),
+    )
+
+
+class PriceStore:
+    """
+    제품 가격 기록 저장소
+    - products: 제품 키 기준 최신 정보 (최근 가격, 직전 가격)
+    - observations: 기본 키 (product_key, observed_at)로 제품별 기간 조회
+    """
+
+    def __init__(self, path=DEFAULT_PRICE_DB_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS products (
+                product_key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                link TEXT NOT NULL,
+                last_price REAL,
+                previous_price REAL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS observations (
+                product_key TEXT NOT NULL,
+                observed_at TEXT NOT NULL,
+                keyword TEXT,
+                price REAL,
+                rating REAL,
+                review_count INTEGER,
+                PRIMARY KEY (product_key, observed_at)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_observations_observed_at ON observations (observed_at)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_products_last_seen ON products (last_seen)')
+        self.conn.commit()
+
+    def record(self, products, keyword=None, observed_at=None):
+        """
+        한 번의 검색 결과를 저장 (하나의 트랜잭션으로 일괄 반영)
+
+        같은 제품을 같은 시각에 다시 저장하면 덮어쓰고, 더 나중 시각이면 최근 가격을 직전 가격으로 옮긴다.
+
+        Args:
+            products: 검색 결과 제품 딕셔너리 목록
+            keyword: 검색어
+            observed_at: 관측 시각 (기본값: 현재 시각)
+
+        Returns:
+            int: 저장한 관측 수
+        """
+        observed_at = (observed_at or datetime.now()).isoformat(timespec='seconds')
+        rows = [normalize_product(product) for product in products if product.get("링크")]
+        with self.conn:
+            self.conn.executemany('''
+                INSERT INTO products (product_key, name, link, last_price, previous_price, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, NULL, ?, ?)
+                ON CONFLICT (product_key) DO UPDATE SET
+                    name = excluded.name,
+                    link = excluded.link,
+                    previous_price = CASE WHEN excluded.last_seen > products.last_seen
+                                          THEN products.last_price ELSE products.previous_price END,
+                    last_price = excluded.last_price,
+                    last_seen = MAX(products.last_seen, excluded.last_seen)
+                WHERE excluded.last_seen >= products.last_seen
+            ''', [(key, name, link, price, observed_at, observed_at) for key, name, link, price, _, _ in rows])
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO observations (product_key, observed_at, keyword, price, rating, review_count) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(key, observed_at, keyword, price, rating, reviews) for key, _, _, price, rating, reviews in rows]
+            )
+        return len(rows)
+
+    def _query(self, sql, params, columns):
+        import pandas as pd
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return pd.DataFrame.from_records(rows, columns=columns)
+
+    def price_history(self, link_or_key, start=None, end=None):
+        """제품 하나의 기간별 관측 기록 (start, end 포함, 생략 시 전체 기간)"""
+        return self._query(
+            f'SELECT {", ".join(OBSERVATION_COLUMNS)} FROM observations '
+            'WHERE product_key = ? AND observed_at BETWEEN ? AND ? ORDER BY observed_at',
+            (product_key(link_or_key), _to_time_text(start) or '0000', _to_time_text(end, end=True) or '9999'),
+            OBSERVATION_COLUMNS,
+        )
+
+    def price_drops(self, since=None, min_drop_rate=0.0, limit=100):
+        """
+        최근 관측 가격이 직전 관측보다 내려간 제품 (하락률 큰 순)
+
+        Args:
+            since: 이 시각 이후에 관측된 제품만 (생략 시 전체)
+            min_drop_rate: 최소 하락률 (예: 0.1이면 10% 이상 하락)
+            limit: 최대 제품 수
+        """
+        return self._query(
+            'SELECT product_key, name, link, previous_price, last_price, '
+            '(previous_price - last_price) / previous_price AS drop_rate, last_seen '
+            'FROM products '
+            'WHERE last_seen >= ? AND last_price < previous_price '
+            'AND (previous_price - last_price) / previous_price >= ? '
+            'ORDER BY drop_rate DESC LIMIT ?',
+            (_to_time_text(since) or '0000', min_drop_rate, limit),
+            DROP_COLUMNS,
+        )
+
+    def product_count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM products').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def _to_time_text(value, end=False):
+    """datetime/date/문자열을 observed_at과 비교할 수 있는 문자열로 변환 (날짜만 주면 end일 때 그날 끝까지)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(timespec='seconds')
+    text = value.isoformat() if hasattr(value, 'isoformat') else str(value)
+    if end and len(text) == 10:
+        return text + 'T23:59:59'
+    return text
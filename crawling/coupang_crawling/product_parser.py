@@ -0,0 +1,113 @@
+"""
+검색 결과 추출 모듈
+검색 결과 페이지의 제품 목록을 한 번에 추출합니다.
+- script: execute_script 한 번으로 브라우저 안에서 전체 목록을 읽어 반환
+- lxml: driver.page_source를 받아 lxml로 파싱
+요소마다 find_element를 호출하지 않으므로 WebDriver 왕복과 암묵적 대기(없는 평점 등)가 발생하지 않습니다.
+"""
+
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+BASE_URL = 'https://www.coupang.com'
+
+# 추출 방식 ('element'는 제품마다 find_element를 호출하는 기존 방식)
+EXTRACT_MODES = ('script', 'lxml', 'element')
+DEFAULT_EXTRACT_MODE = 'script'
+
+# 검색 결과 목록을 한 번에 읽어 [{name, price, rating, reviewCount, link}, ...]로 반환하는 스크립트
+EXTRACT_SCRIPT = """
+const text = (item, selector) => {
+    const element = item.querySelector(selector);
+    return element ? element.textContent.trim() : null;
+};
+return Array.from(document.querySelectorAll('.search-product')).map(item => {
+    const link = item.querySelector('.search-product-link');
+    return {
+        name: text(item, '.name'),
+        price: text(item, '.price-value'),
+        rating: text(item, '.rating'),
+        reviewCount: text(item, '.rating-total-count'),
+        link: link ? link.href : null,
+    };
+});
+"""
+
+
+def product_key(link):
+    """
+    제품 링크에서 추적용 파라미터를 뺀 제품 식별 키 (예: '/vp/products/123?itemId=4&vendorItemId=5')
+
+    같은 제품도 검색 페이지/순위에 따라 rank, searchId 등 파라미터가 달라지므로 중복 제거에는 이 키를 사용한다.
+    """
+    parts = urlsplit(link)
+    query = parse_qs(parts.query)
+    ids = [f"{name}={query[name][0]}" for name in ('itemId', 'vendorItemId') if name in query]
+    return parts.path + ('?' + '&'.join(ids) if ids else '')
+
+
+def to_product(name, price, rating, review_count, link):
+    """
+    추출한 문자열을 제품 정보 딕셔너리로 변환
+
+    제품명/가격/링크 중 하나라도 없으면 None (광고 등 제품이 아닌 항목)
+    """
+    if not name or not price or not link:
+        return None
+    return {
+        "제품명": name,
+        "가격": price.replace(",", ""),
+        "평점": rating or "평점 없음",
+        "리뷰수": review_count.strip("()") if review_count else "0",
+        "링크": link,
+    }
+
+
+def extract_with_script(driver):
+    """execute_script 한 번으로 현재 페이지의 제품 목록 추출"""
+    items = driver.execute_script(EXTRACT_SCRIPT) or []
+    products = (
+        to_product(item['name'], item['price'], item['rating'], item['reviewCount'], item['link'])
+        for item in items
+    )
+    return [product for product in products if product]
+
+
+def _class_xpath(class_name):
+    """class 속성에 class_name이 포함된 요소를 찾는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _first_text(item, class_name):
+    found = item.xpath(f".//*[{_class_xpath(class_name)}]")
+    return found[0].text_content().strip() if found else None
+
+
+def parse_product_list(html, base_url=BASE_URL):
+    """
+    검색 결과 HTML에서 제품 목록 추출 (lxml)
+
+    Args:
+        html: 검색 결과 페이지 HTML (driver.page_source 등)
+        base_url: 상대 경로 링크를 절대 경로로 바꿀 기준 주소
+    """
+    from lxml import html as lxml_html
+
+    tree = lxml_html.fromstring(html)
+    products = []
+    for item in tree.xpath(f"//*[{_class_xpath('search-product')}]"):
+        links = item.xpath(f".//a[{_class_xpath('search-product-link')}]/@href")
+        product = to_product(
+            _first_text(item, 'name'),
+            _first_text(item, 'price-value'),
+            _first_text(item, 'rating'),
+            _first_text(item, 'rating-total-count'),
+            urljoin(base_url, links[0]) if links else None,
+        )
+        if product:
+            products.append(product)
+    return products
+
+
+def extract_with_lxml(driver):
+    """driver.page_source를 lxml로 파싱하여 제품 목록 추출"""
+    return parse_product_list(driver.page_source, driver.current_url)
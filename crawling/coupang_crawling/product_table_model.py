@@ -0,0 +1,78 @@
+"""
+검색 결과 테이블 모델 모듈
+페이지 단위로 도착하는 제품을 끝에 덧붙이기만 하는 Qt 모델입니다.
+추가된 행만 뷰에 알리므로 결과가 늘어나도 기존 행을 다시 그리지 않습니다.
+값은 ProductDataset에 숫자로 보관하고 표시할 때만 문자열로 변환합니다.
+"""
+
+import math
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from dataset import ProductDataset
+
+# 표에 표시하는 열
+COLUMNS = ["검색어", "제품명", "가격", "평점", "리뷰수", "링크"]
+NUMERIC_COLUMNS = {"가격", "평점", "리뷰수"}
+
+
+def _format_number(value, text_format, missing=""):
+    return missing if math.isnan(value) else format(value, text_format)
+
+
+class ProductTableModel(QAbstractTableModel):
+    """ProductDataset을 (검색어, 제품명, 가격, 평점, 리뷰수, 링크) 표로 보여주는 추가 전용 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dataset = ProductDataset()
+        self._columns = [
+            lambda row: self._dataset.keywords[row],
+            lambda row: self._dataset.names[row],
+            lambda row: _format_number(self._dataset.prices[row], ',.0f'),
+            lambda row: _format_number(self._dataset.ratings[row], '.1f', "평점 없음"),
+            lambda row: _format_number(self._dataset.review_counts[row], ',.0f', "0"),
+            lambda row: self._dataset.links[row],
+        ]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._dataset)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._columns[index.column()](index.row())
+        if role == Qt.TextAlignmentRole:
+            # 숫자 데이터는 오른쪽 정렬, 문자열은 왼쪽 정렬
+            if COLUMNS[index.column()] in NUMERIC_COLUMNS:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_products(self, keyword, products):
+        """검색어 하나의 제품 목록을 끝에 추가"""
+        if not products:
+            return
+        first = len(self._dataset)
+        self.beginInsertRows(QModelIndex(), first, first + len(products) - 1)
+        self._dataset.append(keyword, products)
+        self.endInsertRows()
+
+    def dataset(self):
+        """표에 표시 중인 검색 결과 데이터셋"""
+        return self._dataset
+
+    def clear(self):
+        """모든 행 삭제"""
+        self.beginResetModel()
+        self._dataset.clear()
+        self.endResetModel()
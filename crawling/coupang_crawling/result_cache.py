@@ -0,0 +1,109 @@
+"""
+검색 결과 캐시 모듈
+(검색어, 검색 수량, 정렬 방식)별 검색 결과를 SQLite 파일에 저장해 두고,
+유효 기간(TTL) 안에 같은 검색을 다시 하면 브라우저를 띄우지 않고 저장된 결과를 돌려줍니다.
+저장된 결과가 MAX_CACHE_ENTRIES개를 넘으면 가장 오래 사용하지 않은 결과부터 삭제합니다.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import List, NamedTuple
+
+from constants import RESULT_CACHE_PATH, DEFAULT_CACHE_TTL, MAX_CACHE_ENTRIES, DEFAULT_SORT
+
+
+class CachedResult(NamedTuple):
+    """캐시에서 가져온 검색 결과"""
+    products: List[dict]
+    cached_at: datetime          # 캐시에 저장된 시각
+
+
+class ResultCache:
+    """
+    검색 결과 캐시
+    - 기본 키 (keyword, max_items, sort)
+    - last_used: 조회할 때마다 갱신하여 LRU 삭제 기준으로 사용
+    """
+
+    def __init__(self, path=RESULT_CACHE_PATH, ttl=DEFAULT_CACHE_TTL, max_entries=MAX_CACHE_ENTRIES):
+        """
+        Args:
+            path: 캐시 DB 경로
+            ttl: 저장된 결과를 다시 쓰는 기간 (초, 0 이하이면 조회하지 않고 저장만 함)
+            max_entries: 남겨 둘 최대 검색 결과 수
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS results (
+                keyword TEXT NOT NULL,
+                max_items INTEGER NOT NULL,
+                sort TEXT NOT NULL,
+                products TEXT NOT NULL,
+                cached_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (keyword, sort, max_items)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_results_last_used ON results (last_used)')
+        self.conn.commit()
+
+    def get(self, keyword, max_items, sort=DEFAULT_SORT):
+        """
+        유효 기간 안의 검색 결과 조회 (없으면 None)
+
+        같은 검색어를 더 많은 수량으로 검색한 결과가 있으면 앞에서부터 max_items개를 잘라 사용한다.
+        """
+        if self.ttl <= 0:
+            return None
+        now = time.time()
+        row = self.conn.execute(
+            'SELECT max_items, products, cached_at FROM results '
+            'WHERE keyword = ? AND sort = ? AND max_items >= ? AND cached_at >= ? '
+            'ORDER BY max_items LIMIT 1',
+            (keyword, sort, max_items, now - self.ttl),
+        ).fetchone()
+        if row is None:
+            return None
+        cached_max_items, products, cached_at = row
+        with self.conn:
+            self.conn.execute(
+                'UPDATE results SET last_used = ? WHERE keyword = ? AND sort = ? AND max_items = ?',
+                (now, keyword, sort, cached_max_items),
+            )
+        return CachedResult(json.loads(products)[:max_items], datetime.fromtimestamp(cached_at))
+
+    def put(self, keyword, max_items, products, sort=DEFAULT_SORT):
+        """검색 결과 저장 (같은 키는 덮어쓰고, 최대 개수를 넘으면 오래 사용하지 않은 결과 삭제)"""
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO results (keyword, max_items, sort, products, cached_at, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (keyword, max_items, sort, json.dumps(products, ensure_ascii=False), now, now),
+            )
+            self.conn.execute(
+                'DELETE FROM results WHERE (keyword, sort, max_items) IN ('
+                'SELECT keyword, sort, max_items FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+
+    def invalidate(self, keyword, sort=DEFAULT_SORT):
+        """검색어 하나의 저장된 결과를 모두 삭제"""
+        with self.conn:
+            self.conn.execute('DELETE FROM results WHERE keyword = ? AND sort = ?', (keyword, sort))
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
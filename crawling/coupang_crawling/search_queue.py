@@ -0,0 +1,136 @@
+"""
+검색어 작업 큐 모듈
+여러 검색어를 드라이버 풀의 브라우저 N개에 나누어 동시에 검색합니다.
+검색어 하나의 여러 페이지도 paged_search로 여러 브라우저에서 동시에 불러옵니다.
+모든 브라우저의 페이지 요청은 하나의 요청 간격 제한기를 거치므로 작업자 수와 관계없이 초당 요청 수가 제한됩니다.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from constants import DEFAULT_WORKERS, DEFAULT_RATE, DEFAULT_PAGE_WORKERS
+from page_wait import AdaptiveDelay, PageRateLimiter
+from paged_search import search_keyword
+
+# 검색어별 상태
+STATUS_WAITING = '대기'
+STATUS_RUNNING = '검색 중'
+STATUS_DONE = '완료'
+STATUS_FAILED = '실패'
+STATUS_CANCELLED = '취소'
+STATUS_CACHED = '캐시'
+
+
+class KeywordResult(NamedTuple):
+    """검색어 하나의 검색 결과"""
+    keyword: str
+    products: List[dict]
+    elapsed: float               # 소요 시간 (초)
+    error: Optional[str] = None  # 실패한 경우 오류 메시지 (취소된 경우 STATUS_CANCELLED)
+    cached_at: Optional[datetime] = None  # 캐시에서 가져온 결과이면 캐시에 저장된 시각
+
+
+def parse_keywords(text):
+    """쉼표/줄바꿈으로 구분한 검색어 목록 (빈 항목과 중복 제거, 입력 순서 유지)"""
+    keywords = (keyword.strip() for keyword in re.split(r'[,\n]', text))
+    return list(dict.fromkeys(keyword for keyword in keywords if keyword))
+
+
+def load_keywords(path):
+    """한 줄에 검색어 하나씩 적힌 텍스트 파일 읽기 (# 로 시작하는 줄은 무시)"""
+    with open(path, encoding='utf-8-sig') as f:
+        lines = [line for line in f if not line.lstrip().startswith('#')]
+    return parse_keywords('\n'.join(lines))
+
+
+class SearchQueue:
+    """
+    검색어 목록을 병렬로 검색하는 작업 큐
+    검색어마다 풀에서 브라우저를 빌려 CoupangCrawler로 검색하고, 끝나는 순서대로 콜백으로 결과를 전달한다.
+    """
+
+    def __init__(self, driver_pool, crawler_factory, workers=DEFAULT_WORKERS, rate=DEFAULT_RATE,
+                 page_workers=DEFAULT_PAGE_WORKERS):
+        """
+        Args:
+            driver_pool: 브라우저를 빌려 줄 DriverPool
+            crawler_factory: (PooledDriver, PageRateLimiter, AdaptiveDelay)를 받아 검색기를 만드는 함수
+            workers: 동시에 사용할 브라우저 수
+            rate: 모든 브라우저를 합한 초당 페이지 요청 수
+            page_workers: 검색어 하나에서 동시에 불러올 페이지 수
+        """
+        self.driver_pool = driver_pool
+        self.crawler_factory = crawler_factory
+        self.workers = workers
+        self.page_workers = page_workers
+        self.rate_limiter = PageRateLimiter(rate)
+        self.politeness = AdaptiveDelay()  # 한 브라우저가 차단되면 모든 브라우저가 함께 늦춤
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """아직 시작하지 않은 검색어와 페이지 요청 취소 (이미 불러오는 중인 페이지는 끝까지 진행)"""
+        self._cancelled.set()
+
+    def _search(self, keyword, max_items, on_status, on_page):
+        if self._cancelled.is_set():
+            return KeywordResult(keyword, [], 0.0, STATUS_CANCELLED)
+        if on_status:
+            on_status(keyword, STATUS_RUNNING)
+        start_time = time.time()
+        pages = search_keyword(
+            self.driver_pool,
+            lambda pooled: self.crawler_factory(pooled, self.rate_limiter, self.politeness),
+            keyword, max_items,
+            workers=self.page_workers,
+            on_page=(lambda page, products: on_page(keyword, page, products)) if on_page else None,
+            cancelled=self._cancelled,
+        )
+        if pages.cancelled:
+            error = STATUS_CANCELLED
+        elif pages.page_errors:
+            # 일부 페이지만 실패해도 실패로 보고 (캐시하지 않음), 찾은 제품은 그대로 전달
+            error = ', '.join(f"{page}페이지: {message}" for page, message in sorted(pages.page_errors.items()))
+        else:
+            error = None
+        return KeywordResult(keyword, pages.products, time.time() - start_time, error)
+
+    def run(self, keywords, max_items, on_result=None, on_status=None, on_page=None):
+        """
+        검색어 목록 검색
+
+        Args:
+            keywords: 검색어 목록
+            max_items: 검색어당 최대 제품 수
+            on_result: 검색어 하나가 끝날 때마다 KeywordResult를 받을 콜백
+            on_status: (검색어, 상태)가 바뀔 때마다 호출
+            on_page: 페이지 하나의 새 제품이 합쳐질 때마다 (검색어, 페이지 번호, 제품 목록)으로 호출
+
+        Returns:
+            list: 입력 순서대로 정렬한 KeywordResult 목록
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self._search, keyword, max_items, on_status, on_page): keyword
+                for keyword in keywords
+            }
+            for future in as_completed(futures):
+                keyword = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = KeywordResult(keyword, [], 0.0, str(e))
+
+                if on_status:
+                    if result.error == STATUS_CANCELLED:
+                        on_status(keyword, STATUS_CANCELLED)
+                    else:
+                        on_status(keyword, STATUS_FAILED if result.error else STATUS_DONE)
+                results[keyword] = result
+                if on_result:
+                    on_result(result)
+        return [results[keyword] for keyword in keywords]
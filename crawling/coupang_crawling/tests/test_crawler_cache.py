@@ -0,0 +1,66 @@
+"""
+CrawlerThread 검색 결과 캐시 저장 테스트
+브라우저 없이 가짜 풀과 검색기로 CrawlerThread.run을 실행하여
+끝까지 검색한 검색어만 캐시에 저장되는지 확인합니다.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import CrawlerThread  # noqa: E402
+from result_cache import ResultCache  # noqa: E402
+
+
+class FakePool:
+    @contextmanager
+    def driver(self):
+        yield None
+
+
+class FailingCrawler:
+    def __init__(self, pooled, rate_limiter=None, politeness=None):
+        pass
+
+    def search_page(self, keyword, page=1):
+        raise RuntimeError('차단 페이지')
+
+
+class WorkingCrawler(FailingCrawler):
+    def search_page(self, keyword, page=1):
+        return [{'제품명': f'{keyword} {page}-{i}', '가격': '1000', '평점': '4.5', '리뷰수': '10',
+                 '링크': f'https://www.coupang.com/vp/products/{page}{i:02d}'} for i in range(36)]
+
+
+def run_crawler(tmp_path, crawler, keywords=('노트북',), max_items=10):
+    cache_path = str(tmp_path / 'cache.db')
+    thread = CrawlerThread(list(keywords), max_items, FakePool(), workers=1, price_db_path=None,
+                           cache_path=cache_path)
+    thread.search_queue.crawler_factory = crawler
+    results = []
+    thread.keyword_result.connect(results.append)
+    thread.run()
+    return ResultCache(cache_path), results
+
+
+def test_failed_pages_are_not_cached(tmp_path):
+    cache, results = run_crawler(tmp_path, FailingCrawler)
+    try:
+        assert results[0].error
+        assert cache.get('노트북', 10) is None
+        assert len(cache) == 0
+    finally:
+        cache.close()
+
+
+def test_completed_keyword_is_cached(tmp_path):
+    cache, results = run_crawler(tmp_path, WorkingCrawler)
+    try:
+        assert results[0].error is None
+        cached = cache.get('노트북', 10)
+        assert cached is not None
+        assert len(cached.products) == 10
+    finally:
+        cache.close()
@@ -0,0 +1,82 @@
+"""
+수집 기록 저장소 조회 성능 측정 스크립트
+임시 DB에 1년치(영업일 기준) 전 종목 스냅샷을 만든 뒤 종목별 기간 조회와 일자별 전체 조회 시간을 출력합니다.
+
+사용법:
+    python benchmarks/bench_history.py [--days 250] [--tickers 2700]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history_store import HistoryStore  # noqa: E402
+
+
+def business_days(count):
+    """오늘부터 거슬러 올라간 영업일 count개 (오래된 순)"""
+    days = []
+    day = date.today()
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day)
+        day -= timedelta(days=1)
+    return days[::-1]
+
+
+def timed(func, repeat):
+    """func를 repeat번 실행한 평균 시간(ms)과 마지막 결과 반환"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='수집 기록 저장소 조회 벤치마크')
+    arg_parser.add_argument('--days', type=int, default=250, help='스냅샷 일수')
+    arg_parser.add_argument('--tickers', type=int, default=2700, help='일자별 종목 수')
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    codes = [f"{i:06d}" for i in range(args.tickers)]
+    days = business_days(args.days)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = HistoryStore(os.path.join(directory, 'history.db'))
+
+        start = time.perf_counter()
+        for day in days:
+            rows = [[code, f"종목{code}", random.uniform(500, 4000000), random.uniform(100, 3000000),
+                     random.uniform(-40, 120), random.uniform(0, 60), random.uniform(-80, 150),
+                     random.uniform(-30, 40)] for code in codes]
+            store.append_snapshot(rows, day)
+        print(f"적재: {args.days}일 x {args.tickers}종목 = {args.days * args.tickers:,}행 / "
+              f"{time.perf_counter() - start:.1f}초")
+
+        # 같은 날 재수집 시 중복 없이 덮어쓰는지 확인
+        store.append_snapshot(rows, days[-1])
+        total = store.conn.execute('SELECT COUNT(*) FROM snapshots').fetchone()[0]
+        assert total == args.days * args.tickers, total
+
+        code = codes[len(codes) // 2]
+        elapsed, frame = timed(lambda: store.ticker_history(code, days[0], days[-1]), 50)
+        print(f"종목 {code} 전체 기간 조회: {len(frame)}행 / {elapsed:.2f}ms")
+
+        elapsed, frame = timed(lambda: store.ticker_history(code, days[-60], days[-1]), 50)
+        print(f"종목 {code} 최근 60영업일 조회: {len(frame)}행 / {elapsed:.2f}ms")
+
+        elapsed, frame = timed(lambda: store.market_on(days[len(days) // 2]), 20)
+        print(f"{days[len(days) // 2]} 전체 시장 조회: {len(frame)}행 / {elapsed:.2f}ms")
+
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
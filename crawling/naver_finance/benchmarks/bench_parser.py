@@ -0,0 +1,69 @@
+"""
+파서 성능 비교 스크립트
+저장된 시가총액 페이지(fixtures/*.html)를 파서 방식별로 반복 파싱하여 초당 처리 행 수를 출력합니다.
+
+사용법:
+    python benchmarks/bench_parser.py [--repeat 20]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from market_parser import PARSER_BACKENDS  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixtures():
+    """fixtures 디렉토리의 HTML 파일을 bytes로 읽기"""
+    paths = sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))
+    if not paths:
+        raise SystemExit(f"벤치마크용 HTML 파일이 없습니다: {FIXTURE_DIR}")
+    pages = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages
+
+
+def bench(parse, pages, repeat):
+    """모든 페이지를 repeat번 파싱하고 (행 수, 소요 시간) 반환"""
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in pages:
+            rows += len(parse(content))
+    return rows, time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='시가총액 표 파서 벤치마크')
+    arg_parser.add_argument('--repeat', type=int, default=20, help='페이지 묶음 반복 횟수')
+    args = arg_parser.parse_args()
+
+    pages = load_fixtures()
+
+    # 모든 파서가 같은 결과를 내는지 먼저 확인
+    results = {name: [parse(content) for content in pages] for name, parse in PARSER_BACKENDS.items()}
+    baseline = results['bs4']
+    for name, result in results.items():
+        if result != baseline:
+            raise SystemExit(f"{name} 파서 결과가 bs4 결과와 다릅니다.")
+
+    print(f"페이지 {len(pages)}개 x {args.repeat}회")
+    timings = {}
+    for name, parse in PARSER_BACKENDS.items():
+        rows, elapsed = bench(parse, pages, args.repeat)
+        timings[name] = rows / elapsed
+        print(f"{name:>5}: {rows:,}행 / {elapsed:.2f}초 = {timings[name]:,.0f} rows/s")
+
+    print(f"lxml / bs4 = {timings['lxml'] / timings['bs4']:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
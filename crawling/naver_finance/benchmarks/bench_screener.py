@@ -0,0 +1,91 @@
+"""
+스크리너 성능 측정 스크립트
+여러 날짜의 전 종목 스냅샷 크기의 임의 데이터로 스크리너 생성, 조건식 필터, 순위 계산, 프록시 정렬/필터 시간을 출력합니다.
+
+사용법:
+    python benchmarks/bench_screener.py [--rows 50000] [--repeat 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screener import StockScreener  # noqa: E402
+
+EXPRESSIONS = [
+    'per < 10',
+    'per < 10 and roe > 15 and debt_ratio < 0.5',
+    '5 <= per < 15 and (roe > 10 or pct(frgn_rate) >= 0.9)',
+]
+
+
+def make_rows(count, seed=0):
+    """결측값이 섞인 임의의 [종목코드, 종목명, 숫자 6개] 행"""
+    rng = np.random.default_rng(seed)
+    numbers = np.column_stack([
+        rng.lognormal(8, 1.5, count),      # 시가총액
+        rng.lognormal(7, 1.5, count),      # 부채총계
+        rng.normal(5, 20, count),          # 매출증가율
+        rng.uniform(0, 60, count),         # 외국인비율
+        rng.normal(15, 10, count),         # PER
+        rng.normal(8, 12, count),          # ROE
+    ])
+    numbers[rng.random(numbers.shape) < 0.05] = np.nan
+    return [[f'{i % 2700:06d}', f'종목{i % 2700}', *values] for i, values in enumerate(numbers.tolist())]
+
+
+def timed(func, repeat):
+    """func를 repeat번 실행한 평균 시간(ms)과 마지막 결과 반환"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스크리너 성능 측정')
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    elapsed, screener = timed(lambda: StockScreener.from_rows(rows), 5)
+    print(f"스크리너 생성 ({args.rows}행)          {elapsed:8.2f}ms")
+
+    for expression in EXPRESSIONS:
+        elapsed, mask = timed(lambda: screener.mask(expression), args.repeat)
+        print(f"{expression:<52} {elapsed:8.2f}ms ({int(mask.sum())}행)")
+
+    weights = {'roe': 1, 'per': -1, 'debt_ratio': -1}
+    elapsed, _ = timed(lambda: screener.rank(weights, top=100), args.repeat)
+    print(f"{'순위 상위 100 (roe, -per, -debt_ratio)':<52} {elapsed:8.2f}ms")
+    elapsed, _ = timed(lambda: screener.name_mask('종목12'), args.repeat)
+    print(f"{'종목명 검색':<52} {elapsed:8.2f}ms")
+
+    # 화면 갱신까지 포함한 측정 (PySide6가 있는 경우)
+    try:
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PySide6.QtCore import QCoreApplication, Qt
+        from stock_table_model import StockTableModel, create_proxy_model
+    except ImportError:
+        return
+
+    app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841
+    model = StockTableModel()
+    model.append_rows(rows)
+    proxy = create_proxy_model(model)
+    proxy.sort(6, Qt.AscendingOrder)
+    for expression in EXPRESSIONS[1:]:
+        elapsed, _ = timed(lambda: proxy.set_expression(expression), args.repeat)
+        print(f"{'프록시 필터+정렬: ' + expression:<52} {elapsed:8.2f}ms ({proxy.rowCount()}행)")
+    elapsed, _ = timed(lambda: proxy.sort(7, Qt.DescendingOrder), args.repeat)
+    print(f"{'프록시 정렬 변경':<52} {elapsed:8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+CLI 시작 시간 측정 스크립트
+새 프로세스로 cli.py를 여러 번 실행하여 --help 응답 시간과 첫 요청 직전(--dry-run)까지의 시간을 출력하고,
+그 시점에 PySide6/pandas 등 무거운 모듈이 불러와지지 않았는지 확인합니다.
+
+사용법:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI_PATH = os.path.join(APP_DIR, 'cli.py')
+
+# 첫 요청 전에 불러오면 안 되는 모듈
+HEAVY_MODULES = ['PySide6', 'pandas', 'numpy', 'bs4', 'lxml']
+
+CHECK_SCRIPT = f"""
+import sys
+sys.path.insert(0, {APP_DIR!r})
+import cli
+cli.main(['--dry-run', '--no-history'])
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(','.join(loaded))
+"""
+
+
+def measure(command, runs):
+    """명령을 runs번 실행한 wall-clock 시간(ms) 목록"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=APP_DIR, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:<24} 중앙값 {statistics.median(timings):7.1f}ms | 최대 {max(timings):7.1f}ms")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='CLI 시작 시간 벤치마크')
+    arg_parser.add_argument('--runs', type=int, default=10, help='측정 횟수')
+    args = arg_parser.parse_args()
+
+    report('python -c pass', measure([sys.executable, '-c', 'pass'], args.runs))
+    report('cli.py --help', measure([sys.executable, CLI_PATH, '--help'], args.runs))
+    dry_run = measure([sys.executable, CLI_PATH, '--dry-run', '--no-history'], args.runs)
+    report('cli.py --dry-run', dry_run)
+
+    loaded = subprocess.run([sys.executable, '-c', CHECK_SCRIPT], cwd=APP_DIR, check=True,
+                            capture_output=True, text=True).stdout.strip()
+    print(f"첫 요청 전 불러온 무거운 모듈: {loaded or '없음'}")
+
+    if statistics.median(dry_run) >= 1000 or loaded:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
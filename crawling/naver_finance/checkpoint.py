@@ -0,0 +1,76 @@
+"""
+수집 체크포인트 모듈
+완료한 페이지와 그 행을 JSON Lines 파일에 한 줄씩 덧붙여 기록합니다.
+프로그램이 중간에 종료되어도 이미 기록한 페이지는 남아 있으므로, 다음 실행에서 빠진 페이지만 다시 수집할 수 있습니다.
+"""
+
+import json
+import os
+from datetime import date
+
+
+class CrawlCheckpoint:
+    """
+    체크포인트 파일 형식
+    - 첫 줄: {"snapshot_date": "YYYY-MM-DD", "fields": [...]}
+    - 이후: {"page": 페이지 번호, "rows": [[종목코드, 종목명, 숫자 6개], ...]}
+    """
+
+    def __init__(self, path, fields):
+        self.path = path
+        self.fields = list(fields)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def _header(self, snapshot_date):
+        return {'snapshot_date': snapshot_date.isoformat(), 'fields': self.fields}
+
+    def load(self, snapshot_date=None):
+        """
+        완료된 페이지의 행 조회
+
+        수집일이나 수집 항목이 다른 체크포인트는 이어서 쓸 수 없으므로 빈 딕셔너리를 반환한다.
+        마지막 줄이 기록 도중 끊긴 경우 해당 줄은 무시한다.
+
+        Returns:
+            dict: {페이지 번호: 행 목록}
+        """
+        if not self.exists():
+            return {}
+        snapshot_date = snapshot_date or date.today()
+        pages = {}
+        with open(self.path, encoding='utf-8') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                return {}
+            if header != self._header(snapshot_date):
+                return {}
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                pages[record['page']] = record['rows']
+        return pages
+
+    def start(self, snapshot_date=None):
+        """새 체크포인트 파일 생성 (기존 내용 삭제)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self._header(snapshot_date or date.today())) + '\n')
+
+    def add_page(self, page, rows):
+        """완료한 페이지 기록"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'page': page, 'rows': rows}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self):
+        """체크포인트 파일 삭제"""
+        if self.exists():
+            os.remove(self.path)
@@ -0,0 +1,43 @@
+"""
+수치 전처리 모듈
+페이지 단위로 모은 문자열 값을 pandas로 한 번에 숫자로 변환합니다.
+'N/A'처럼 숫자가 아닌 값은 NaN으로 남기고 종목은 그대로 유지합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from market_parser import StockRow
+
+# 숫자로 변환할 StockRow 필드 (종목코드, 종목명 제외)
+NUMERIC_FIELDS = StockRow._fields[2:]
+
+
+def clean_rows(rows):
+    """
+    StockRow 목록을 [종목코드, 종목명, 숫자 6개] 형태의 행으로 변환
+
+    Args:
+        rows: 파서가 반환한 StockRow 목록
+
+    Returns:
+        list: 변환된 행 목록 (변환할 수 없는 값은 NaN)
+    """
+    if not rows:
+        return []
+
+    raw = np.array([row[2:] for row in rows], dtype=object)
+    # 모든 숫자 열을 하나의 Series로 펼쳐 한 번에 변환 ('N/A' 등은 NaN)
+    flat = pd.Series(raw.ravel()).str.replace(',', '', regex=False).str.strip()
+    values = pd.to_numeric(flat, errors='coerce').to_numpy(dtype=np.float64).reshape(raw.shape)
+
+    return [
+        [row.code, row.name, *numbers]
+        for row, numbers in zip(rows, values.tolist())
+    ]
+
+
+def missing_summary(rows):
+    """변환된 행 목록의 열별 결측값 개수를 {필드명: 개수} 딕셔너리로 반환"""
+    values = np.array([row[2:] for row in rows], dtype=np.float64).reshape(-1, len(NUMERIC_FIELDS))
+    return {field: int(count) for field, count in zip(NUMERIC_FIELDS, np.isnan(values).sum(axis=0))}
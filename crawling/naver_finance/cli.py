@@ -0,0 +1,128 @@
+"""
+주식 데이터 수집 CLI
+GUI 없이 시가총액 페이지를 수집하여 파일로 저장합니다. (cron 등 배치 실행용)
+PySide6는 불러오지 않으며, requests/pandas는 인자 확인이 끝난 뒤에 불러옵니다.
+
+사용법:
+    python cli.py --pages 40 --format parquet --output stock_data.parquet
+
+종료 코드:
+    0  모든 페이지 수집 및 저장 성공
+    1  수집된 데이터가 없거나 파일 저장 실패
+    2  잘못된 인자
+    3  일부 페이지 수집 실패 또는 중지 (수집된 데이터는 저장됨, --resume으로 이어서 수집)
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse  # noqa: E402
+import signal  # noqa: E402
+import sys  # noqa: E402
+
+from constants import (COLUMNS, DEFAULT_MAX_WORKERS, DEFAULT_RATE, DEFAULT_TTL, DEFAULT_HISTORY_PATH,  # noqa: E402
+                       DEFAULT_CHECKPOINT_PATH, DEFAULT_MAX_RETRIES)
+from exporter import FORMATS, infer_format  # noqa: E402
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_PARTIAL = 3
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='네이버 증권 시가총액 페이지를 수집하여 파일로 저장합니다.',
+        epilog='종료 코드: 0 성공, 1 수집/저장 실패, 2 잘못된 인자, 3 일부 페이지 실패 또는 중지',
+    )
+    parser.add_argument('-p', '--pages', type=int, default=1, help='수집할 페이지 수 (기본값: 1)')
+    parser.add_argument('-f', '--format', choices=list(FORMATS), help='저장 형식 (기본값: 출력 경로 확장자 또는 xlsx)')
+    parser.add_argument('-o', '--output', help='저장 경로 (기본값: stock_data_<시각>.<형식>)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS, help='동시 요청 수')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='초당 요청 수')
+    parser.add_argument('--parser', choices=['lxml', 'bs4'], help='HTML 파서 (기본값: lxml 설치 시 lxml)')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_TTL, help='응답 캐시 유효 시간(초), 0이면 사용 안 함')
+    parser.add_argument('--history', default=DEFAULT_HISTORY_PATH, help='수집 기록 저장소 경로')
+    parser.add_argument('--no-history', action='store_true', help='수집 기록을 저장하지 않음')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH, help='수집 체크포인트 파일 경로')
+    parser.add_argument('--resume', action='store_true', help='체크포인트에 기록된 페이지는 건너뛰고 이어서 수집')
+    parser.add_argument('--retries', type=int, default=DEFAULT_MAX_RETRIES, help='실패한 페이지 재시도 횟수')
+    parser.add_argument('--dry-run', action='store_true', help='첫 요청 직전까지 준비한 뒤 요청 없이 종료')
+    parser.add_argument('-v', '--verbose', action='store_true', help='진행 상황과 시작 시간 출력')
+    args = parser.parse_args(argv)
+    if args.pages <= 0:
+        parser.error('페이지 수는 1 이상이어야 합니다.')
+    return args
+
+
+def resolve_output(args):
+    """저장 형식과 경로 결정"""
+    if args.output:
+        fmt = args.format or infer_format(args.output)
+        return fmt, args.output
+    fmt = args.format or 'xlsx'
+    return fmt, f"stock_data_{time.strftime('%Y%m%d_%H%M%S')}{FORMATS[fmt]}"
+
+
+def log(message):
+    print(message, file=sys.stderr)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt, output = resolve_output(args)
+
+    from engine import MarketSumCrawler
+
+    crawler = MarketSumCrawler(
+        args.pages,
+        max_workers=args.workers,
+        rate=args.rate,
+        parser_backend=args.parser,
+        cache_ttl=args.cache_ttl,
+        history_path=None if args.no_history else args.history,
+        checkpoint_path=args.checkpoint,
+        max_retries=args.retries,
+    )
+    fetcher = crawler.create_fetcher()
+
+    if args.dry_run:
+        log(f"첫 요청 준비 완료: {(time.perf_counter() - _START) * 1000:.0f}ms")
+        return EXIT_OK
+
+    on_progress = (lambda value: log(f"진행 상황: {value}%")) if args.verbose else None
+    # Ctrl+C는 수집 중지로 처리하여 이미 수집한 데이터는 저장
+    signal.signal(signal.SIGINT, lambda signum, frame: crawler.cancel())
+    result = crawler.run(on_progress=on_progress, on_error=log, fetcher=fetcher, resume=args.resume)
+
+    if args.verbose and fetcher.first_request_at is not None:
+        log(f"첫 요청까지: {(fetcher.first_request_at - _START) * 1000:.0f}ms")
+
+    if not result.data:
+        log("수집된 데이터가 없습니다.")
+        return EXIT_FAILED
+
+    try:
+        import pandas as pd
+        from exporter import save_dataframe
+
+        save_dataframe(pd.DataFrame(result.data, columns=COLUMNS), output, fmt)
+    except Exception as e:
+        log(f"파일 저장 중 오류가 발생했습니다: {str(e)}")
+        return EXIT_FAILED
+
+    summary = f"총 {len(result.data)}개 데이터 수집 완료 | 소요 시간: {result.elapsed:.2f}초 | 저장: {output}"
+    missing = [f"{label} {count}" for label, count in zip(COLUMNS[2:], result.missing.values()) if count]
+    if missing:
+        summary += f" | 결측값: {', '.join(missing)}"
+    print(summary)
+
+    if result.failed_pages:
+        log(f"{'중지로 남은' if result.cancelled else '실패한'} 페이지: {', '.join(map(str, result.failed_pages))} "
+            f"(--resume으로 이어서 수집)")
+        return EXIT_PARTIAL
+    return EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+상수 정의 모듈
+주식 데이터 수집기에서 사용하는 기본 설정값을 정의합니다.
+무거운 라이브러리를 불러오지 않으므로 CLI 시작 시점에 바로 사용할 수 있습니다.
+"""
+
+import os
+
+# 수집할 항목 (시가총액, 부채총계, 매출증가율, 외국인비율, PER, ROE)
+FIELD_IDS = ['market_sum', 'debt_total', 'sales_increasing_rate', 'frgn_rate', 'per', 'roe']
+
+# 웹 크롤링 차단 방지를 위한 헤더 설정
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 요청 설정
+DEFAULT_MAX_WORKERS = 4   # 동시에 진행할 최대 요청 수
+DEFAULT_RATE = 2.0        # 초당 허용 요청 수
+DEFAULT_BURST = 2         # 한 번에 몰아서 보낼 수 있는 요청 수
+REQUEST_TIMEOUT = 10
+
+# 캐시/체크포인트 파일을 두는 디렉토리
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'naver_finance')
+
+# 응답 캐시 설정
+DEFAULT_CACHE_PATH = os.path.join(CACHE_DIR, 'http_cache.sqlite')
+DEFAULT_TTL = 600                         # 응답 유효 시간 (초)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024     # 캐시 파일에 보관할 최대 본문 크기
+
+# 수집 체크포인트 및 실패 페이지 재시도 설정
+DEFAULT_CHECKPOINT_PATH = os.path.join(CACHE_DIR, 'checkpoint.jsonl')
+DEFAULT_MAX_RETRIES = 3       # 실패한 페이지를 마지막에 다시 시도하는 횟수
+DEFAULT_RETRY_BACKOFF = 2.0   # 첫 재시도 대기 시간(초), 재시도마다 2배씩 증가
+
+# 수집 기록 저장소 경로 (소스 디렉토리가 아닌 사용자 캐시 디렉토리)
+DEFAULT_HISTORY_PATH = os.path.join(CACHE_DIR, 'market_history.db')
+
+# 표/파일에 사용하는 열 이름
+COLUMNS = ["종목코드", "종목명", "시가총액(억)", "부채총계(억)", "매출증가율", "외국인비율", "PER(배)", "ROE(%)"]
@@ -0,0 +1,174 @@
+"""
+시가총액 수집 엔진 모듈
+GUI(CrawlerThread)와 CLI가 함께 사용하는 수집 로직입니다.
+requests/pandas 등 무거운 라이브러리는 실제 수집을 시작할 때 불러옵니다.
+"""
+
+import threading
+import time
+from contextlib import closing
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from checkpoint import CrawlCheckpoint
+from constants import (FIELD_IDS, DEFAULT_MAX_WORKERS, DEFAULT_RATE, DEFAULT_TTL, DEFAULT_HISTORY_PATH,
+                       DEFAULT_CHECKPOINT_PATH, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_BACKOFF)
+
+
+class CrawlResult(NamedTuple):
+    """수집 결과"""
+    data: List[list]           # [종목코드, 종목명, 숫자 6개] 행 목록 (페이지 순서)
+    missing: Dict[str, int]    # 열별 결측값 개수
+    failed_pages: List[int]    # 재시도 후에도 처리하지 못한 페이지
+    elapsed: float             # 소요 시간 (초)
+    cancelled: bool = False    # 사용자가 중간에 취소했는지 여부
+
+
+class MarketSumCrawler:
+    """
+    시가총액 페이지 수집기
+    진행 상황과 오류는 run()에 넘긴 콜백으로 전달한다.
+    완료한 페이지는 체크포인트 파일에 기록되어, 중단된 수집을 resume=True로 이어서 진행할 수 있다.
+    """
+
+    def __init__(self, pages, max_workers=DEFAULT_MAX_WORKERS, rate=DEFAULT_RATE, parser_backend=None,
+                 cache_ttl=DEFAULT_TTL, history_path=DEFAULT_HISTORY_PATH,
+                 checkpoint_path=DEFAULT_CHECKPOINT_PATH, max_retries=DEFAULT_MAX_RETRIES,
+                 retry_backoff=DEFAULT_RETRY_BACKOFF):
+        self.pages = pages
+        self.max_workers = max_workers
+        self.rate = rate
+        self.parser_backend = parser_backend  # 'lxml' 또는 'bs4' (None이면 자동 선택)
+        self.cache_ttl = cache_ttl            # 응답 캐시 유효 시간(초), 0이면 캐시 사용 안 함
+        self.history_path = history_path      # 수집 기록 저장 경로, None이면 기록하지 않음
+        self.checkpoint = CrawlCheckpoint(checkpoint_path, FIELD_IDS) if checkpoint_path else None
+        self.max_retries = max_retries        # 실패한 페이지 재시도 횟수
+        self.retry_backoff = retry_backoff    # 첫 재시도 대기 시간(초)
+        self._cancelled = threading.Event()
+        self._fetcher = None
+
+    def create_fetcher(self):
+        """요청 전까지 필요한 준비(모듈 로딩, 세션 생성)를 마친 수집기 반환"""
+        from fetcher import PageFetcher
+
+        return PageFetcher(max_workers=self.max_workers, rate=self.rate, cache_ttl=self.cache_ttl)
+
+    def can_resume(self):
+        """오늘 수집하다 멈춘 체크포인트가 있는지 여부"""
+        return bool(self.checkpoint and self.checkpoint.load())
+
+    def cancel(self):
+        """수집 중지 (이미 수집한 페이지는 결과와 체크포인트에 남음)"""
+        self._cancelled.set()
+        if self._fetcher is not None:
+            self._fetcher.cancel()
+
+    def run(self,
+            on_page: Optional[Callable[[list], None]] = None,
+            on_progress: Optional[Callable[[int], None]] = None,
+            on_error: Optional[Callable[[str], None]] = None,
+            fetcher=None,
+            resume=False) -> CrawlResult:
+        """
+        전체 페이지 수집
+
+        Args:
+            on_page: 페이지 하나의 행 목록이 준비될 때마다 호출
+            on_progress: 진행률(0~100)이 바뀔 때마다 호출
+            on_error: 페이지 처리 실패 등 오류 메시지 전달
+            fetcher: 미리 만들어 둔 PageFetcher (없으면 새로 생성)
+            resume: True이면 체크포인트에 기록된 페이지는 다시 요청하지 않음
+        """
+        def report_error(message):
+            if on_error:
+                on_error(message)
+
+        def report_progress():
+            if on_progress:
+                on_progress(int((len(page_data) / self.pages) * 100))
+
+        start_time = time.time()
+
+        # 체크포인트에서 이미 수집한 페이지 복원
+        page_data = {}
+        if self.checkpoint:
+            if resume:
+                saved = self.checkpoint.load()
+                page_data = {page: rows for page, rows in saved.items() if page <= self.pages}
+            if not page_data:
+                self.checkpoint.start()
+
+        fetcher = fetcher or self.create_fetcher()
+        self._fetcher = fetcher
+        pending = [page for page in range(1, self.pages+1) if page not in page_data]
+        results = fetcher.fetch_pages(pending)
+
+        # 첫 응답을 기다리는 동안 파서/전처리 모듈(pandas 등) 로딩
+        from cleaning import clean_rows, missing_summary
+        from market_parser import parse_market_sum
+
+        for page in sorted(page_data):
+            if on_page:
+                on_page(page_data[page])
+        report_progress()
+
+        attempt = 0
+        while True:
+            # 요청이 끝나는 순서대로 파싱하여 네트워크 대기와 파싱을 겹쳐서 처리
+            with closing(results):
+                for page, content, error in results:
+                    if self._cancelled.is_set():
+                        break
+                    try:
+                        if error is not None:
+                            raise error
+
+                        # 문자열 값을 페이지 단위로 한 번에 숫자로 변환 ('N/A'는 NaN으로 유지)
+                        rows = clean_rows(parse_market_sum(content, self.parser_backend))
+                        page_data[page] = rows
+                        if self.checkpoint:
+                            self.checkpoint.add_page(page, rows)
+                        if on_page:
+                            on_page(rows)
+                        report_progress()
+
+                    except Exception as e:
+                        report_error(f"페이지 {page} 처리 중 오류 발생: {str(e)}")
+
+            pending = [page for page in range(1, self.pages+1) if page not in page_data]
+            if not pending or self._cancelled.is_set() or attempt >= self.max_retries:
+                break
+
+            # 실패한 페이지는 마지막에 대기 시간을 늘려 가며 다시 시도
+            attempt += 1
+            delay = self.retry_backoff * 2 ** (attempt - 1)
+            report_error(f"실패한 페이지 {len(pending)}개를 {delay:g}초 후 다시 시도합니다. ({attempt}/{self.max_retries})")
+            if self._cancelled.wait(delay):
+                break
+            results = fetcher.fetch_pages(pending)
+
+        # 완료 순서와 관계없이 페이지 순서대로 정렬
+        data = [row for page in sorted(page_data) for row in page_data[page]]
+        cancelled = self._cancelled.is_set()
+
+        # 모든 페이지를 수집했으면 체크포인트 정리, 아니면 다음 실행에서 이어서 수집할 수 있도록 유지
+        if self.checkpoint and not pending and not cancelled:
+            self.checkpoint.remove()
+
+        # 수집 기록 저장소에 오늘 날짜 스냅샷으로 누적
+        if self.history_path and data:
+            try:
+                from history_store import HistoryStore
+
+                history = HistoryStore(self.history_path)
+                history.append_snapshot(data)
+                history.close()
+            except Exception as e:
+                report_error(f"수집 기록 저장 중 오류 발생: {str(e)}")
+
+        return CrawlResult(
+            data=data,
+            missing=missing_summary(data) if data else {},
+            failed_pages=pending,
+            elapsed=time.time() - start_time,
+            cancelled=cancelled,
+        )
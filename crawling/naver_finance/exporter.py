@@ -0,0 +1,116 @@
+"""
+파일 저장 모듈
+수집한 데이터프레임을 엑셀(xlsx), CSV, Parquet 파일로 저장합니다.
+행을 일정 개수씩 나누어 쓰면서 진행률을 콜백으로 전달하므로 작업 스레드에서 실행하기 좋습니다.
+"""
+
+import math
+import os
+
+# 지원하는 저장 형식과 기본 확장자
+FORMATS = {
+    'xlsx': '.xlsx',
+    'csv': '.csv',
+    'parquet': '.parquet',
+}
+
+CHUNK_ROWS = 5000  # 진행률을 알리는 행 단위
+
+
+def infer_format(path, default='xlsx'):
+    """파일 확장자로 저장 형식 추정"""
+    extension = os.path.splitext(path)[1].lower()
+    for fmt, fmt_extension in FORMATS.items():
+        if extension == fmt_extension:
+            return fmt
+    return default
+
+
+def _report(on_progress, done, total):
+    if on_progress:
+        on_progress(100 if total == 0 else int(done * 100 / total))
+
+
+def _write_xlsx(df, path, on_progress):
+    """
+    xlsxwriter constant_memory 모드로 한 행씩 기록
+    이미 쓴 행은 바로 파일로 내보내므로 데이터 크기와 관계없이 메모리 사용량이 일정하다.
+    """
+    import xlsxwriter
+    from pandas.api.types import is_numeric_dtype
+
+    total = len(df)
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet('Sheet1')
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        number_format = workbook.add_format({'num_format': '#,##0.00'})
+
+        numeric_columns = [is_numeric_dtype(df[column]) for column in df.columns]
+        for col, is_numeric in enumerate(numeric_columns):
+            if is_numeric:
+                worksheet.set_column(col, col, 15, number_format)
+
+        worksheet.write_row(0, 0, list(df.columns), header_format)
+        for row_index, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            for col, value in enumerate(row):
+                if numeric_columns[col]:
+                    # 결측값(NaN)은 빈 셀로 둠
+                    if value is not None and not math.isnan(value):
+                        worksheet.write_number(row_index, col, value, number_format)
+                elif value is not None:
+                    worksheet.write_string(row_index, col, str(value))
+            if row_index % CHUNK_ROWS == 0:
+                _report(on_progress, row_index, total)
+    finally:
+        workbook.close()
+
+
+def _write_csv(df, path, on_progress):
+    """CHUNK_ROWS 단위로 나누어 CSV 기록"""
+    total = len(df)
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8 사용
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        df.iloc[:0].to_csv(f, index=False)
+        for start in range(0, total, CHUNK_ROWS):
+            df.iloc[start:start + CHUNK_ROWS].to_csv(f, index=False, header=False)
+            _report(on_progress, min(start + CHUNK_ROWS, total), total)
+
+
+def _write_parquet(df, path, on_progress):
+    """CHUNK_ROWS 단위 row group으로 Parquet 기록 (pyarrow 필요)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    total = len(df)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, table.schema) as writer:
+        for start in range(0, total, CHUNK_ROWS):
+            writer.write_table(table.slice(start, CHUNK_ROWS))
+            _report(on_progress, min(start + CHUNK_ROWS, total), total)
+        if total == 0:
+            writer.write_table(table)
+
+
+_WRITERS = {
+    'xlsx': _write_xlsx,
+    'csv': _write_csv,
+    'parquet': _write_parquet,
+}
+
+
+def save_dataframe(df, path, fmt=None, on_progress=None):
+    """
+    데이터프레임을 파일로 저장
+
+    Args:
+        df: 저장할 데이터프레임
+        path: 저장 경로
+        fmt: 'xlsx', 'csv', 'parquet' (None이면 확장자로 추정)
+        on_progress: 진행률(0~100)을 받을 콜백
+    """
+    fmt = fmt or infer_format(path)
+    if fmt not in _WRITERS:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {fmt}")
+    _WRITERS[fmt](df, path, on_progress)
+    _report(on_progress, len(df), len(df))
@@ -0,0 +1,134 @@
+"""
+페이지 수집 엔진 모듈
+동시 요청 수를 제한한 스레드 풀과 토큰 버킷 속도 제한기로 시가총액 페이지를 가져옵니다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import (FIELD_IDS, HEADERS, DEFAULT_MAX_WORKERS, DEFAULT_RATE, DEFAULT_BURST,
+                       REQUEST_TIMEOUT)
+
+
+def build_url(page):
+    """시가총액 페이지 요청 URL 생성"""
+    field_query = ''.join(f"&fieldIds={field_id}" for field_id in FIELD_IDS)
+    return (
+        "https://finance.naver.com/sise/field_submit.naver?menu=market_sum"
+        f"&returnUrl=http://finance.naver.com/sise/sise_market_sum.naver?page={page}"
+        f"{field_query}"
+    )
+
+
+def create_session(max_workers=DEFAULT_MAX_WORKERS, cache_ttl=None):
+    """
+    재시도 설정과 동시 요청 수에 맞는 커넥션 풀을 가진 세션 생성
+    cache_ttl(초)을 지정하면 응답을 디스크에 캐시하는 CachedSession을 사용한다.
+    """
+    if cache_ttl:
+        from http_cache import CachedSession, ResponseCache
+        session = CachedSession(ResponseCache(ttl=cache_ttl))
+    else:
+        session = requests.Session()
+    retries = Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 요청 속도 제한기
+    초당 rate개의 토큰이 채워지고, 최대 capacity개까지 쌓일 수 있다.
+    여러 스레드에서 동시에 acquire()를 호출해도 안전하다.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, capacity=DEFAULT_BURST):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class PageFetcher:
+    """
+    여러 페이지를 동시에 요청하는 수집기
+    동시 요청 수는 스레드 풀 크기로, 요청 간격은 TokenBucket으로 제한한다.
+    """
+
+    def __init__(self, session=None, max_workers=DEFAULT_MAX_WORKERS,
+                 rate=DEFAULT_RATE, burst=DEFAULT_BURST, cache_ttl=None):
+        self.max_workers = max(1, int(max_workers))
+        self.session = session or create_session(self.max_workers, cache_ttl)
+        self.limiter = TokenBucket(rate, burst)
+        self.first_request_at = None  # 첫 요청 시각 (time.perf_counter 기준)
+        self._cancelled = threading.Event()
+
+    def _is_cached(self, url):
+        is_fresh = getattr(self.session, 'is_fresh', None)
+        return bool(is_fresh and is_fresh(url))
+
+    def cancel(self):
+        """아직 보내지 않은 요청 취소 (이미 진행 중인 요청은 끝까지 진행)"""
+        self._cancelled.set()
+
+    def fetch(self, page):
+        """단일 페이지 요청 후 응답 본문 반환"""
+        url = build_url(page)
+        if self.first_request_at is None:
+            self.first_request_at = time.perf_counter()
+        # 캐시에서 바로 꺼낼 수 있는 페이지는 요청 예산을 쓰지 않음
+        if not self._is_cached(url):
+            self.limiter.acquire()
+        if self._cancelled.is_set():
+            raise RuntimeError("수집이 취소되었습니다.")
+        response = self.session.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.content
+
+    def fetch_pages(self, pages):
+        """
+        페이지 요청을 바로 시작하고, 완료되는 순서대로 (page, content, error)를 내는 이터레이터 반환
+        요청에 실패한 페이지는 content가 None이고 error에 예외가 담긴다.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {executor.submit(self.fetch, page): page for page in pages}
+        return self._iter_completed(executor, futures)
+
+    @staticmethod
+    def _iter_completed(executor, futures):
+        try:
+            for future in as_completed(futures):
+                page = futures[future]
+                try:
+                    yield page, future.result(), None
+                except Exception as e:
+                    yield page, None, e
+        finally:
+            # 중간에 순회를 멈춘 경우 아직 시작하지 않은 요청은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,111 @@
+"""
+시가총액 수집 기록 저장 모듈
+수집할 때마다 (수집일, 종목코드) 기준으로 SQLite에 누적하여 기간별/일자별 조회를 지원합니다.
+"""
+
+import os
+import sqlite3
+from datetime import date, datetime
+
+from constants import DEFAULT_HISTORY_PATH
+
+# snapshots 테이블의 값 열 (StockRow 필드명과 동일)
+VALUE_COLUMNS = ['market_sum', 'debt_total', 'sales_increasing_rate', 'frgn_rate', 'per', 'roe']
+RESULT_COLUMNS = ['snapshot_date', 'code', 'name'] + VALUE_COLUMNS
+
+
+def _to_date_text(value):
+    """date/datetime/문자열을 'YYYY-MM-DD' 형식으로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(str(value)).isoformat()
+
+
+class HistoryStore:
+    """
+    일자별 시가총액 스냅샷 저장소
+    - 기본 키 (snapshot_date, code): 같은 날 다시 수집하면 최신 값으로 덮어써 중복을 제거
+    - 인덱스 (code, snapshot_date): 종목별 기간 조회
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        self.conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS snapshots (
+                snapshot_date TEXT NOT NULL,
+                code TEXT NOT NULL,
+                name TEXT NOT NULL,
+                {', '.join(f'{column} REAL' for column in VALUE_COLUMNS)},
+                collected_at TEXT NOT NULL,
+                PRIMARY KEY (snapshot_date, code)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_code_date ON snapshots (code, snapshot_date)')
+        self.conn.commit()
+
+    def append_snapshot(self, rows, snapshot_date=None):
+        """
+        한 번의 수집 결과를 저장
+
+        Args:
+            rows: [종목코드, 종목명, 시가총액, 부채총계, 매출증가율, 외국인비율, PER, ROE] 형태의 행 목록
+            snapshot_date: 수집일 (기본값: 오늘)
+
+        Returns:
+            int: 저장한 행 수
+        """
+        snapshot_date = _to_date_text(snapshot_date or date.today())
+        collected_at = datetime.now().isoformat(timespec='seconds')
+        records = [
+            (snapshot_date, row[0], row[1], *row[2:2 + len(VALUE_COLUMNS)], collected_at)
+            for row in rows if row[0]
+        ]
+        placeholders = ', '.join('?' for _ in range(len(VALUE_COLUMNS) + 4))
+        with self.conn:
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO snapshots '
+                f'(snapshot_date, code, name, {", ".join(VALUE_COLUMNS)}, collected_at) '
+                f'VALUES ({placeholders})',
+                records
+            )
+        return len(records)
+
+    def _query(self, sql, params):
+        import pandas as pd
+
+        rows = self.conn.execute(sql, params).fetchall()
+        return pd.DataFrame.from_records(rows, columns=RESULT_COLUMNS)
+
+    def ticker_history(self, code, start=None, end=None):
+        """종목 하나의 기간별 기록 (start, end 포함, 생략 시 전체 기간)"""
+        return self._query(
+            f'SELECT {", ".join(RESULT_COLUMNS)} FROM snapshots '
+            'WHERE code = ? AND snapshot_date BETWEEN ? AND ? ORDER BY snapshot_date',
+            (code, _to_date_text(start) or '0000-00-00', _to_date_text(end) or '9999-99-99')
+        )
+
+    def market_on(self, snapshot_date):
+        """특정 일자의 전체 종목 기록"""
+        return self._query(
+            f'SELECT {", ".join(RESULT_COLUMNS)} FROM snapshots WHERE snapshot_date = ? ORDER BY market_sum DESC',
+            (_to_date_text(snapshot_date),)
+        )
+
+    def snapshot_dates(self):
+        """저장된 수집일 목록"""
+        return [row[0] for row in self.conn.execute('SELECT DISTINCT snapshot_date FROM snapshots ORDER BY snapshot_date')]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,216 @@
+"""
+HTTP 응답 캐시 모듈
+GET 응답을 SQLite 파일에 저장하여 유효 시간(TTL) 안의 재수집은 네트워크 없이 처리합니다.
+TTL이 지난 응답은 ETag/Last-Modified로 조건부 요청을 보내 변경되지 않았으면 그대로 재사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from constants import DEFAULT_CACHE_PATH, DEFAULT_TTL, DEFAULT_MAX_BYTES
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 보관하지 않음
+_DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+def cache_key(method, url):
+    """
+    요청 메서드와 URL로 캐시 키 생성
+    쿼리 파라미터(fieldIds 포함)를 정렬하므로 파라미터 순서가 달라도 같은 키가 된다.
+    """
+    parts = urlsplit(url)
+    params = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    raw = json.dumps([method.upper(), parts.scheme, parts.netloc, parts.path, params], ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite 기반 응답 저장소
+    전체 본문 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 응답부터 삭제(LRU)한다.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # 조회 때마다 접근 시각을 기록하므로 쓰기 비용이 적은 WAL 모드 사용
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._lock:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            ''')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)')
+            self.conn.commit()
+
+    def get(self, key):
+        """저장된 응답 조회 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT url, status, headers, body, etag, last_modified, stored_at FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self.conn.commit()
+        url, status, headers, body, etag, last_modified, stored_at = row
+        return {
+            'url': url,
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': stored_at,
+        }
+
+    def stored_at(self, key):
+        """응답 저장 시각 조회 (접근 시각은 갱신하지 않음)"""
+        with self._lock:
+            row = self.conn.execute('SELECT stored_at FROM responses WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, entry):
+        """응답이 TTL 안에 있는지 여부"""
+        return entry is not None and time.time() - entry['stored_at'] < self.ttl
+
+    def store(self, key, response):
+        """응답 저장 후 용량 초과 시 오래된 응답 정리"""
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        body = response.content
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, url, status, headers, body, etag, last_modified, stored_at, accessed_at, size) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, response.url, response.status_code, json.dumps(headers), body,
+                 response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 now, now, len(body))
+            )
+            self._evict()
+            self.conn.commit()
+
+    def refresh(self, key, response):
+        """304 응답을 받은 경우 저장 시각과 검증 헤더만 갱신"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                'UPDATE responses SET stored_at = ?, accessed_at = ?, '
+                'etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE key = ?',
+                (now, now, response.headers.get('ETag'), response.headers.get('Last-Modified'), key)
+            )
+            self.conn.commit()
+
+    def _evict(self):
+        """전체 크기가 max_bytes를 넘으면 최근에 사용하지 않은 순서로 삭제 (락을 잡은 상태에서 호출)"""
+        total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # 매번 정리하지 않도록 최대 크기의 90%까지 줄임
+        target = self.max_bytes * 0.9
+        for key, size in self.conn.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+            if total <= target:
+                break
+            self.conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total -= size
+
+    def clear(self):
+        """저장된 응답 전체 삭제"""
+        with self._lock:
+            self.conn.execute('DELETE FROM responses')
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def build_response(entry, request=None):
+    """저장된 응답으로 requests.Response 객체 생성"""
+    response = requests.Response()
+    response.status_code = entry['status']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response._content = entry['body']
+    response.url = entry['url']
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.reason = 'OK'
+    response.request = request
+    response.from_cache = True
+    return response
+
+
+class CachedSession(requests.Session):
+    """
+    GET 응답을 ResponseCache에 저장하는 세션
+    - TTL 안의 응답: 네트워크 요청 없이 저장된 응답 반환
+    - TTL이 지난 응답: If-None-Match / If-Modified-Since 조건부 요청, 304이면 저장된 응답 재사용
+    """
+
+    def __init__(self, cache=None):
+        super().__init__()
+        self.cache = cache or ResponseCache()
+
+    def is_fresh(self, url):
+        """URL에 대한 유효한 캐시 응답이 있는지 여부"""
+        stored_at = self.cache.stored_at(cache_key('GET', url))
+        return stored_at is not None and time.time() - stored_at < self.cache.ttl
+
+    def request(self, method, url, **kwargs):
+        if method.upper() != 'GET':
+            return super().request(method, url, **kwargs)
+
+        if kwargs.get('params'):
+            url = requests.Request(method, url, params=kwargs.pop('params')).prepare().url
+        key = cache_key(method, url)
+        entry = self.cache.get(key)
+        if self.cache.is_fresh(entry):
+            return build_response(entry)
+
+        # 만료된 응답이 있으면 조건부 요청으로 재검증
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = super().request(method, url, headers=headers, **kwargs)
+        if entry is not None and response.status_code == 304:
+            self.cache.refresh(key, response)
+            return build_response(entry, response.request)
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        response.from_cache = False
+        return response
@@ -1,15 +1,22 @@
 import sys
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                              QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                              QProgressBar, QTableWidget, QTableWidgetItem, 
-                              QHeaderView, QMessageBox, QFileDialog)
-from PySide6.QtCore import Qt, QThread, Signal
+                              QHBoxLayout, QLabel, QLineEdit, QPushButton, QSpinBox,
+                              QProgressBar, QTableView, QHeaderView, QMessageBox,
+                              QFileDialog)
+from PySide6.QtCore import QThread, Signal
+from constants import COLUMNS, DEFAULT_MAX_WORKERS, DEFAULT_RATE, DEFAULT_TTL, DEFAULT_HISTORY_PATH
+from engine import MarketSumCrawler
+from exporter import infer_format, save_dataframe
+from stock_table_model import StockTableModel, create_proxy_model
+
+# 저장 다이얼로그 필터와 형식
+SAVE_FILTERS = {
+    'Excel Files (*.xlsx)': 'xlsx',
+    'CSV Files (*.csv)': 'csv',
+    'Parquet Files (*.parquet)': 'parquet',
+}
 
 # 웹 크롤링 작업을 위한 스레드 클래스
 class CrawlerThread(QThread):
@@ -19,76 +26,62 @@ class CrawlerThread(QThread):
     """
     # 시그널 정의
     progress_signal = Signal(int)  # 진행 상황 업데이트
+    page_signal = Signal(list)     # 페이지 단위로 수집된 행 전달
     data_signal = Signal(list)     # 수집된 데이터 전달
     error_signal = Signal(str)     # 오류 메시지 전달
+    missing_signal = Signal(dict)  # 열별 결측값 개수 전달
+    incomplete_signal = Signal(list, bool)  # 미완료 시그널 (남은 페이지, 취소 여부)
     finished_signal = Signal(int, float)  # 완료 시그널 (데이터 수, 소요 시간)
 
-    def __init__(self, pages):
+    def __init__(self, pages, max_workers=DEFAULT_MAX_WORKERS, rate=DEFAULT_RATE, parser_backend=None,
+                 cache_ttl=DEFAULT_TTL, history_path=DEFAULT_HISTORY_PATH, resume=False):
         super().__init__()
-        self.pages = pages
+        self.crawler = MarketSumCrawler(pages, max_workers=max_workers, rate=rate, parser_backend=parser_backend,
+                                        cache_ttl=cache_ttl, history_path=history_path)
+        self.resume = resume  # True이면 체크포인트에 없는 페이지만 수집
 
-    def run(self):
-        # 세션 설정으로 성능 향상 및 안정성 확보
-        session = requests.Session()
-        retries = Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504])
-        session.mount('https://', HTTPAdapter(max_retries=retries))
+    def cancel(self):
+        """수집 중지 요청 (이미 수집한 데이터는 유지)"""
+        self.crawler.cancel()
 
-        # 웹 크롤링 차단 방지를 위한 헤더 설정
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+    def run(self):
+        result = self.crawler.run(
+            on_page=self.page_signal.emit,
+            on_progress=self.progress_signal.emit,
+            on_error=self.error_signal.emit,
+            resume=self.resume,
+        )
 
-        data = []
-        start_time = time.time()
+        # 수집 완료(또는 중지) 후 데이터 전송
+        self.data_signal.emit(result.data)
+        self.missing_signal.emit(result.missing)
+        if result.failed_pages or result.cancelled:
+            self.incomplete_signal.emit(result.failed_pages, result.cancelled)
+        self.finished_signal.emit(len(result.data), result.elapsed)
 
-        for page in range(1, self.pages+1):
-            try:
-                url = f"https://finance.naver.com/sise/field_submit.naver?menu=market_sum&returnUrl=http://finance.naver.com/sise/sise_market_sum.naver?page={page}&fieldIds=market_sum&fieldIds=debt_total&fieldIds=sales_increasing_rate&fieldIds=frgn_rate&fieldIds=per&fieldIds=roe"
-                # 효율적인 URL 구성 및 요청
-                response = session.get(
-                    url,
-                    headers=headers,
-                    timeout=10
-                )
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                trs = soup.select("#contentarea > div.box_type_l >table.type_2 > tbody > tr[onmouseover='mouseOver(this)']")
-                
-                for tr in trs:
-                    name = tr.select_one('td:nth-child(2)').text
-                    market_sum = tr.select_one('td:nth-child(7)').text
-                    debt_total = tr.select_one('td:nth-child(8)').text
-                    sales_increasing_rate = tr.select_one('td:nth-child(9)').text
-                    frgn_rate = tr.select_one('td:nth-child(10)').text
-                    per = tr.select_one('td:nth-child(11)').text
-                    roe = tr.select_one('td:nth-child(12)').text
 
-                    # 데이터 전처리 - 'N/A' 값이 아닌 경우만 처리
-                    if market_sum != 'N/A' and debt_total != 'N/A' and sales_increasing_rate != 'N/A' and frgn_rate != 'N/A' and per != 'N/A' and roe != 'N/A':
-                        market_sum = float(market_sum.replace(',', ''))
-                        debt_total = float(debt_total.replace(',', ''))
-                        sales_increasing_rate = float(sales_increasing_rate.replace(',', ''))
-                        frgn_rate = float(frgn_rate.replace(',', ''))
-                        per = float(per.replace(',', ''))
-                        roe = float(roe.replace(',', ''))
-                        # 데이터 추가
-                        data.append([name, market_sum, debt_total, sales_increasing_rate, frgn_rate, per, roe])
-                
-                # 진행 상황 업데이트
-                progress = int((page / self.pages) * 100)
-                self.progress_signal.emit(progress)
-                
-                # 요청 간격 추가로 서버 부하 방지
-                time.sleep(1.5)
+class ExportThread(QThread):
+    """
+    수집한 데이터를 파일로 저장하는 스레드 클래스
+    대용량 저장 중에도 GUI가 멈추지 않도록 별도 스레드로 실행
+    """
+    progress_signal = Signal(int)         # 저장 진행률
+    finished_signal = Signal(str, float)  # 완료 시그널 (저장 경로, 소요 시간)
+    error_signal = Signal(str)            # 오류 메시지 전달
 
-            except Exception as e:
-                self.error_signal.emit(f"페이지 {page} 처리 중 오류 발생: {str(e)}")
-                continue
+    def __init__(self, df, file_path, fmt):
+        super().__init__()
+        self.df = df
+        self.file_path = file_path
+        self.fmt = fmt
 
-        # 수집 완료 후 데이터 전송
-        self.data_signal.emit(data)
-        self.finished_signal.emit(len(data), time.time() - start_time)
+    def run(self):
+        start_time = time.time()
+        try:
+            save_dataframe(self.df, self.file_path, self.fmt, on_progress=self.progress_signal.emit)
+            self.finished_signal.emit(self.file_path, time.time() - start_time)
+        except Exception as e:
+            self.error_signal.emit(str(e))
 
 
 class StockCrawlerApp(QMainWindow):
@@ -98,6 +91,8 @@ class StockCrawlerApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.df = None  # 데이터프레임 저장 변수
+        self.missing_counts = {}  # 열별 결측값 개수
+        self.incomplete = None    # (남은 페이지, 취소 여부)
         self.initUI()
         
     def initUI(self):
@@ -119,14 +114,33 @@ class StockCrawlerApp(QMainWindow):
         self.page_input.setFixedWidth(100)
         input_layout.addWidget(self.page_input)
         
+        # 응답 캐시 유효 시간 (0이면 매번 새로 수집)
+        input_layout.addWidget(QLabel('캐시 유효시간(분):'))
+        self.cache_input = QSpinBox()
+        self.cache_input.setRange(0, 24 * 60)
+        self.cache_input.setValue(DEFAULT_TTL // 60)
+        input_layout.addWidget(self.cache_input)
+        
         # 수집 버튼
         self.crawl_button = QPushButton('데이터 수집 시작')
         self.crawl_button.clicked.connect(self.start_crawling)
         input_layout.addWidget(self.crawl_button)
         
+        # 이어서 수집 버튼 (체크포인트에 없는 페이지만 수집)
+        self.resume_button = QPushButton('이어서 수집')
+        self.resume_button.clicked.connect(self.resume_crawling)
+        self.resume_button.setEnabled(MarketSumCrawler(1).can_resume())
+        input_layout.addWidget(self.resume_button)
+        
+        # 중지 버튼
+        self.stop_button = QPushButton('중지')
+        self.stop_button.clicked.connect(self.stop_crawling)
+        self.stop_button.setEnabled(False)
+        input_layout.addWidget(self.stop_button)
+        
         # 저장 버튼
-        self.save_button = QPushButton('엑셀로 저장')
-        self.save_button.clicked.connect(self.save_to_excel)
+        self.save_button = QPushButton('파일로 저장')
+        self.save_button.clicked.connect(self.save_to_file)
         self.save_button.setEnabled(False)  # 초기에는 비활성화
         input_layout.addWidget(self.save_button)
         
@@ -144,16 +158,68 @@ class StockCrawlerApp(QMainWindow):
         self.status_label = QLabel('준비됨')
         main_layout.addWidget(self.status_label)
         
-        # 데이터 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels(["종목명", "시가총액(억)", "부채총계(억)", 
-                                             "매출증가율", "외국인비율", "PER(배)", "ROE(%)"])
+        # 종목명 필터
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel('종목명 검색:'))
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText('종목명 일부를 입력하세요')
+        filter_layout.addWidget(self.filter_input)
+        main_layout.addLayout(filter_layout)
+        
+        # 조건식 필터 (입력할 때마다 바로 적용)
+        screen_layout = QHBoxLayout()
+        screen_layout.addWidget(QLabel('조건식:'))
+        self.screen_input = QLineEdit()
+        self.screen_input.setPlaceholderText('예) per < 10 and roe > 15 and debt_ratio < 0.5')
+        screen_layout.addWidget(self.screen_input)
+        self.screen_label = QLabel('')
+        screen_layout.addWidget(self.screen_label)
+        main_layout.addLayout(screen_layout)
+        
+        # 데이터 테이블 (모델/뷰 구조, 정렬과 필터는 프록시 모델에서 처리)
+        self.table_model = StockTableModel(self)
+        self.proxy_model = create_proxy_model(self.table_model, self)
+        self.filter_input.textChanged.connect(self.proxy_model.set_name_filter)
+        self.screen_input.textChanged.connect(self.apply_screen)
+        self.proxy_model.modelReset.connect(self.update_screen_count)
+        self.proxy_model.rowsInserted.connect(self.update_screen_count)
+        
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.setSortingEnabled(True)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # 행 높이를 고정하여 대량 데이터에서도 스크롤 시 높이 계산을 생략
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         main_layout.addWidget(self.table)
         
+    def apply_screen(self, expression):
+        """조건식 필터 적용 (작성 중인 잘못된 조건식은 이전 결과를 유지하고 오류만 표시)"""
+        try:
+            self.proxy_model.set_expression(expression)
+        except ValueError as e:
+            # ScreenError(ValueError의 하위 클래스)와 계산 중 생기는 ValueError 모두 표시만 함
+            self.screen_label.setText(str(e))
+    
+    def update_screen_count(self):
+        """필터 결과 행 수 표시"""
+        self.screen_label.setText(f"{self.proxy_model.rowCount()} / {self.table_model.rowCount()}개")
+    
     def start_crawling(self):
         """크롤링 작업 시작"""
+        self._start_crawling(resume=False)
+    
+    def resume_crawling(self):
+        """중단된 크롤링 작업을 체크포인트부터 이어서 진행"""
+        self._start_crawling(resume=True)
+    
+    def stop_crawling(self):
+        """진행 중인 크롤링 작업 중지 (이미 수집한 데이터는 유지)"""
+        self.stop_button.setEnabled(False)
+        self.status_label.setText('수집 중지 중... (진행 중인 요청이 끝나면 멈춥니다)')
+        self.crawler_thread.cancel()
+    
+    def _start_crawling(self, resume):
         try:
             pages = int(self.page_input.text())
             if pages <= 0:
@@ -162,16 +228,24 @@ class StockCrawlerApp(QMainWindow):
                 
             # UI 상태 업데이트
             self.crawl_button.setEnabled(False)
+            self.resume_button.setEnabled(False)
+            self.stop_button.setEnabled(True)
             self.save_button.setEnabled(False)
             self.progress_bar.setValue(0)
             self.status_label.setText('데이터 수집 중...')
-            self.table.setRowCount(0)
+            self.table_model.clear()
+            self.df = None
+            self.missing_counts = {}
+            self.incomplete = None
             
             # 크롤링 스레드 시작
-            self.crawler_thread = CrawlerThread(pages)
+            self.crawler_thread = CrawlerThread(pages, cache_ttl=self.cache_input.value() * 60, resume=resume)
             self.crawler_thread.progress_signal.connect(self.update_progress)
-            self.crawler_thread.data_signal.connect(self.display_data)
+            self.crawler_thread.page_signal.connect(self.display_data)
+            self.crawler_thread.data_signal.connect(self.store_data)
             self.crawler_thread.error_signal.connect(self.show_error)
+            self.crawler_thread.missing_signal.connect(self.store_missing)
+            self.crawler_thread.incomplete_signal.connect(self.store_incomplete)
             self.crawler_thread.finished_signal.connect(self.crawling_finished)
             self.crawler_thread.start()
             
@@ -182,25 +256,21 @@ class StockCrawlerApp(QMainWindow):
         """진행 상황 업데이트"""
         self.progress_bar.setValue(value)
     
-    def display_data(self, data):
-        """수집된 데이터 테이블에 표시"""
-        # 데이터프레임 생성
-        self.df = pd.DataFrame(data, columns=["종목명", "시가총액(억)", "부채총계(억)", 
-                                             "매출증가율", "외국인비율", "PER(배)", "ROE(%)"])
-        
-        # 테이블에 데이터 표시
-        self.table.setRowCount(len(data))
-        for row_idx, row_data in enumerate(data):
-            for col_idx, cell_data in enumerate(row_data):
-                item = QTableWidgetItem()
-                # 숫자 데이터는 오른쪽 정렬, 문자열은 왼쪽 정렬
-                if col_idx == 0:  # 종목명
-                    item.setText(str(cell_data))
-                    item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                else:  # 숫자 데이터
-                    item.setText(f"{cell_data:,.2f}")
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.table.setItem(row_idx, col_idx, item)
+    def display_data(self, rows):
+        """페이지 단위로 도착한 데이터를 테이블에 바로 추가"""
+        self.table_model.append_rows(rows)
+    
+    def store_data(self, data):
+        """수집이 끝난 전체 데이터를 페이지 순서대로 데이터프레임에 저장"""
+        self.df = pd.DataFrame(data, columns=COLUMNS)
+    
+    def store_missing(self, missing_counts):
+        """열별 결측값 개수 저장 (완료 메시지에 표시)"""
+        self.missing_counts = missing_counts
+    
+    def store_incomplete(self, remaining_pages, cancelled):
+        """중지되었거나 실패한 페이지가 남은 경우 정보 저장 (완료 메시지에 표시)"""
+        self.incomplete = (remaining_pages, cancelled)
     
     def show_error(self, error_msg):
         """오류 메시지 표시"""
@@ -209,11 +279,23 @@ class StockCrawlerApp(QMainWindow):
     def crawling_finished(self, data_count, elapsed_time):
         """크롤링 작업 완료 처리"""
         self.crawl_button.setEnabled(True)
-        self.save_button.setEnabled(True)
-        self.status_label.setText(f"총 {data_count}개 데이터 수집 완료 | 소요 시간: {elapsed_time:.2f}초")
+        self.stop_button.setEnabled(False)
+        self.save_button.setEnabled(data_count > 0)
+        message = f"총 {data_count}개 데이터 수집 완료 | 소요 시간: {elapsed_time:.2f}초"
+        # 남은 페이지가 있으면 이어서 수집할 수 있도록 안내
+        if self.incomplete:
+            remaining_pages, cancelled = self.incomplete
+            message = f"{'수집 중지됨' if cancelled else '일부 페이지 수집 실패'} | " + message
+            message += f" | 남은 페이지 {len(remaining_pages)}개 ('이어서 수집'으로 계속)"
+        self.resume_button.setEnabled(bool(self.incomplete))
+        # 값이 비어 있는 열만 결측값 개수 표시
+        missing = [f"{label} {count}" for label, count in zip(COLUMNS[2:], self.missing_counts.values()) if count]
+        if missing:
+            message += f" | 결측값: {', '.join(missing)}"
+        self.status_label.setText(message)
     
-    def save_to_excel(self):
-        """데이터를 엑셀 파일로 저장"""
+    def save_to_file(self):
+        """데이터를 엑셀/CSV/Parquet 파일로 저장 (작업 스레드에서 실행)"""
         if self.df is None or self.df.empty:
             QMessageBox.warning(self, '저장 오류', '저장할 데이터가 없습니다.')
             return
@@ -221,23 +303,38 @@ class StockCrawlerApp(QMainWindow):
         # 파일 저장 다이얼로그
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         default_filename = f'stock_data_{timestamp}.xlsx'
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, '엑셀 파일 저장', default_filename, 'Excel Files (*.xlsx)')
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, '파일 저장', default_filename, ';;'.join(SAVE_FILTERS))
             
         if file_path:
-            try:
-                # 엑셀 파일 저장
-                with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-                    self.df.to_excel(writer, index=False)
-                    # 엑셀 서식 자동 적용
-                    workbook = writer.book
-                    worksheet = writer.sheets['Sheet1']
-                    number_format = workbook.add_format({'num_format': '#,##0.00'})
-                    worksheet.set_column('B:G', 15, number_format)
-                
-                QMessageBox.information(self, '저장 완료', f'데이터가 성공적으로 저장되었습니다.\n{file_path}')
-            except Exception as e:
-                QMessageBox.critical(self, '저장 오류', f'파일 저장 중 오류가 발생했습니다: {str(e)}')
+            fmt = infer_format(file_path, default=SAVE_FILTERS[selected_filter])
+            
+            # UI 상태 업데이트
+            self.crawl_button.setEnabled(False)
+            self.save_button.setEnabled(False)
+            self.progress_bar.setValue(0)
+            self.status_label.setText('파일 저장 중...')
+            
+            # 저장 스레드 시작
+            self.export_thread = ExportThread(self.df, file_path, fmt)
+            self.export_thread.progress_signal.connect(self.update_progress)
+            self.export_thread.finished_signal.connect(self.export_finished)
+            self.export_thread.error_signal.connect(self.export_failed)
+            self.export_thread.start()
+    
+    def export_finished(self, file_path, elapsed_time):
+        """파일 저장 완료 처리"""
+        self.crawl_button.setEnabled(True)
+        self.save_button.setEnabled(True)
+        self.status_label.setText(f"저장 완료: {file_path} | 소요 시간: {elapsed_time:.2f}초")
+        QMessageBox.information(self, '저장 완료', f'데이터가 성공적으로 저장되었습니다.\n{file_path}')
+    
+    def export_failed(self, error_msg):
+        """파일 저장 실패 처리"""
+        self.crawl_button.setEnabled(True)
+        self.save_button.setEnabled(True)
+        self.status_label.setText('저장 실패')
+        QMessageBox.critical(self, '저장 오류', f'파일 저장 중 오류가 발생했습니다: {error_msg}')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,102 @@
+"""
+시가총액 표 파싱 모듈
+BeautifulSoup(CSS 선택자) 방식과 lxml 단일 순회 방식 중 하나를 골라 표의 각 행을 StockRow로 반환합니다.
+"""
+
+from typing import Callable, Dict, List, NamedTuple
+
+
+class StockRow(NamedTuple):
+    """시가총액 표의 한 행 (전처리 전 문자열 값)"""
+    code: str
+    name: str
+    market_sum: str
+    debt_total: str
+    sales_increasing_rate: str
+    frgn_rate: str
+    per: str
+    roe: str
+
+
+# 종목 행 선택자 (BeautifulSoup 방식)
+ROW_SELECTOR = "#contentarea > div.box_type_l >table.type_2 > tbody > tr[onmouseover='mouseOver(this)']"
+
+# 종목명 이후 StockRow 필드 순서대로 대응하는 td 위치 (0부터 시작)
+COLUMN_INDEXES = (1, 6, 7, 8, 9, 10, 11)
+
+
+def code_from_href(href):
+    """종목 링크(/item/main.naver?code=005930)에서 종목코드 추출"""
+    if not href or 'code=' not in href:
+        return ''
+    return href.rsplit('code=', 1)[1].split('&', 1)[0]
+
+
+def parse_with_bs4(content) -> List[StockRow]:
+    """BeautifulSoup + CSS 선택자로 행마다 열을 하나씩 조회하는 기존 방식"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'html.parser')
+    rows = []
+    for tr in soup.select(ROW_SELECTOR):
+        link = tr.select_one('td:nth-child(2) a')
+        rows.append(StockRow(
+            code_from_href(link.get('href') if link else None),
+            tr.select_one('td:nth-child(2)').text,
+            tr.select_one('td:nth-child(7)').text,
+            tr.select_one('td:nth-child(8)').text,
+            tr.select_one('td:nth-child(9)').text,
+            tr.select_one('td:nth-child(10)').text,
+            tr.select_one('td:nth-child(11)').text,
+            tr.select_one('td:nth-child(12)').text,
+        ))
+    return rows
+
+
+def parse_with_lxml(content) -> List[StockRow]:
+    """lxml로 각 <tr>의 자식 <td>를 한 번만 순회하는 방식"""
+    from lxml import html
+
+    root = html.fromstring(content)
+    rows = []
+    for table in root.find_class('type_2'):
+        for tr in table.iterfind('tbody/tr'):
+            if tr.get('onmouseover') != 'mouseOver(this)':
+                continue
+            tds = list(tr.iterchildren('td'))
+            link = tds[1].find('a')
+            code = code_from_href(link.get('href') if link is not None else None)
+            rows.append(StockRow(code, *(tds[index].text_content() for index in COLUMN_INDEXES)))
+    return rows
+
+
+PARSER_BACKENDS: Dict[str, Callable] = {
+    'bs4': parse_with_bs4,
+    'lxml': parse_with_lxml,
+}
+
+
+def default_backend() -> str:
+    """lxml이 설치되어 있으면 lxml, 아니면 bs4"""
+    try:
+        import lxml.html  # noqa: F401
+        return 'lxml'
+    except ImportError:
+        return 'bs4'
+
+
+def parse_market_sum(content, backend=None) -> List[StockRow]:
+    """
+    시가총액 페이지 HTML에서 종목 행 목록 추출
+
+    Args:
+        content: 응답 본문 (bytes 또는 str)
+        backend: 'bs4' 또는 'lxml' (None이면 default_backend())
+
+    Returns:
+        List[StockRow]: 표 순서대로 정렬된 종목 행
+    """
+    backend = backend or default_backend()
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 파서입니다: {backend}")
+    return PARSER_BACKENDS[backend](content)
@@ -0,0 +1,336 @@
+"""
+종목 스크리닝 모듈
+수집한 시가총액 데이터를 NumPy 열 배열로 보관하고 조건식 필터와 다중 지표 순위를 벡터 연산으로 계산합니다.
+열마다 정렬 인덱스를 미리 만들어 두므로 단순 비교 조건과 정렬은 이진 탐색/인덱싱만으로 처리합니다.
+
+조건식 예시:
+    per < 10 and roe > 15 and debt_ratio < 0.5
+    PER < 10 and (ROE > 15 or pct(외국인비율) >= 0.9)
+"""
+
+import ast
+import operator
+from functools import lru_cache
+
+import numpy as np
+
+from constants import FIELD_IDS
+
+# 부채총계 / 시가총액 (수집 항목에서 계산하는 파생 지표)
+DERIVED_FIELDS = ['debt_ratio']
+FIELDS = FIELD_IDS + DERIVED_FIELDS
+
+# 조건식에서 쓸 수 있는 다른 이름 (대소문자 구분 없음)
+ALIASES = {
+    '시가총액': 'market_sum',
+    '부채총계': 'debt_total',
+    '매출증가율': 'sales_increasing_rate',
+    '외국인비율': 'frgn_rate',
+    '부채비율': 'debt_ratio',
+}
+
+_COMPARE_OPS = {
+    ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>=', ast.Eq: '==', ast.NotEq: '!=',
+}
+# 왼쪽/오른쪽을 바꿨을 때의 비교 연산자 (10 > per → per < 10)
+_FLIPPED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '==': '==', '!=': '!='}
+_NUMPY_COMPARE = {
+    '<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal,
+    '==': np.equal, '!=': np.not_equal,
+}
+_BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+}
+
+
+class ScreenError(ValueError):
+    """잘못된 조건식"""
+
+
+def resolve_field(name):
+    """조건식의 이름을 필드명으로 변환 (알 수 없는 이름이면 ScreenError)"""
+    field = ALIASES.get(name, name.lower())
+    if field not in FIELDS:
+        raise ScreenError(f"알 수 없는 항목입니다: {name} (사용 가능: {', '.join(FIELDS)})")
+    return field
+
+
+class StockScreener:
+    """
+    열 단위 NumPy 배열 기반 스크리너
+    - 정렬 인덱스/백분위는 열별로 처음 필요할 때 한 번 계산하여 재사용
+    - 결측값(NaN)은 모든 비교에서 거짓이며, 정렬 시 항상 마지막에 위치
+    """
+
+    def __init__(self, codes, names, values):
+        """
+        Args:
+            codes: 종목코드 목록
+            names: 종목명 목록
+            values: {필드명: 숫자 배열} (FIELD_IDS 전체)
+        """
+        self.codes = np.asarray(codes, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.values = {field: np.asarray(values[field], dtype=np.float64) for field in FIELD_IDS}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            debt_ratio = self.values['debt_total'] / self.values['market_sum']
+        # 시가총액이 0이면 부채비율을 계산할 수 없으므로 결측값으로 처리
+        debt_ratio[~np.isfinite(debt_ratio)] = np.nan
+        self.values['debt_ratio'] = debt_ratio
+        self._orders = {}
+        self._sorted = {}
+        self._valid_counts = {}
+        self._percentiles = {}
+        self._lower_names = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """[종목코드, 종목명, 숫자 6개] 형태의 행 목록으로 생성"""
+        numbers = np.array([row[2:] for row in rows], dtype=np.float64).reshape(-1, len(FIELD_IDS))
+        return cls(
+            [row[0] for row in rows],
+            [row[1] for row in rows],
+            {field: numbers[:, i] for i, field in enumerate(FIELD_IDS)},
+        )
+
+    @classmethod
+    def from_frame(cls, df):
+        """HistoryStore 조회 결과처럼 code/name/필드명 열을 가진 데이터프레임으로 생성 (여러 날짜 포함 가능)"""
+        return cls(df['code'].to_numpy(), df['name'].to_numpy(), {field: df[field].to_numpy() for field in FIELD_IDS})
+
+    def __len__(self):
+        return len(self.codes)
+
+    def column(self, name):
+        return self.values[resolve_field(name)]
+
+    def _build_index(self, field):
+        if field in self._orders:
+            return
+        values = self.values[field]
+        # NaN은 argsort에서 항상 끝으로 가므로 앞의 valid_count개만 이진 탐색 대상
+        order = np.argsort(values, kind='stable')
+        self._orders[field] = order
+        self._sorted[field] = values[order]
+        self._valid_counts[field] = int(np.count_nonzero(~np.isnan(values)))
+
+    def order(self, name, descending=False):
+        """
+        정렬된 행 번호 (결측값은 오름차순/내림차순 모두 마지막)
+
+        종목코드/종목명('code', 'name')도 지정할 수 있다.
+        """
+        if name in ('code', 'name'):
+            if name not in self._orders:
+                self._orders[name] = np.argsort(self.codes if name == 'code' else self.names, kind='stable')
+            order = self._orders[name]
+            return order[::-1] if descending else order
+
+        field = resolve_field(name)
+        self._build_index(field)
+        order = self._orders[field]
+        if not descending:
+            return order
+        valid = self._valid_counts[field]
+        return np.concatenate([order[:valid][::-1], order[valid:]])
+
+    def compare(self, name, op, value):
+        """
+        '항목 op 상수' 조건의 불리언 마스크
+
+        미리 정렬한 값에서 경계를 이진 탐색하고 해당 구간의 행만 표시하므로 전체 비교보다 빠르다.
+        """
+        field = resolve_field(name)
+        self._build_index(field)
+        order, sorted_values = self._orders[field], self._sorted[field]
+        valid = self._valid_counts[field]
+        left = int(np.searchsorted(sorted_values[:valid], value, side='left'))
+        right = int(np.searchsorted(sorted_values[:valid], value, side='right'))
+        spans = {
+            '<': [(0, left)],
+            '<=': [(0, right)],
+            '>': [(right, valid)],
+            '>=': [(left, valid)],
+            '==': [(left, right)],
+            '!=': [(0, left), (right, valid)],
+        }[op]
+        mask = np.zeros(len(self), dtype=bool)
+        for start, stop in spans:
+            mask[order[start:stop]] = True
+        return mask
+
+    def percentile(self, name):
+        """
+        열 안에서의 백분위 (가장 작은 값 0.0 ~ 가장 큰 값 1.0, 결측값은 NaN)
+
+        같은 값은 같은 백분위를 받는다.
+        """
+        field = resolve_field(name)
+        if field not in self._percentiles:
+            self._build_index(field)
+            order, sorted_values = self._orders[field], self._sorted[field]
+            valid = self._valid_counts[field]
+            result = np.full(len(self), np.nan)
+            if valid == 1:
+                result[order[0]] = 1.0
+            elif valid > 1:
+                # 같은 값의 첫 위치를 순위로 사용
+                ranks = np.searchsorted(sorted_values[:valid], sorted_values[:valid], side='left')
+                result[order[:valid]] = ranks / (valid - 1)
+            self._percentiles[field] = result
+        return self._percentiles[field]
+
+    def score(self, weights):
+        """
+        다중 지표 점수 (백분위의 가중 평균, 0.0 ~ 1.0)
+
+        Args:
+            weights: {항목: 가중치}, 음수 가중치는 값이 작을수록 좋은 지표 (예: {'roe': 1, 'per': -1})
+
+        결측값이 있는 지표는 해당 종목의 평균 계산에서 제외하고, 모든 지표가 결측이면 NaN
+        """
+        total = np.zeros(len(self))
+        weight_sum = np.zeros(len(self))
+        for name, weight in weights.items():
+            pct = self.percentile(name)
+            if weight < 0:
+                pct = 1.0 - pct
+            valid = ~np.isnan(pct)
+            total[valid] += abs(weight) * pct[valid]
+            weight_sum[valid] += abs(weight)
+        with np.errstate(invalid='ignore'):
+            return np.where(weight_sum > 0, total / weight_sum, np.nan)
+
+    def rank(self, weights, mask=None, top=None):
+        """점수 내림차순 행 번호 (mask로 대상 제한, top개만 반환)"""
+        scores = self.score(weights)
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(len(self))
+        rows = rows[~np.isnan(scores[rows])]
+        rows = rows[np.argsort(-scores[rows], kind='stable')]
+        return rows[:top] if top is not None else rows
+
+    def name_mask(self, text):
+        """종목명에 text가 포함된 행 (대소문자 구분 없음)"""
+        if self._lower_names is None:
+            self._lower_names = [name.lower() for name in self.names]
+        text = text.lower()
+        return np.fromiter((text in name for name in self._lower_names), dtype=bool, count=len(self))
+
+    def mask(self, expression):
+        """조건식을 만족하는 행의 불리언 마스크 (빈 조건식이면 전체)"""
+        if not expression.strip():
+            return np.ones(len(self), dtype=bool)
+        result = compile_expression(expression)(self)
+        if not isinstance(result, np.ndarray) or result.dtype != bool:
+            raise ScreenError("조건식은 비교 결과여야 합니다 (예: per < 10)")
+        return result
+
+    def screen(self, expression):
+        """조건식을 만족하는 행 번호"""
+        return np.flatnonzero(self.mask(expression))
+
+
+@lru_cache(maxsize=128)
+def compile_expression(expression):
+    """
+    조건식을 검사하고 StockScreener를 받아 결과 배열을 돌려주는 함수로 변환
+
+    eval을 사용하지 않고 허용된 구문(비교, and/or/not, 사칙연산, 숫자, 항목 이름, pct())만 직접 해석한다.
+    """
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError as e:
+        raise ScreenError(f"조건식 구문 오류: {e.msg}") from None
+    return _compile(tree.body)
+
+
+def _is_condition(node):
+    """비교식이나 and/or/not으로 묶은 비교식인지 여부"""
+    return (isinstance(node, (ast.Compare, ast.BoolOp))
+            or (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not)))
+
+
+def _compile_condition(node):
+    """and/or/not의 피연산자 (비교식이 아니면 ScreenError, 예: 입력 중인 'per < 10 and 5')"""
+    if not _is_condition(node):
+        raise ScreenError(f"and/or/not에는 비교식만 쓸 수 있습니다: {ast.unparse(node)}")
+    return _compile(node)
+
+
+def _compile(node):
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile_condition(value) for value in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return lambda screener: combine.reduce([part(screener) for part in parts])
+
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.Not):
+            operand = _compile_condition(node.operand)
+            return lambda screener: np.logical_not(operand(screener))
+        if isinstance(node.op, ast.USub):
+            operand = _compile(node.operand)
+            return lambda screener: -operand(screener)
+
+    if isinstance(node, ast.Compare):
+        return _compile_compare(node)
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        func = _BINARY_OPS[type(node.op)]
+        left, right = _compile(node.left), _compile(node.right)
+
+        def binary(screener):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return func(left(screener), right(screener))
+        return binary
+
+    if isinstance(node, ast.Name):
+        field = resolve_field(node.id)
+        return lambda screener: screener.values[field]
+
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = float(node.value)
+        return lambda screener: value
+
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'pct'
+            and len(node.args) == 1 and not node.keywords and isinstance(node.args[0], ast.Name)):
+        field = resolve_field(node.args[0].id)
+        return lambda screener: screener.percentile(field)
+
+    raise ScreenError(f"조건식에서 사용할 수 없는 구문입니다: {ast.unparse(node)}")
+
+
+def _compile_compare(node):
+    """비교식 (a < b < c는 a < b and b < c로 처리)"""
+    operands = [node.left] + node.comparators
+    parts = []
+    for left, op_node, right in zip(operands, node.ops, node.comparators):
+        if type(op_node) not in _COMPARE_OPS:
+            raise ScreenError(f"조건식에서 사용할 수 없는 비교입니다: {ast.unparse(node)}")
+        op = _COMPARE_OPS[type(op_node)]
+        parts.append(_compile_single_compare(left, op, right))
+    if len(parts) == 1:
+        return parts[0]
+    return lambda screener: np.logical_and.reduce([part(screener) for part in parts])
+
+
+def _is_number(node):
+    return isinstance(node, ast.Constant) and type(node.value) in (int, float)
+
+
+def _compile_single_compare(left, op, right):
+    # '항목 op 숫자' 형태는 정렬 인덱스 사용
+    if isinstance(left, ast.Name) and _is_number(right):
+        field, value = resolve_field(left.id), float(right.value)
+        return lambda screener: screener.compare(field, op, value)
+    if _is_number(left) and isinstance(right, ast.Name):
+        field, value, flipped = resolve_field(right.id), float(left.value), _FLIPPED[op]
+        return lambda screener: screener.compare(field, flipped, value)
+
+    func = _NUMPY_COMPARE[op]
+    left_func, right_func = _compile(left), _compile(right)
+
+    def compare(screener):
+        with np.errstate(invalid='ignore'):
+            result = func(left_func(screener), right_func(screener))
+        return np.broadcast_to(result, (len(screener),)).copy()
+    return compare
@@ -0,0 +1,244 @@
+"""
+주식 데이터 테이블 모델 모듈
+열 단위 배열에 데이터를 보관하고, 화면에 보이는 셀만 그때그때 서식을 적용하는 Qt 모델입니다.
+정렬과 필터는 StockScreener의 정렬 인덱스/불리언 마스크로 계산하여 행마다 파이썬 함수를 호출하지 않습니다.
+"""
+
+import math
+from array import array
+
+import numpy as np
+from PySide6.QtCore import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt
+
+from constants import COLUMNS, FIELD_IDS
+from screener import StockScreener
+
+
+class StockTableModel(QAbstractTableModel):
+    """
+    종목코드/종목명은 리스트, 숫자 열은 array('d')로 보관하는 테이블 모델
+    페이지 단위로 append_rows()를 호출하면 추가된 행만 뷰에 알린다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._codes = []
+        self._names = []
+        self._values = [array('d') for _ in COLUMNS[2:]]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self._codes[row]
+            if col == 1:
+                return self._names[row]
+            value = self._values[col - 2][row]
+            # 값이 없는 셀(NaN)은 비워서 표시
+            return '' if math.isnan(value) else f"{value:,.2f}"
+        if role == Qt.TextAlignmentRole:
+            # 숫자 데이터는 오른쪽 정렬, 문자열은 왼쪽 정렬
+            if col < 2:
+                return int(Qt.AlignLeft | Qt.AlignVCenter)
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_rows(self, rows):
+        """[종목코드, 종목명, 시가총액, ...] 형태의 행들을 끝에 추가"""
+        if not rows:
+            return
+        first = len(self._names)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for row in rows:
+            self._codes.append(row[0])
+            self._names.append(row[1])
+            for column, value in zip(self._values, row[2:]):
+                column.append(value)
+        self.endInsertRows()
+
+    def screener(self):
+        """현재 데이터로 StockScreener 생성"""
+        return StockScreener(
+            self._codes, self._names,
+            {field: np.array(column, dtype=np.float64) for field, column in zip(FIELD_IDS, self._values)},
+        )
+
+    def clear(self):
+        """모든 행 삭제"""
+        self.beginResetModel()
+        self._codes = []
+        self._names = []
+        self._values = [array('d') for _ in COLUMNS[2:]]
+        self.endResetModel()
+
+
+class ScreenProxyModel(QAbstractProxyModel):
+    """
+    조건식/종목명 필터와 정렬을 적용한 행 번호 배열로 원본 모델을 보여주는 프록시 모델
+
+    필터나 정렬이 바뀌면 StockScreener로 행 번호 배열만 다시 계산한다.
+    원본에 행이 추가되면 스크리너를 다시 만들고, 결과가 기존 행 뒤에 붙는 경우에는 추가된 행만 뷰에 알린다.
+    """
+
+    # 정렬 열 번호 → StockScreener 항목 이름
+    SORT_KEYS = ['code', 'name'] + FIELD_IDS
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._screener = StockScreener.from_rows([])
+        self._rows = np.arange(0)
+        self._source_to_proxy = None
+        self._expression = ''
+        self._expression_mask = None
+        self._name_text = ''
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+
+    def setSourceModel(self, source):
+        self.beginResetModel()
+        super().setSourceModel(source)
+        source.rowsInserted.connect(self._source_rows_inserted)
+        source.modelReset.connect(self._source_reset)
+        self._rebuild_screener()
+        self._rows = self._compute_rows()
+        self._source_to_proxy = None
+        self.endResetModel()
+
+    # --- QAbstractProxyModel 구현 ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._rows) and 0 <= column < len(COLUMNS)):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(int(self._rows[proxy_index.row()]), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._source_to_proxy is None:
+            # 역방향 매핑은 선택 영역 등에서 필요할 때만 만든다
+            self._source_to_proxy = np.full(len(self._screener), -1, dtype=np.int64)
+            self._source_to_proxy[self._rows] = np.arange(len(self._rows))
+        row = int(self._source_to_proxy[source_index.row()])
+        return self.index(row, source_index.column()) if row >= 0 else QModelIndex()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        if role == Qt.DisplayRole:
+            return section + 1
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self._reset_rows()
+
+    # --- 필터 ---
+
+    def set_expression(self, expression):
+        """
+        조건식 필터 설정 (예: 'per < 10 and roe > 15')
+
+        잘못된 조건식이면 ScreenError가 발생하고 기존 필터는 유지된다.
+        """
+        mask = self._screener.mask(expression) if expression.strip() else None
+        self._expression = expression
+        self._expression_mask = mask
+        self._reset_rows()
+
+    def set_name_filter(self, text):
+        """종목명 포함 필터 설정 (대소문자 구분 없음)"""
+        self._name_text = text
+        self._reset_rows()
+
+    def screener(self):
+        return self._screener
+
+    # --- 내부 처리 ---
+
+    def _rebuild_screener(self):
+        self._screener = self.sourceModel().screener()
+        self._expression_mask = None
+        if self._expression.strip():
+            try:
+                self._expression_mask = self._screener.mask(self._expression)
+            except ValueError:
+                self._expression = ''
+
+    def _compute_rows(self):
+        """필터와 정렬을 적용한 원본 행 번호 배열"""
+        count = len(self._screener)
+        mask = self._expression_mask
+        if self._name_text:
+            name_mask = self._screener.name_mask(self._name_text)
+            mask = name_mask if mask is None else mask & name_mask
+
+        if 0 <= self._sort_column < len(self.SORT_KEYS):
+            order = self._screener.order(self.SORT_KEYS[self._sort_column],
+                                         descending=self._sort_order == Qt.DescendingOrder)
+            return order if mask is None else order[mask[order]]
+        return np.arange(count) if mask is None else np.flatnonzero(mask)
+
+    def _reset_rows(self):
+        self.beginResetModel()
+        self._rows = self._compute_rows()
+        self._source_to_proxy = None
+        self.endResetModel()
+
+    def _source_rows_inserted(self, parent, first, last):
+        previous = self._rows
+        self._rebuild_screener()
+        rows = self._compute_rows()
+        self._source_to_proxy = None
+        if len(rows) >= len(previous) and np.array_equal(rows[:len(previous)], previous):
+            # 새 행이 모두 끝에 붙는 경우 (정렬하지 않은 상태에서 페이지 추가)
+            if len(rows) > len(previous):
+                self.beginInsertRows(QModelIndex(), len(previous), len(rows) - 1)
+                self._rows = rows
+                self.endInsertRows()
+        else:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+
+    def _source_reset(self):
+        self.beginResetModel()
+        self._rebuild_screener()
+        self._rows = self._compute_rows()
+        self._source_to_proxy = None
+        self.endResetModel()
+
+
+def create_proxy_model(source, parent=None):
+    """조건식/종목명 필터와 숫자 기준 정렬을 지원하는 프록시 모델 생성"""
+    proxy = ScreenProxyModel(parent)
+    proxy.setSourceModel(source)
+    return proxy